@@ -0,0 +1,123 @@
+# app/api/exports.py
+# Imports
+import csv
+import io
+from datetime import date, datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+"""
+    File encoders for GET /exports/notices. An encoder turns
+    one chunk of rows at a time into bytes for the response
+    body, so an export only ever holds one chunk and its
+    encoded bytes, whatever the size of the dataset.
+
+        encoder.start()       -> bytes before the first chunk
+        encoder.encode(rows)  -> bytes for one chunk
+        encoder.finish()      -> bytes after the last chunk
+
+    Parquet needs pyarrow (pip install pyarrow) and writes
+    one row group per chunk, so EXPORT_CHUNK_SIZE sets the
+    row group size as well.
+"""
+
+# Write Target That Hands Back Whatever Was Written Since Last Asked
+class _Buffer(io.RawIOBase):
+    def __init__(self):
+        self._parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def take(self):
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+"""CSV"""
+
+# Header Row, Then One Line per Row (Dates in ISO Format, NULL as Empty)
+class CsvEncoder:
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def __init__(self, columns):
+        self.columns = [name for name, _ in columns]
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text, lineterminator="\n")
+
+    def _take(self):
+        data = self._text.getvalue().encode("utf-8")
+        self._text.seek(0)
+        self._text.truncate()
+        return data
+
+    def start(self):
+        self._writer.writerow(self.columns)
+        return self._take()
+
+    def encode(self, rows):
+        self._writer.writerows(
+            [value.isoformat() if isinstance(value, (datetime, date)) else value for value in row]
+            for row in rows
+        )
+        return self._take()
+
+    def finish(self):
+        return b""
+
+"""PARQUET"""
+
+# Column Types by the Names db_raw.EXPORT_DATASETS Uses
+def _arrow_type(kind: str):
+    return {
+        "int": pa.int64(),
+        "str": pa.string(),
+        "datetime": pa.timestamp("s"),
+        "date": pa.date32()
+    }[kind]
+
+# One Row Group per Chunk, Footer at the End
+class ParquetEncoder:
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self, columns):
+        self.schema = pa.schema([(name, _arrow_type(kind)) for name, kind in columns])
+        self._buffer = _Buffer()
+        self._writer = pq.ParquetWriter(self._buffer, self.schema, compression="snappy")
+
+    def start(self):
+        return self._buffer.take()
+
+    def encode(self, rows):
+        # Rows to Columns, Then One Arrow Array per Column
+        values = list(zip(*rows)) or [()] * len(self.schema)
+        table = pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(values, self.schema)],
+            schema=self.schema
+        )
+
+        self._writer.write_table(table)
+        return self._buffer.take()
+
+    def finish(self):
+        self._writer.close()
+        return self._buffer.take()
+
+ENCODERS = {
+    "csv": CsvEncoder,
+    "parquet": ParquetEncoder
+}
+
+# Whether a Format Can Be Written Here
+def available(format: str):
+    return format != "parquet" or pa is not None
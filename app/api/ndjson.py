@@ -0,0 +1,71 @@
+# app/api/ndjson.py
+# Imports
+import json
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+
+"""
+    Reads bulk request bodies record by record. NDJSON bodies
+    (Content-Type: application/x-ndjson) are parsed line by
+    line as they arrive, so an upload is never held in memory
+    in full. Anything else is treated as a JSON array.
+"""
+
+# Short, Readable Validation Message
+def _describe(error: ValidationError):
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'record'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+# Validate One Record Against the Model
+def _validate(model, data):
+    try:
+        return model.model_validate(data), None
+    except ValidationError as error:
+        return None, _describe(error)
+
+# Parse and Validate One NDJSON Line
+def _parse_line(model, line: bytes):
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return None, "Invalid JSON"
+
+    return _validate(model, data)
+
+# Yield (index, record, error) For Every Record in the Body
+async def read_records(request: Request, model):
+    content_type = request.headers.get("content-type", "")
+
+    # Streamed NDJSON
+    if content_type.startswith("application/x-ndjson"):
+        index = 0
+        buffer = b""
+
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+
+            for line in lines:
+                if line.strip():
+                    yield (index, *_parse_line(model, line))
+                    index += 1
+
+        # Last Line Without a Trailing Newline
+        if buffer.strip():
+            yield (index, *_parse_line(model, buffer))
+
+        return
+
+    # Plain JSON Array
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+
+    if not isinstance(body, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+
+    for index, data in enumerate(body):
+        yield (index, *_validate(model, data))
@@ -4,29 +4,56 @@ from app.schemas.auth import LoginRequest, TokenResponse
 from app.core.security import (
     create_access_token,
     verify_token,
-    blacklist_token
+    blacklist_token,
+    check_password
 )
-from app.database.db_raw import *
+from app.database.db_async import *
+from app.core.tracing import TracedRoute
 
-auth_router = APIRouter(prefix="/token", tags=["Authentication"])
+auth_router = APIRouter(prefix="/token", tags=["Authentication"], route_class=TracedRoute)
 security = HTTPBearer()
 
 # POST
 @auth_router.post("", response_model=TokenResponse)
-def login(data: LoginRequest):
+async def login(data: LoginRequest):
+    # Officer Account From officer_info
+    officer = await fetch_officer_credentials(data.username)
+    stored_hash = officer[1] if officer is not None else None
 
-    valid_users = {
-        "officer_user"
-    }
+    # bcrypt Runs Off the Event Loop
+    valid, new_hash = await check_password(data.password, stored_hash)
 
-    valid_passwords = {
-        "officer_password"
-    }
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    # Cost Factor Changed Since This Hash Was Made – Store a Fresh One
+    if new_hash is not None:
+        await update_officer_password(officer[0], new_hash)
+
+    token = create_access_token({"sub": data.username, "role": "officer"})
+    return {"access_token": token, "token_type": "bearer"}
 
-    if data.username not in valid_users or data.password not in valid_passwords:
+# Driver Self-Service Login
+@auth_router.post("/driver", response_model=TokenResponse)
+async def driver_login(data: LoginRequest):
+    # Driver Account From driver_login
+    driver = await fetch_driver_credentials(data.username)
+    stored_hash = driver[1] if driver is not None else None
+
+    # bcrypt Runs Off the Event Loop
+    valid, new_hash = await check_password(data.password, stored_hash)
+
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    token = create_access_token({"sub": data.username})
+    if new_hash is not None:
+        await update_driver_password(driver[0], new_hash)
+
+    token = create_access_token({
+        "sub": data.username,
+        "role": "driver",
+        "driver_id": driver[0]
+    })
     return {"access_token": token, "token_type": "bearer"}
 
 # PUT
@@ -38,7 +65,13 @@ def refresh_token(
     old_token = credentials.credentials
     payload = verify_token(old_token)
 
-    new_token = create_access_token({"sub": payload["sub"]})
+    # Same Identity and Role, Fresh Expiry and jti
+    claims = {
+        key: value for key, value in payload.items()
+        if key not in ("exp", "jti")
+    }
+
+    new_token = create_access_token(claims)
 
     return {"access_token": new_token, "token_type": "bearer"}
 
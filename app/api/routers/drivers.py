@@ -1,66 +1,142 @@
 # app/api/routers/drivers.py
 # Imports
-from fastapi import HTTPException, APIRouter, status, Depends
+import json
+from typing import Literal, Optional
+from fastapi import HTTPException, APIRouter, status, Depends, Query, Request, Header, Response
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.database.db_raw import *
+from app.database.db_async import *
 from app.schemas.drivers import *
-from app.core.security import verify_token
+from app.core.security import verify_officer_token
+from app.core import config
+from app.api.ndjson import read_records
+from app.core.tracing import TracedRoute
+from app.core.responses import respond, make_etag, not_modified, not_modified_response
 
 # Defines the Router
 drivers_router = APIRouter(
 prefix="/drivers",
-tags=["Drivers"])
+tags=["Drivers"],
+route_class=TracedRoute)
 
 security = HTTPBearer()
 
+# For Routes Where Only Some Modes Need a Token
+optional_security = HTTPBearer(auto_error=False)
+
 """GET"""
 
+# Search Drivers by Name
+# Declared before /{driver_id} so "search" is never read as an ID
+@drivers_router.get("/search", response_model=DriverSearchPage, status_code=status.HTTP_200_OK)
+async def search_driver_names(
+    q: str = Query(..., min_length=1, max_length=200),
+    offset: int = Query(0, ge=0, le=1000),
+    limit: int = Query(20, ge=1, le=100),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    # One extra row tells us whether another page exists
+    rows = await search_drivers(q, offset, limit + 1)
+
+    next_offset = offset + limit if len(rows) > limit else None
+
+    return respond({"drivers": rows[:limit], "next_offset": next_offset})
+
 # Get Driver's Details by ID
+# A poll sending back the last ETag gets a 304 from the version lookup alone
 @drivers_router.get("/{driver_id}", response_model=DriverOut, status_code=status.HTTP_200_OK)
-async def get_driver_details(driver_id: int):
+async def get_driver_details(
+    driver_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
+    # Version First – Data Read After It Is Never Older Than Its ETag
+    versions = await fetch_driver_versions(driver_id)
+
+    if versions is None:
+        raise HTTPException(status_code=404, detail="Driver ID Not Found")
+
+    etag = make_etag(driver_id, versions[0])
+
+    if not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    response.headers["ETag"] = etag
+
     # Perform the Operation
-    row = fetch_driver_details(driver_id)
+    row = await fetch_driver_details(driver_id, versions[0])
 
     # Validation
     if row is None:
         raise HTTPException(status_code=404, detail="Driver ID Not Found")
-    
-    # Driver Details
-    driver = {
-        "driver_id": row[0],
-        "licence_number": row[2],
-        "state_issue": row[3],
-        "last_name": row[4],
-        "first_name": row[5],
-        "dob": row[6],
-        "height_inches": row[7],
-        "weight_pounds": row[8],
-        "eyes_colour": row[9]
-    }
 
     # Return the Results
-    return driver
+    # db_raw already returns the driver keyed by DriverOut's fields
+    return respond(row, response)
 
 # Get All Driver's Details
-@drivers_router.get("", status_code=status.HTTP_200_OK)
-async def get_all_drivers():
+# Paged with ?after=&limit=, or streamed as NDJSON with ?format=ndjson
+@drivers_router.get("", response_model=DriverPage, status_code=status.HTTP_200_OK)
+async def get_all_drivers(
+    after: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    format: Literal["json", "ndjson"] = "json",
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    # Streaming Mode – Officers Only, Like the Other Bulk Routes
+    if format == "ndjson":
+        if credentials is None:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+
+        verify_officer_token(credentials.credentials)
+
+        # Each Stream Holds a Connection Until the Client Stops Reading
+        try:
+            chunks = stream_drivers(after, config.DB_STREAM_CHUNK_SIZE)
+        except StreamsBusy:
+            raise HTTPException(status_code=503, detail="Too many streams open, try again shortly")
+
+        return StreamingResponse(
+            _driver_lines(chunks),
+            media_type="application/x-ndjson"
+        )
+
     # Perform the Operation
-    row = fetch_all_drivers()
+    # One extra row tells us whether another page exists
+    rows = await fetch_drivers_page(after, limit + 1)
 
-    # Validation
-    if row is None:
-        raise HTTPException(status_code=404, detail="Driver ID Not Found")
-    
     # All Drivers
-    drivers = {
+    drivers = [_driver_summary(row) for row in rows[:limit]]
+
+    # Next Cursor
+    next_cursor = drivers[-1]["driver_id"] if len(rows) > limit else None
+
+    # Return
+    return respond({"drivers": drivers, "next_cursor": next_cursor})
+
+# Driver Listing Entry From a Row
+def _driver_summary(row):
+    return {
         "driver_id": row[0],
         "state_issue": row[1],
         "last_name": row[2],
         "first_name": row[3]
     }
 
-    # Return
-    return drivers
+# NDJSON Body, One Chunk of Rows at a Time
+# A client that disconnects closes the cursor straight away
+async def _driver_lines(chunks):
+    try:
+        async for rows in chunks:
+            yield "".join(
+                json.dumps(_driver_summary(row)) + "\n"
+                for row in rows
+            )
+
+    finally:
+        await chunks.aclose()
 
 """POST"""
 
@@ -70,9 +146,9 @@ async def insert_new_driver(
     payload: DriverCreate,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
-    verify_token(credentials.credentials)
+    verify_officer_token(credentials.credentials)
 
-    driver_id = create_driver(
+    driver_id = await create_driver(
         driver=payload,
         address=payload.address
     )
@@ -89,6 +165,42 @@ async def insert_new_driver(
         eyes_colour=payload.eyes_colour
     )
 
+# Bulk Import Drivers
+# Body is a JSON array of drivers, or NDJSON with one driver per line
+@drivers_router.post("/bulk", response_model=BulkDriverResult, status_code=status.HTTP_200_OK)
+async def insert_drivers_bulk(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    results = []
+    chunk = []
+
+    # Validate Records as They Arrive, Insert a Chunk at a Time
+    async for index, driver, error in read_records(request, DriverCreate):
+        if error is not None:
+            results.append({"index": index, "error": error})
+            continue
+
+        chunk.append((index, driver))
+
+        if len(chunk) >= config.BULK_CHUNK_SIZE:
+            results.extend(await create_drivers_bulk(chunk))
+            chunk = []
+
+    if chunk:
+        results.extend(await create_drivers_bulk(chunk))
+
+    results.sort(key=lambda result: result["index"])
+    inserted = sum(1 for result in results if "driver_id" in result)
+
+    return {
+        "inserted": inserted,
+        "failed": len(results) - inserted,
+        "results": results
+    }
+
 """DELETE"""
 
 # Deletes the Driver by ID
@@ -97,9 +209,9 @@ async def remove_driver(
     driver_id: int,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
-    verify_token(credentials.credentials)
+    verify_officer_token(credentials.credentials)
 
-    deleted = delete_driver(driver_id)
+    deleted = await delete_driver(driver_id)
 
     if not deleted:
         raise HTTPException(
@@ -118,9 +230,9 @@ async def update_existing_driver(
     payload: DriverCreate,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
-    verify_token(credentials.credentials)
+    verify_officer_token(credentials.credentials)
 
-    row = update_driver(driver_id, payload)
+    row = await update_driver(driver_id, payload)
 
     if row is None:
         raise HTTPException(
@@ -128,14 +240,25 @@ async def update_existing_driver(
             detail="Driver not found"
         )
 
-    return {
-        "driver_id": row[0],
-        "licence_number": row[1],
-        "state_issue": row[2],
-        "last_name": row[3],
-        "first_name": row[4],
-        "dob": row[5],
-        "height_inches": row[6],
-        "weight_pounds": row[7],
-        "eyes_colour": row[8]
-    }
+    return row
+
+"""PATCH"""
+
+# Updates Only the Driver Fields Sent
+@drivers_router.patch("/{driver_id}", response_model=DriverOut, status_code=status.HTTP_200_OK)
+async def patch_existing_driver(
+    driver_id: int,
+    payload: DriverPatch,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    row = await patch_driver(driver_id, payload)
+
+    if row is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Driver not found"
+        )
+
+    return row
@@ -0,0 +1,83 @@
+# app/api/routers/exports.py
+# Imports
+import asyncio
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import HTTPException, APIRouter, status, Depends
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.database.db_async import *
+from app.database.db_raw import EXPORT_DATASETS
+from app.core.security import verify_officer_token
+from app.core import config
+from app.api.exports import ENCODERS, available
+from app.core.tracing import TracedRoute
+
+# Defines the Router
+exports_router = APIRouter(
+prefix="/exports",
+tags=["Exports"],
+route_class=TracedRoute)
+
+security = HTTPBearer()
+
+"""GET"""
+
+# Joined Notice Data as a CSV or Parquet File
+# violations: each notice with its car, driver and the driver's city
+# actions: each officer action with its notice, driver and violation location
+# Streamed from a server-side cursor EXPORT_CHUNK_SIZE rows at a time
+@exports_router.get("/notices", status_code=status.HTTP_200_OK)
+async def export_notices(
+    format: Literal["csv", "parquet"] = "csv",
+    dataset: Literal["violations", "actions"] = "violations",
+    driver_id: Optional[int] = None,
+    violation_severity: Optional[Literal["Low", "Medium", "High"]] = None,
+    notice_status: Optional[Literal["Active", "Resolved", "Expired"]] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    # Parquet Needs pyarrow
+    if not available(format):
+        raise HTTPException(status_code=501, detail="Parquet export is not available on this server")
+
+    encoder = ENCODERS[format](EXPORT_DATASETS[dataset]["columns"])
+
+    # Each Export Holds a Connection Until the Client Stops Reading
+    try:
+        chunks = stream_export(
+            dataset,
+            config.EXPORT_CHUNK_SIZE,
+            config.EXPORT_BUFFER_CHUNKS,
+            driver_id=driver_id,
+            severity=violation_severity,
+            status=notice_status,
+            date_from=date_from,
+            date_to=date_to
+        )
+    except StreamsBusy:
+        raise HTTPException(status_code=503, detail="Too many streams open, try again shortly")
+
+    return StreamingResponse(
+        _export_body(encoder, chunks),
+        media_type=encoder.media_type,
+        headers={"Content-Disposition": f'attachment; filename="notices-{dataset}.{encoder.extension}"'}
+    )
+
+# File Body, One Chunk at a Time
+# Encoding runs on a worker thread so large chunks do not stall the loop
+# A client that disconnects closes the cursor straight away
+async def _export_body(encoder, chunks):
+    try:
+        yield encoder.start()
+
+        async for rows in chunks:
+            yield await asyncio.to_thread(encoder.encode, rows)
+
+        yield encoder.finish()
+
+    finally:
+        await chunks.aclose()
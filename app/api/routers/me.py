@@ -0,0 +1,54 @@
+# app/api/routers/me.py
+# Imports
+from fastapi import APIRouter, status, Depends, Query
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.database.db_async import *
+from app.schemas.me import *
+from app.core.security import verify_driver_token
+from app.core.tracing import TracedRoute
+from app.core.responses import respond
+
+# Defines the Router
+me_router = APIRouter(
+prefix="/me",
+tags=["Self-Service"],
+route_class=TracedRoute)
+
+security = HTTPBearer()
+
+# Column Names, in the Order fetch_my_notices Returns Them
+MY_NOTICE_FIELDS = (
+    "driver_id", "first_name", "last_name",
+    "licence_plate", "make", "car_type", "year_production",
+    "plate_state_issue", "vin", "colour",
+    "notice_id", "violation_description", "violation_severity",
+    "notice_status", "violation_date_time",
+    "reg_state", "reg_city",
+    "violation_state", "violation_city", "violation_district",
+    "violation_street"
+)
+
+"""GET"""
+
+# Get the Signed-In Driver's Notices
+# The driver ID comes from the token, never from the URL
+@me_router.get("/notices", response_model=MyNoticePage, status_code=status.HTTP_200_OK)
+async def get_my_notices(
+    after: str = "",
+    limit: int = Query(50, ge=1, le=500),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    driver_id = verify_driver_token(credentials.credentials)
+
+    # Perform the Operation
+    # One extra row tells us whether another page exists
+    rows = await fetch_my_notices(driver_id, after, limit + 1)
+
+    # Notice Details
+    notices = [dict(zip(MY_NOTICE_FIELDS, row)) for row in rows[:limit]]
+
+    # Next Cursor
+    next_cursor = notices[-1]["notice_id"] if len(rows) > limit else None
+
+    # Return the Results
+    return respond({"notices": notices, "next_cursor": next_cursor})
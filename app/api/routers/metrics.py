@@ -0,0 +1,82 @@
+# app/api/routers/metrics.py
+# Imports
+from fastapi import APIRouter, Response
+from app.core import metrics
+from app.database.db_raw import pool_stats, cache_stats, zip_code_stats, notice_facts_stats
+from app.database.db_async import stream_stats
+from app.database.expiry import expiry_stats
+from app.database.outbox import outbox_stats
+
+# Defines the Router
+metrics_router = APIRouter(tags=["Monitoring"])
+
+# Pool Stats That Only Ever Grow; the Rest Are Point-in-Time Gauges
+POOL_COUNTERS = ("checkouts", "timeouts", "discarded", "checkout_seconds_total")
+
+"""GET"""
+
+# Prometheus Scrape Endpoint
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    lines = []
+
+    # Connection Pool
+    for key, value in pool_stats().items():
+        if key in POOL_COUNTERS:
+            name = key if key.endswith("_total") else f"{key}_total"
+            lines.extend(metrics.counter_lines(f"db_pool_{name}", f"Connection pool {key.replace('_', ' ')}.", [((), value)]))
+        else:
+            lines.extend(metrics.gauge_lines(f"db_pool_{key}", f"Connection pool {key.replace('_', ' ')}.", [((), value)]))
+
+    # Open Streams (NDJSON Listing and Exports)
+    for key, value in stream_stats().items():
+        lines.extend(metrics.gauge_lines(f"db_streams_{key}", f"Database streams {key}.", [((), value)]))
+
+    # Read-Through Caches
+    caches = cache_stats()
+
+    lines.extend(metrics.gauge_lines(
+        "cache_entries", "Lookup cache entries.",
+        [((name,), caches[name]["entries"]) for name in ("drivers", "notices", "versions")],
+        ("cache",)
+    ))
+
+    for key in ("hits", "misses", "evictions", "invalidations"):
+        lines.extend(metrics.counter_lines(
+            f"cache_{key}_total", f"Lookup cache {key}.",
+            [((name,), caches[name][key]) for name in ("drivers", "notices", "versions")],
+            ("cache",)
+        ))
+
+    # ZIP Code Dimension
+    zips = zip_code_stats()
+
+    lines.extend(metrics.gauge_lines(
+        "zip_codes_size", "In-memory ZIP code set size.",
+        [((name,), zips[name]["size"]) for name in ("registration", "violation")],
+        ("table",)
+    ))
+
+    for key in ("hits", "misses"):
+        lines.extend(metrics.counter_lines(
+            f"zip_codes_{key}_total", f"In-memory ZIP code set {key}.",
+            [((name,), zips[name][key]) for name in ("registration", "violation")],
+            ("table",)
+        ))
+
+    # Notice Expiry Job
+    for key, value in expiry_stats().items():
+        lines.extend(metrics.gauge_lines(f"expiry_last_run_{key}", f"Last expiry run {key.replace('_', ' ')}.", [((), value)]))
+
+    # Notification Outbox
+    for key, value in outbox_stats().items():
+        lines.extend(metrics.gauge_lines(f"outbox_{key}", f"Notification outbox {key.replace('_', ' ')}.", [((), value)]))
+
+    # Hotspot Analytics Column Cache
+    for key, value in notice_facts_stats().items():
+        lines.extend(metrics.gauge_lines(f"analytics_{key}", f"Hotspot column cache {key.replace('_', ' ')}.", [((), value)]))
+
+    return Response(
+        content=metrics.render(lines),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,45 +1,112 @@
 # app/api/routers/notices.py
 # Imports
-from fastapi import HTTPException, APIRouter, status, Depends
+import base64
+import json
+import tempfile
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import HTTPException, APIRouter, status, Depends, Query, Request, Header, Response
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.database.db_raw import *
+from app.database.db_async import *
 from app.schemas.notices import *
-from app.core.security import verify_token
+from app.core.security import verify_officer_token
+from app.core import config
+from app.api.ndjson import read_records
+from app.core.tracing import TracedRoute
+from app.core.responses import respond, make_etag, not_modified, not_modified_response
 
 # Defines the Router
 notices_router = APIRouter(
 prefix="/notices",
-tags=["Notices"])
+tags=["Notices"],
+route_class=TracedRoute)
 
 security = HTTPBearer()
 
 """GET"""
 
+# Search Notice Descriptions
+# Declared before /{driver_id} so "search" is never read as an ID
+@notices_router.get("/search", response_model=NoticeSearchPage, status_code=status.HTTP_200_OK)
+async def search_notice_descriptions(
+    q: str = Query(..., min_length=1, max_length=200),
+    offset: int = Query(0, ge=0, le=1000),
+    limit: int = Query(20, ge=1, le=100),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    # One extra row tells us whether another page exists
+    rows = await search_notices(q, offset, limit + 1)
+
+    next_offset = offset + limit if len(rows) > limit else None
+
+    return respond({"notices": rows[:limit], "next_offset": next_offset})
+
 # Get Driver's Notice Details by ID
-@notices_router.get("/{driver_id}", response_model=NoticeBase, status_code=status.HTTP_200_OK)
-async def get_driver_notice(driver_id: int):
-    # Perform the Operation
-    row = fetch_driver_notices(driver_id)
+# Every notice across all of the driver's cars, filtered and paged
+# Any write to the driver's notices changes the ETag of every page
+@notices_router.get("/{driver_id}", response_model=NoticePage, status_code=status.HTTP_200_OK)
+async def get_driver_notice(
+    driver_id: int,
+    response: Response,
+    violation_severity: Optional[Literal["Low", "Medium", "High"]] = None,
+    notice_status: Optional[Literal["Active", "Resolved", "Expired"]] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    after: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    if_none_match: Optional[str] = Header(None)
+):
+    # Version First – Data Read After It Is Never Older Than Its ETag
+    versions = await fetch_driver_versions(driver_id)
 
-    # Validation
-    if row is None:
+    if versions is None:
         raise HTTPException(status_code=404, detail="Driver ID Not Found")
-    
+
+    etag = make_etag(driver_id, versions[1])
+
+    if not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    response.headers["ETag"] = etag
+
+    # Perform the Operation
+    # One extra row tells us whether another page exists
+    rows = await fetch_driver_notices(
+        driver_id,
+        severity=violation_severity,
+        status=notice_status,
+        date_from=date_from,
+        date_to=date_to,
+        after=_decode_cursor(after) if after else None,
+        limit=limit + 1,
+        notices_version=versions[1]
+    )
+
     # Notice Details
-    notice = {
-        "notice_id": row[0],
-        "violation_date_time": row[3],
-        "detachment": row[4],
-        "violation_severity": row[5],
-        "notice_status": row[6],
-        "notification_sent": row[7],
-        "entry_date": row[8],
-        "expiry_date": row[9],
-        "violation_description": row[10]
-    }
+    # db_raw already returns each notice keyed by NoticeBase's fields
+    notices = rows[:limit]
+
+    # Next Cursor
+    next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
 
     # Return the Results
-    return notice
+    return respond({"notices": notices, "next_cursor": next_cursor}, response)
+
+# Cursor Holds the Last (violation_date_time, notice_id) of a Page
+def _encode_cursor(notice):
+    raw = f"{notice['violation_date_time'].isoformat()}|{notice['notice_id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        date_time, notice_id = raw.split("|", 1)
+        return datetime.fromisoformat(date_time), notice_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 """POST"""
 
@@ -49,9 +116,9 @@ async def insert_new_notice(
     notice: NoticeCreate,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
-    verify_token(credentials.credentials)
+    verify_officer_token(credentials.credentials)
 
-    notice_id = create_notice(notice, notice.violation_zip, notice.violation_address)
+    notice_id = await create_notice(notice, notice.violation_zip, notice.violation_address)
 
     if notice_id is None:
         raise HTTPException(
@@ -65,12 +132,72 @@ async def insert_new_notice(
         "detachment": notice.detachment,
         "violation_severity": notice.violation_severity,
         "notice_status": notice.notice_status,
-        "notification_sent": notice.notification_sent,
+        "notification_sent": False,
         "entry_date": notice.entry_date,
         "expiry_date": notice.expiry_date,
         "violation_description": notice.violation_description
     }
 
+# Bulk Ingest Notices
+# NDJSON in, one NDJSON result line per record out. Each chunk commits on
+# its own, so a bad record or chunk never rolls back the rest of the upload
+@notices_router.post("/bulk", status_code=status.HTTP_200_OK)
+async def insert_notices_bulk(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    # Results Spill to Disk Past 1 MB, So Huge Uploads Stay Flat in Memory
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    chunk = []
+
+    try:
+        # Validate Records as They Arrive, Insert a Chunk at a Time
+        async for index, notice, error in read_records(request, NoticeCreate):
+            if error is not None:
+                _write_results(spool, [{"index": index, "error": error}])
+                continue
+
+            chunk.append((index, notice))
+
+            if len(chunk) >= config.BULK_CHUNK_SIZE:
+                _write_results(spool, await create_notices_bulk(chunk))
+                chunk = []
+
+        if chunk:
+            _write_results(spool, await create_notices_bulk(chunk))
+
+    except BaseException:
+        spool.close()
+        raise
+
+    spool.seek(0)
+
+    return StreamingResponse(
+        _read_spool(spool),
+        media_type="application/x-ndjson"
+    )
+
+# Append Result Lines in Record Order
+def _write_results(spool, results):
+    for result in sorted(results, key=lambda result: result["index"]):
+        spool.write(json.dumps(result).encode() + b"\n")
+
+# Stream the Spooled Results Back
+def _read_spool(spool, size: int = 64 * 1024):
+    try:
+        while True:
+            data = spool.read(size)
+
+            if not data:
+                break
+
+            yield data
+
+    finally:
+        spool.close()
+
 """DELETE"""
 
 # Delete Notice by ID
@@ -79,9 +206,9 @@ async def remove_notice(
     notice_id: str,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
-    verify_token(credentials.credentials)
+    verify_officer_token(credentials.credentials)
 
-    deleted = delete_notice(notice_id)
+    deleted = await delete_notice(notice_id)
 
     if not deleted:
         raise HTTPException(
@@ -100,9 +227,9 @@ async def update_existing_notice(
     payload: NoticeCreate,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
-    verify_token(credentials.credentials)
+    verify_officer_token(credentials.credentials)
 
-    row = update_notice(notice_id, payload)
+    row = await update_notice(notice_id, payload)
 
     if row is None:
         raise HTTPException(
@@ -110,14 +237,25 @@ async def update_existing_notice(
             detail="Notice not found"
         )
 
-    return {
-        "notice_id": row[0],
-        "violation_date_time": row[1],
-        "detachment": row[2],
-        "violation_severity": row[3],
-        "notice_status": row[4],
-        "notification_sent": row[5],
-        "entry_date": row[6],
-        "expiry_date": row[7],
-        "violation_description": row[8]
-    }
+    return row
+
+"""PATCH"""
+
+# Updates Only the Notice Fields Sent
+@notices_router.patch("/{notice_id}", response_model=NoticeBase, status_code=status.HTTP_200_OK)
+async def patch_existing_notice(
+    notice_id: str,
+    payload: NoticePatch,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    row = await patch_notice(notice_id, payload)
+
+    if row is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Notice not found"
+        )
+
+    return row
@@ -0,0 +1,80 @@
+# app/api/routers/reports.py
+# Imports
+from typing import Literal, Optional
+from fastapi import APIRouter, status, Depends, Query
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.database.db_async import *
+from app.schemas.reports import *
+from app.core.security import verify_officer_token
+from app.core.tracing import TracedRoute
+from app.core.responses import respond
+
+# Defines the Router
+reports_router = APIRouter(
+prefix="/reports",
+tags=["Reports"],
+route_class=TracedRoute)
+
+security = HTTPBearer()
+
+"""GET"""
+
+# Drivers With the Most Violations Outside Their Home State
+# Declared before /{dimension} so "out-of-state" is not read as a dimension
+@reports_router.get("/out-of-state", response_model=OutOfStateReport, status_code=status.HTTP_200_OK)
+async def get_out_of_state_report(
+    limit: int = Query(50, ge=1, le=1000),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    # Perform the Operation
+    rows = await fetch_out_of_state_report(limit)
+
+    # Return the Results
+    return {
+        "drivers": [
+            {
+                "driver_id": row[0],
+                "first_name": row[1],
+                "last_name": row[2],
+                "notice_count": row[3]
+            }
+            for row in rows
+        ]
+    }
+
+# Notice Counts per District and Time Bucket, With the Busiest Cells
+# Counted in memory from a columnar copy refreshed every ANALYTICS_REFRESH_SECONDS
+# Declared before /{dimension} so "hotspots" is not read as a dimension
+@reports_router.get("/hotspots", response_model=HotspotReport, status_code=status.HTTP_200_OK)
+async def get_hotspot_report(
+    bucket: Literal["hour_of_week", "hour", "weekday"] = "hour_of_week",
+    severity: Optional[Literal["Low", "Medium", "High"]] = None,
+    top: int = Query(20, ge=1, le=500),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    # Perform the Operation
+    report = await notice_hotspots(bucket, severity, top)
+
+    # Return the Results
+    return respond(report)
+
+# Notice Counts by Severity, Status, District or Month
+@reports_router.get("/{dimension}", response_model=NoticeReport, status_code=status.HTTP_200_OK)
+async def get_notice_report(
+    dimension: Literal["severity", "status", "district", "month"],
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    verify_officer_token(credentials.credentials)
+
+    # Perform the Operation
+    rows = await fetch_notice_report(dimension)
+
+    # Return the Results
+    return {
+        "dimension": dimension,
+        "rows": [{"value": row[0], "notice_count": row[1]} for row in rows]
+    }
@@ -0,0 +1,180 @@
+# app/core/config.py
+# Imports
+import os
+
+"""
+    Central place for runtime settings. Every value can be
+    overridden through an environment variable of the same
+    name, so the defaults below match the local Docker setup
+    described in the README.
+"""
+
+# Read an Integer Setting
+def _int(name: str, default: int):
+    return int(os.getenv(name, default))
+
+# Read a Float Setting
+def _float(name: str, default: float):
+    return float(os.getenv(name, default))
+
+# Read a Boolean Setting
+def _bool(name: str, default: bool):
+    value = os.getenv(name)
+
+    if value is None:
+        return default
+
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+"""DATABASE"""
+
+DB_HOST = os.getenv("DB_HOST", "localhost")
+DB_PORT = _int("DB_PORT", 3306)
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "SEPS")
+DB_NAME = os.getenv("DB_NAME", "notice_base")
+
+"""CONNECTION POOL"""
+
+# Maximum Number of Open Connections
+DB_POOL_SIZE = _int("DB_POOL_SIZE", 10)
+
+# Seconds to Wait For a Free Connection Before Giving Up
+DB_POOL_TIMEOUT = _float("DB_POOL_TIMEOUT", 30.0)
+
+# Idle Connections Older Than This Are Closed and Reopened
+DB_POOL_RECYCLE = _float("DB_POOL_RECYCLE", 300.0)
+
+# Idle Connections Younger Than This Skip the Ping on Checkout
+DB_POOL_PING_AFTER = _float("DB_POOL_PING_AFTER", 5.0)
+
+"""ASYNC DATABASE ACCESS"""
+
+# Streams Open at Once (NDJSON Driver Listing, Exports) – Each Holds a
+# Pooled Connection for as Long as Its Client Keeps Reading; More Get a 503
+DB_MAX_STREAMS = _int("DB_MAX_STREAMS", 2)
+
+# Queries Allowed to Run at Once (Worker Threads)
+# Defaults to what the pool has left once every stream holds a connection
+DB_MAX_CONCURRENCY = _int("DB_MAX_CONCURRENCY", max(1, DB_POOL_SIZE - DB_MAX_STREAMS))
+
+"""PAGINATION AND STREAMING"""
+
+# Rows Fetched per Round Trip From a Server-Side Cursor
+DB_STREAM_CHUNK_SIZE = _int("DB_STREAM_CHUNK_SIZE", 1000)
+
+"""EXPORTS"""
+
+# Rows per Chunk of GET /exports/notices (One Parquet Row Group Each)
+EXPORT_CHUNK_SIZE = _int("EXPORT_CHUNK_SIZE", 10000)
+
+# Chunks Read Ahead of the Client – Bounds an Export's Memory
+EXPORT_BUFFER_CHUNKS = _int("EXPORT_BUFFER_CHUNKS", 2)
+
+# Seconds the Server Waits on a Slow Client Before Dropping an Export
+EXPORT_WRITE_TIMEOUT_SECONDS = _int("EXPORT_WRITE_TIMEOUT_SECONDS", 600)
+
+"""READ-THROUGH CACHE"""
+
+# Turn the Driver / Notice Lookup Cache On or Off
+CACHE_ENABLED = _bool("CACHE_ENABLED", True)
+
+# Entries Kept per Cache Before the Least Recently Used Are Evicted
+CACHE_MAX_ENTRIES = _int("CACHE_MAX_ENTRIES", 10000)
+
+# Seconds an Entry Stays Fresh
+CACHE_TTL_SECONDS = _float("CACHE_TTL_SECONDS", 60.0)
+
+"""BULK IMPORT"""
+
+# Records Inserted per Transaction
+BULK_CHUNK_SIZE = _int("BULK_CHUNK_SIZE", 500)
+
+"""PASSWORDS"""
+
+# bcrypt Cost Factor – Stored Hashes With a Different Cost Are Rehashed on Login
+BCRYPT_ROUNDS = _int("BCRYPT_ROUNDS", 12)
+
+# Threads Dedicated to bcrypt
+PASSWORD_HASH_WORKERS = _int("PASSWORD_HASH_WORKERS", 4)
+
+# Password Checks Allowed to Queue Before Logins Are Turned Away
+PASSWORD_HASH_QUEUE = _int("PASSWORD_HASH_QUEUE", 64)
+
+"""NOTICE EXPIRY"""
+
+# Background Job Moving Overdue Active Notices to Expired
+EXPIRY_ENABLED = _bool("EXPIRY_ENABLED", True)
+
+# Seconds Between Runs (Each Run Expires Everything Due, Batch by Batch)
+EXPIRY_INTERVAL_SECONDS = _float("EXPIRY_INTERVAL_SECONDS", 300.0)
+
+# Notices Expired per Transaction – Keeps Row Locks and Replication Lag Short
+EXPIRY_BATCH_SIZE = _int("EXPIRY_BATCH_SIZE", 500)
+
+# Pause Between Batches of One Run, Leaving Room for Live Traffic
+EXPIRY_BATCH_PAUSE_SECONDS = _float("EXPIRY_BATCH_PAUSE_SECONDS", 0.05)
+
+"""NOTIFICATIONS"""
+
+# Outbox Worker Delivering Notices Whose notification_sent Is Still FALSE
+# Delivery is at-least-once; enable it in one process per deployment
+NOTIFICATIONS_ENABLED = _bool("NOTIFICATIONS_ENABLED", False)
+
+# "file", "stub", or "package.module:Class" for a Custom Sender
+NOTIFICATION_SENDER = os.getenv("NOTIFICATION_SENDER", "file")
+
+# Where the File Sender Appends One JSON Line per Notification
+NOTIFICATION_FILE = os.getenv("NOTIFICATION_FILE", "notifications.jsonl")
+
+# Notices per Send and per Bulk "Mark Sent" UPDATE
+NOTIFICATION_BATCH_SIZE = _int("NOTIFICATION_BATCH_SIZE", 100)
+
+# Batches Sent at Once, and Batches Allowed to Wait for Them
+NOTIFICATION_CONCURRENCY = _int("NOTIFICATION_CONCURRENCY", 2)
+NOTIFICATION_QUEUE = _int("NOTIFICATION_QUEUE", 4)
+
+# Seconds Between Polls Once the Outbox Is Empty
+NOTIFICATION_POLL_SECONDS = _float("NOTIFICATION_POLL_SECONDS", 5.0)
+
+# Attempts per Batch, With Exponential Backoff From NOTIFICATION_RETRY_SECONDS
+NOTIFICATION_MAX_ATTEMPTS = _int("NOTIFICATION_MAX_ATTEMPTS", 5)
+NOTIFICATION_RETRY_SECONDS = _float("NOTIFICATION_RETRY_SECONDS", 1.0)
+
+# Failed Batches (Each After NOTIFICATION_MAX_ATTEMPTS Tries) Before a Notice Is Parked
+NOTIFICATION_PARK_AFTER = _int("NOTIFICATION_PARK_AFTER", 5)
+
+"""ANALYTICS"""
+
+# Seconds Before /reports/hotspots Reads Newly Added Notices Again
+ANALYTICS_REFRESH_SECONDS = _float("ANALYTICS_REFRESH_SECONDS", 30.0)
+
+# Seconds Before the Column Cache Is Rebuilt From Scratch, 0 = Never
+# Writes through this process keep it current; set this to pick up edits
+# made by other processes (several workers, or SQL run by hand)
+ANALYTICS_REBUILD_SECONDS = _float("ANALYTICS_REBUILD_SECONDS", 0.0)
+
+# Notices Read per Round Trip While Loading
+ANALYTICS_CHUNK_SIZE = _int("ANALYTICS_CHUNK_SIZE", 100000)
+
+"""METRICS"""
+
+# Time db_raw Calls, Statements and Requests for GET /metrics
+METRICS_ENABLED = _bool("METRICS_ENABLED", True)
+
+# Statements Slower Than This Are Logged (SQL Text and Parameter Types, Never Values)
+SLOW_QUERY_MS = _float("SLOW_QUERY_MS", 200.0)
+
+"""TRACING"""
+
+# Per-Request Spans and the Server-Timing Header
+TRACING_ENABLED = _bool("TRACING_ENABLED", True)
+
+# Share of Requests Whose Full Trace Is Logged as JSON (0.0 – 1.0)
+TRACE_SAMPLE_RATE = _float("TRACE_SAMPLE_RATE", 0.0)
+
+"""RESPONSES"""
+
+# Serialize Hot GET Responses Straight From Database Rows (orjson When Installed),
+# Skipping Pydantic Validation of Data That Came Out of Our Own Tables
+FAST_JSON = _bool("FAST_JSON", False)
@@ -0,0 +1,445 @@
+# app/core/metrics.py
+# Imports
+import functools
+import inspect
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from app.core import config
+from app.core.tracing import record_statement, current
+
+"""
+    Prometheus metrics without a client library. db_raw
+    functions are wrapped with @timed, which times the call,
+    counts errors and counts the rows its cursors read or
+    wrote. Cursors are wrapped by the pool so every statement
+    is counted and slow ones are logged with their SQL and the
+    shape (never the values) of their parameters. Requests are
+    timed per route template by MetricsMiddleware.
+
+    The hot path is a dict lookup, a bisect and a few integer
+    additions under a lock; benchmarks/instrumentation.py
+    measures what that costs per call.
+"""
+
+slow_query_logger = logging.getLogger("app.slow_query")
+
+# Latency Buckets in Seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+"""METRIC TYPES"""
+
+# Label Values as Prometheus Expects Them
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+
+    if extra:
+        pairs.append(extra)
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+# Monotonic Counter, One Series per Label Tuple
+class Counter:
+    def __init__(self, name: str, help: str, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels=()):
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def render(self):
+        with self._lock:
+            values = list(self._values.items())
+
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+
+        for labels, value in sorted(values):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value}")
+
+        return lines
+
+# Histogram With Fixed Buckets, One Series per Label Tuple
+# `counters` are (name, help) pairs of counters sharing the histogram's
+# labels; observe() updates them under the same lock in one go
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames=(), buckets=DEFAULT_BUCKETS, counters=()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        self.counters = tuple(counters)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value: float, *amounts):
+        # Index of the First Bucket That Holds the Value (len = +Inf)
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            series = self._series.get(labels)
+
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0] + [0] * len(self.counters)
+
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+            for position, amount in enumerate(amounts, 3):
+                series[position] += amount
+
+    def render(self):
+        with self._lock:
+            series = sorted(
+                ((labels, list(values[0]), *values[1:]) for labels, values in self._series.items()),
+                key=lambda item: item[0]
+            )
+
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+
+        for labels, counts, total, count, *_ in series:
+            running = 0
+
+            for bound, bucket in zip(self.buckets, counts):
+                running += bucket
+                le = _labels(self.labelnames, labels, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{le} {running}")
+
+            le = _labels(self.labelnames, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {count}")
+
+        for position, (name, help) in enumerate(self.counters, 3):
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+
+            for labels, *values in series:
+                lines.append(f"{name}{_labels(self.labelnames, labels)} {values[position]}")
+
+        return lines
+
+# Point-in-Time Values Read From a Stats Dictionary at Scrape Time
+def gauge_lines(name: str, help: str, samples, labelnames=()):
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(labelnames, labels)} {float(value)}")
+
+    return lines
+
+# Running Totals Kept by Another Object, Read at Scrape Time
+# `name` should end in _total; the value must only ever go up
+def counter_lines(name: str, help: str, samples, labelnames=()):
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(labelnames, labels)} {value}")
+
+    return lines
+
+"""REGISTRY"""
+
+db_calls = Histogram(
+    "db_call_duration_seconds", "Time spent in a db_raw function.", ("function",),
+    counters=(
+        ("db_rows_total", "Rows fetched or affected by a db_raw function's statements."),
+        ("db_statements_total", "SQL statements sent by a db_raw function."),
+        ("db_call_errors_total", "db_raw calls that raised.")
+    )
+)
+db_slow_statements = Counter(
+    "db_slow_statements_total", "Statements slower than SLOW_QUERY_MS.", ("function",)
+)
+http_request_seconds = Histogram(
+    "http_request_duration_seconds", "Time to serve a request, by route template.", ("method", "route", "status")
+)
+http_request_statements = Histogram(
+    "http_request_sql_statements", "SQL round trips per request, by route template (needs tracing).",
+    ("method", "route"), buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+)
+notices_expired = Counter(
+    "notices_expired_total", "Notices moved from Active to Expired by the expiry job."
+)
+expiry_batches = Counter(
+    "expiry_batches_total", "Expiry job batches, by outcome.", ("outcome",)
+)
+notifications_sent = Counter(
+    "notifications_sent_total", "Notices delivered by the notification sender."
+)
+notification_batches = Counter(
+    "notification_batches_total", "Notification batches, by outcome (sent, retried, failed).", ("outcome",)
+)
+notifications_parked = Counter(
+    "notifications_parked_total", "Notices parked after NOTIFICATION_PARK_AFTER failed batches."
+)
+notification_send_seconds = Histogram(
+    "notification_send_duration_seconds", "Time the sender took per batch."
+)
+
+METRICS = [
+    db_calls, db_slow_statements, http_request_seconds, http_request_statements,
+    notices_expired, expiry_batches,
+    notifications_sent, notification_batches, notifications_parked, notification_send_seconds
+]
+
+# Everything Above in Prometheus Text Format
+def render(extra_lines=()):
+    lines = []
+
+    for metric in METRICS:
+        lines.extend(metric.render())
+
+    lines.extend(extra_lines)
+
+    return "\n".join(lines) + "\n"
+
+"""DATABASE CALLS"""
+
+# The db_raw Call Running on This Thread: [function name, rows, statements]
+# Cursors add to it without locking; the totals are published once per call
+class _Local(threading.local):
+    call = None
+
+_current = _Local()
+
+def _current_call():
+    return _current.call
+
+# Publish One Finished Call
+def _publish(labels, elapsed: float, rows: int, statements: int, failed: bool):
+    db_calls.observe(labels, elapsed, rows, statements, 1 if failed else 0)
+
+# Time a db_raw Function
+# Generator functions are timed step by step, so a stream's total
+# covers every chunk but none of the time the consumer spends between them
+def timed(func):
+    if not config.METRICS_ENABLED:
+        return func
+
+    name = func.__name__
+    labels = (name,)
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def stream(*args, **kwargs):
+            generator = func(*args, **kwargs)
+            call = [name, 0, 0]
+            failed = False
+            elapsed = 0.0
+
+            try:
+                while True:
+                    outer = _current_call()
+                    _current.call = call
+                    started = time.perf_counter()
+
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    except Exception:
+                        failed = True
+                        raise
+                    finally:
+                        elapsed += time.perf_counter() - started
+                        _current.call = outer
+
+                    yield item
+
+            finally:
+                generator.close()
+                _publish(labels, elapsed, call[1], call[2], failed)
+
+        return stream
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        outer = _current_call()
+        call = _current.call = [name, 0, 0]
+        failed = True
+        started = time.perf_counter()
+
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            _current.call = outer
+            _publish(labels, elapsed, call[1], call[2], failed)
+
+    return wrapper
+
+"""STATEMENTS"""
+
+_whitespace = re.compile(r"\s+")
+
+# Parameter Types Without Their Values, Runs Collapsed: (int, str*500)
+def params_shape(params):
+    if params is None:
+        return "()"
+
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in params.items()) + "}"
+
+    names = []
+
+    for value in params:
+        name = type(value).__name__
+
+        if names and names[-1][0] == name:
+            names[-1][1] += 1
+        else:
+            names.append([name, 1])
+
+    return "(" + ", ".join(name if count == 1 else f"{name}*{count}" for name, count in names) + ")"
+
+# Log a Slow Statement
+def _slow(call, elapsed: float, query: str, shape: str):
+    function = call[0] if call is not None else "unknown"
+
+    db_slow_statements.inc((function,))
+    slow_query_logger.warning(
+        "slow query %.1f ms in %s: %s params=%s",
+        elapsed * 1000, function, _whitespace.sub(" ", query).strip()[:1000], shape
+    )
+
+# Cursor That Counts, Times and Logs Every Statement
+class InstrumentedCursor:
+    __slots__ = ("_cursor",)
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    # Count a Finished Statement Against the Running db_raw Call
+    def _record(self, call, query, args, many: bool, started: float):
+        elapsed = time.perf_counter() - started
+        record_statement(started, elapsed)
+
+        if call is not None:
+            call[2] += 1
+
+            # Writes Count Affected Rows; Result Sets Are Counted as They Are Fetched
+            if self._cursor.description is None:
+                call[1] += max(self._cursor.rowcount, 0)
+
+        if elapsed * 1000 >= config.SLOW_QUERY_MS:
+            if many:
+                shape = f"{len(args)} x {params_shape(args[0]) if args else '()'}"
+            else:
+                shape = params_shape(args)
+
+            _slow(call, elapsed, query, shape)
+
+    def execute(self, query, args=None):
+        started = time.perf_counter()
+        result = self._cursor.execute(query, args)
+        self._record(_current.call, query, args, False, started)
+        return result
+
+    def executemany(self, query, args):
+        args = list(args)
+        started = time.perf_counter()
+        result = self._cursor.executemany(query, args)
+        self._record(_current.call, query, args, True, started)
+        return result
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        call = _current.call
+
+        if row is not None and call is not None:
+            call[1] += 1
+
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        call = _current.call
+
+        if call is not None:
+            call[1] += len(rows)
+
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        call = _current.call
+
+        if call is not None:
+            call[1] += len(rows)
+
+        return rows
+
+    def close(self):
+        self._cursor.close()
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+
+# Wrap a Cursor Unless Metrics and Tracing Are Both Off
+def instrument_cursor(cursor):
+    if not (config.METRICS_ENABLED or config.TRACING_ENABLED):
+        return cursor
+
+    return InstrumentedCursor(cursor)
+
+"""REQUESTS"""
+
+# ASGI Middleware Timing Each Request by Its Route Template
+# Streaming responses are timed until their last chunk is sent
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not config.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = [500]
+
+        async def send_and_record(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_record)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+
+            http_request_seconds.observe(
+                (scope["method"], route, str(status[0])),
+                time.perf_counter() - started
+            )
+
+            # Round Trips Counted by the Request's Trace (TracingMiddleware Runs Outside)
+            trace = current()
+
+            if trace is not None:
+                http_request_statements.observe((scope["method"], route), trace.statements)
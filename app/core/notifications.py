@@ -0,0 +1,78 @@
+# app/core/notifications.py
+# Imports
+import asyncio
+import importlib
+import json
+from datetime import date, datetime
+from app.core import config
+
+"""
+    Notification senders used by the outbox worker
+    (app/database/outbox.py). A sender is any object with
+
+        async def send(self, notifications) -> None
+
+    taking a list of dicts (db_raw.NOTIFICATION_COLUMNS) and
+    raising if the batch could not be delivered; the worker
+    retries the whole batch and only marks it sent once send()
+    returns. NOTIFICATION_SENDER picks one: "file", "stub", or
+    "package.module:Class" for a sender of your own (built with
+    no arguments).
+"""
+
+# Dates as ISO Strings
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+# Appends One JSON Line per Notification – For Local Runs and Demos
+class FileSender:
+    def __init__(self, path: str = None):
+        self.path = path or config.NOTIFICATION_FILE
+
+    def _append(self, lines: str):
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(lines)
+
+    async def send(self, notifications):
+        lines = "".join(json.dumps(item, default=_default) + "\n" for item in notifications)
+        await asyncio.to_thread(self._append, lines)
+
+# Keeps What It Was Given – For Tests and Benchmarks
+# fail_next makes the next N send() calls raise, to exercise retries
+class StubSender:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.fail_next = 0
+
+    async def send(self, notifications):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        if self.fail_next:
+            self.fail_next -= 1
+            raise ConnectionError("Stub sender failure")
+
+        self.sent.extend(notifications)
+
+SENDERS = {
+    "file": FileSender,
+    "stub": StubSender
+}
+
+# Sender Named by NOTIFICATION_SENDER
+def get_sender(name: str = None):
+    name = name or config.NOTIFICATION_SENDER
+
+    if name in SENDERS:
+        return SENDERS[name]()
+
+    module_name, _, class_name = name.partition(":")
+
+    if not class_name:
+        raise ValueError(f"Unknown notification sender: {name}")
+
+    return getattr(importlib.import_module(module_name), class_name)()
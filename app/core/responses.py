@@ -0,0 +1,92 @@
+# app/core/responses.py
+# Imports
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from fastapi.responses import JSONResponse, Response
+from app.core import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+"""
+    Opt-in fast path for read endpoints. A FastAPI endpoint
+    that returns a dict has it validated against its
+    response_model, dumped through jsonable_encoder and then
+    json.dumps'd. For rows we have just read from our own
+    tables that work buys nothing, so with FAST_JSON on,
+    respond() wraps them in a FastJSONResponse instead and
+    FastAPI sends the bytes as they are.
+
+    orjson is used when installed (pip install orjson) and
+    handles dates natively; otherwise the standard library
+    encoder is used with compact separators. The JSON is the
+    same either way, and the same as the Pydantic path for the
+    shapes db_raw returns; benchmarks/serialization.py
+    compares the three.
+
+    The same endpoints carry ETags built from version counters
+    on driver_details, so a poll with If-None-Match gets an
+    empty 304 after a single primary key lookup.
+"""
+
+# Types the Standard Library Encoder Does Not Know
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+
+    if isinstance(value, Decimal):
+        return float(value)
+
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+# Python Object -> JSON Bytes
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+# JSON Response Without the Pydantic Round Trip
+class FastJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+# Trusted Database Rows Out of an Endpoint
+# FAST_JSON off: returned as-is so FastAPI validates them against response_model
+# (headers set on the endpoint's injected `response` are kept either way)
+def respond(content, response: Response = None, status_code: int = 200):
+    if config.FAST_JSON:
+        headers = dict(response.headers) if response is not None else None
+        return FastJSONResponse(content, status_code=status_code, headers=headers)
+
+    return content
+
+"""CONDITIONAL REQUESTS"""
+
+# Weak ETag From a Resource's Version Parts
+def make_etag(*parts):
+    return 'W/"' + ".".join(str(part) for part in parts) + '"'
+
+# Whether an If-None-Match Header Already Holds This ETag (Weak Comparison)
+def not_modified(if_none_match, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+# Empty 304 Carrying the Current ETag
+def not_modified_response(etag: str):
+    return Response(status_code=304, headers={"ETag": etag})
@@ -2,16 +2,95 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from fastapi import HTTPException
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from app.core import config
+from app.core.tracing import span
+import asyncio
+import heapq
+import threading
+import time
 import uuid
 
 SECRET_KEY = "SEPS"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Recently Verified Tokens Kept to Skip Re-Checking the Signature
+VERIFIED_TOKEN_CACHE_SIZE = 1024
 
-# In-memory blacklist
-blacklisted_tokens = set()
+# Min and Max Pinned to the Configured Cost, so Any Other Cost Needs a Rehash
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=config.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=config.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=config.BCRYPT_ROUNDS
+)
+
+# In-memory revocation list
+# Keyed by jti and forgotten once the token would have expired anyway,
+# so it only ever holds tokens that are still live
+class RevocationList:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._expiry = {}
+        self._heap = []
+
+    def revoke(self, jti: str, exp: float):
+        with self._lock:
+            self._purge(time.time())
+            self._expiry[jti] = exp
+            heapq.heappush(self._heap, (exp, jti))
+
+    def is_revoked(self, jti: str):
+        with self._lock:
+            self._purge(time.time())
+            return jti in self._expiry
+
+    # Drop Entries Whose Token Has Expired
+    def _purge(self, now: float):
+        while self._heap and self._heap[0][0] <= now:
+            exp, jti = heapq.heappop(self._heap)
+
+            if self._expiry.get(jti) == exp:
+                del self._expiry[jti]
+
+    def __len__(self):
+        with self._lock:
+            self._purge(time.time())
+            return len(self._expiry)
+
+# Bounded LRU of token -> payload for tokens whose signature already checked out
+class VerifiedTokens:
+    def __init__(self, max_entries: int):
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, token: str):
+        with self._lock:
+            payload = self._entries.get(token)
+
+            if payload is not None:
+                self._entries.move_to_end(token)
+
+            return payload
+
+    def add(self, token: str, payload: dict):
+        with self._lock:
+            self._entries[token] = payload
+            self._entries.move_to_end(token)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, token: str):
+        with self._lock:
+            self._entries.pop(token, None)
+
+revoked_tokens = RevocationList()
+verified_tokens = VerifiedTokens(VERIFIED_TOKEN_CACHE_SIZE)
 
 """PASSWORD"""
 
@@ -22,6 +101,53 @@ def hash_password(password: str):
 def verify_password(plain_password: str, hashed_password: str):
     return pwd_context.verify(plain_password, hashed_password)
 
+# bcrypt Is Deliberately Slow, so It Runs on Its Own Threads
+# (the bcrypt extension releases the GIL while hashing)
+_hash_executor = None
+_hash_pending = 0
+
+def shutdown_password_executor():
+    global _hash_executor
+
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=True)
+        _hash_executor = None
+
+# Check a Password Off the Event Loop
+# Returns (valid, new_hash); new_hash is set when the stored cost is outdated.
+# hashed_password=None still burns the same time, so unknown usernames
+# can't be told apart by timing
+async def check_password(plain_password: str, hashed_password):
+    global _hash_executor, _hash_pending
+
+    # Bounded Queue – Shed Load Instead of Growing Latency Without Limit
+    if _hash_pending >= config.PASSWORD_HASH_QUEUE:
+        raise HTTPException(status_code=503, detail="Too many login attempts, try again shortly")
+
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=config.PASSWORD_HASH_WORKERS,
+            thread_name_prefix="bcrypt"
+        )
+
+    loop = asyncio.get_running_loop()
+    _hash_pending += 1
+
+    try:
+        if hashed_password is None:
+            await loop.run_in_executor(_hash_executor, pwd_context.dummy_verify)
+            return False, None
+
+        return await loop.run_in_executor(
+            _hash_executor,
+            pwd_context.verify_and_update,
+            plain_password,
+            hashed_password
+        )
+
+    finally:
+        _hash_pending -= 1
+
 
 # JWT
 
@@ -39,15 +165,54 @@ def create_access_token(data: dict):
 
 # Verify Token
 def verify_token(token: str):
-    if token in blacklisted_tokens:
-        raise HTTPException(status_code=401, detail="Token blacklisted")
+    with span("auth"):
+        return _check_token(token)
 
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+def _check_token(token: str):
+    payload = verified_tokens.get(token)
+
+    # Not Seen Recently – Check the Signature
+    if payload is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+    # Cached Tokens Still Expire
+    elif payload["exp"] <= time.time():
+        verified_tokens.discard(token)
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    if revoked_tokens.is_revoked(payload.get("jti")):
+        verified_tokens.discard(token)
+        raise HTTPException(status_code=401, detail="Token blacklisted")
+
+    verified_tokens.add(token, payload)
+
+    return payload
+
+# Verify an Officer Token
+# Tokens issued before roles existed carry no role and were officer-only
+def verify_officer_token(token: str):
+    payload = verify_token(token)
+
+    if payload.get("role", "officer") != "officer":
+        raise HTTPException(status_code=403, detail="Officer access required")
+
+    return payload
+
+# Verify a Driver Token, Returns the Driver's ID
+def verify_driver_token(token: str):
+    payload = verify_token(token)
+
+    if payload.get("role") != "driver":
+        raise HTTPException(status_code=403, detail="Driver access required")
+
+    return payload["driver_id"]
+
 # Blacklist Token
 def blacklist_token(token: str):
-    blacklisted_tokens.add(token)
+    payload = jwt.get_unverified_claims(token)
+
+    revoked_tokens.revoke(payload["jti"], payload["exp"])
+    verified_tokens.discard(token)
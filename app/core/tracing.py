@@ -0,0 +1,221 @@
+# app/core/tracing.py
+# Imports
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import random
+import time
+from fastapi.routing import APIRoute
+from app.core import config
+
+"""
+    Per-request tracing. TracingMiddleware opens a Trace for
+    every HTTP request and keeps it in a context variable, so
+    code anywhere below (including db_async's worker threads,
+    which run with a copy of the request's context) can add
+    spans to it: auth (verify_token), pool (checkout), sql
+    (every statement) and serialize (endpoint return to first
+    response byte, marked by TracedRoute).
+
+    The totals go back to the client in a Server-Timing header,
+    together with the SQL round-trip count, and a sample of
+    traces (TRACE_SAMPLE_RATE) is logged in full as JSON to the
+    app.trace logger.
+"""
+
+trace_logger = logging.getLogger("app.trace")
+
+# Spans Written to the JSON Log per Request (Bulk Imports Can Have Thousands)
+MAX_LOGGED_SPANS = 200
+
+# Span Names in Server-Timing Order
+SPAN_ORDER = ("auth", "pool", "sql", "serialize")
+
+"""TRACE"""
+
+# Everything Timed During One Request
+class Trace:
+    __slots__ = ("started", "spans", "statements", "endpoint_done")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+
+        # (name, started, seconds) – appended from the loop and worker threads alike
+        self.spans = []
+        self.statements = 0
+        self.endpoint_done = None
+
+    def record(self, name: str, started: float, elapsed: float):
+        self.spans.append((name, started, elapsed))
+
+    # Milliseconds per Span Name
+    def totals(self):
+        totals = {}
+
+        for name, _, elapsed in list(self.spans):
+            totals[name] = totals.get(name, 0.0) + elapsed * 1000
+
+        return totals
+
+    # Server-Timing Header Value
+    def server_timing(self):
+        totals = self.totals()
+        parts = []
+
+        for name in SPAN_ORDER:
+            if name == "sql":
+                parts.append(f'sql;dur={totals.get("sql", 0.0):.2f};desc="round trips: {self.statements}"')
+            elif name in totals:
+                parts.append(f"{name};dur={totals[name]:.2f}")
+
+        parts.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}")
+
+        return ", ".join(parts)
+
+    # One JSON Log Line
+    def as_log(self, scope, status: int):
+        route = scope.get("route")
+        spans = list(self.spans)
+
+        return json.dumps({
+            "method": scope["method"],
+            "route": getattr(route, "path", scope["path"]),
+            "status": status,
+            "duration_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "round_trips": self.statements,
+            "totals_ms": {name: round(value, 3) for name, value in self.totals().items()},
+            "spans": [
+                {
+                    "name": name,
+                    "start_ms": round((started - self.started) * 1000, 3),
+                    "duration_ms": round(elapsed * 1000, 3)
+                }
+                for name, started, elapsed in spans[:MAX_LOGGED_SPANS]
+            ],
+            "spans_dropped": max(0, len(spans) - MAX_LOGGED_SPANS)
+        })
+
+# The Current Request's Trace (None Outside a Request)
+_trace = contextvars.ContextVar("trace", default=None)
+
+def current():
+    return _trace.get()
+
+"""SPANS"""
+
+# Times a Block Into the Current Trace
+class _Span:
+    __slots__ = ("_trace", "_name", "_started")
+
+    def __init__(self, trace, name: str):
+        self._trace = trace
+        self._name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._trace.record(self._name, self._started, time.perf_counter() - self._started)
+
+_NO_SPAN = contextlib.nullcontext()
+
+# with span("auth"): ... – Free When No Request Is Being Traced
+def span(name: str):
+    trace = _trace.get()
+
+    if trace is None:
+        return _NO_SPAN
+
+    return _Span(trace, name)
+
+# One SQL Statement (Called by the Instrumented Cursor)
+def record_statement(started: float, elapsed: float):
+    trace = _trace.get()
+
+    if trace is not None:
+        trace.statements += 1
+        trace.record("sql", started, elapsed)
+
+"""ROUTES"""
+
+# Marks the Moment the Endpoint Returns
+# What follows until the response starts is validation and serialization
+def _mark_endpoint_done(endpoint):
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def traced(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                trace = _trace.get()
+
+                if trace is not None:
+                    trace.endpoint_done = time.perf_counter()
+
+        return traced
+
+    @functools.wraps(endpoint)
+    def traced_sync(*args, **kwargs):
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            trace = _trace.get()
+
+            if trace is not None:
+                trace.endpoint_done = time.perf_counter()
+
+    return traced_sync
+
+# Route Class for Routers Whose Serialization Should Be Traced
+class TracedRoute(APIRoute):
+    def __init__(self, path: str, endpoint, **kwargs):
+        if config.TRACING_ENABLED:
+            endpoint = _mark_endpoint_done(endpoint)
+
+        super().__init__(path, endpoint, **kwargs)
+
+"""MIDDLEWARE"""
+
+# Opens a Trace per Request and Reports It
+class TracingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not config.TRACING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        token = _trace.set(trace)
+        status = [500]
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                now = time.perf_counter()
+
+                if trace.endpoint_done is not None:
+                    trace.record("serialize", trace.endpoint_done, now - trace.endpoint_done)
+
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"server-timing", trace.server_timing().encode("latin-1"))
+                    ]
+                }
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _trace.reset(token)
+
+            if config.TRACE_SAMPLE_RATE and random.random() < config.TRACE_SAMPLE_RATE:
+                trace_logger.info(trace.as_log(scope, status[0]))
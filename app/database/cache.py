@@ -0,0 +1,126 @@
+# app/database/cache.py
+# Imports
+import threading
+import time
+from collections import OrderedDict
+
+"""
+    In-process LRU cache with a time-to-live. Entries carry a
+    tag (the driver ID) so every entry belonging to a driver
+    can be dropped at once when one of the write functions
+    touches that driver. The cache also counts invalidations:
+    a reader notes the count before querying and the value is
+    only stored if no invalidation happened in between, so a
+    slow read can never put stale data back in the cache.
+"""
+
+# Returned by get() on a Miss
+MISSING = object()
+
+class TTLCache:
+    def __init__(self, max_entries: int, ttl: float):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+        # key -> (value, tag, expires_at), Oldest First
+        self._entries = OrderedDict()
+
+        # tag -> Keys Stored Under It
+        self._tags = {}
+
+        # Bumped on Every Invalidation
+        self._version = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    # Look Up a Key
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return MISSING
+
+            value, tag, expires_at = entry
+
+            # Expired Entries Count as Misses
+            if expires_at <= time.monotonic():
+                self._remove(key, tag)
+                self.evictions += 1
+                self.misses += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    # Current Invalidation Count
+    def version(self):
+        with self._lock:
+            return self._version
+
+    # Store a Value, Unless Anything Was Invalidated Since `version`
+    def set(self, key, value, tag, version: int):
+        with self._lock:
+            if self._version != version:
+                return
+
+            if key in self._entries:
+                self._remove(key, self._entries[key][1])
+
+            self._entries[key] = (value, tag, time.monotonic() + self._ttl)
+            self._tags.setdefault(tag, set()).add(key)
+
+            # Evict Least Recently Used
+            while len(self._entries) > self._max_entries:
+                old_key, (_, old_tag, _) = self._entries.popitem(last=False)
+                self._forget(old_key, old_tag)
+                self.evictions += 1
+
+    # Drop Everything Stored Under a Tag
+    def invalidate(self, tag):
+        with self._lock:
+            self._version += 1
+
+            for key in self._tags.pop(tag, ()):
+                self._entries.pop(key, None)
+                self.invalidations += 1
+
+    # Drop Everything
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._tags.clear()
+
+    # Remove an Entry and Its Tag Reference
+    def _remove(self, key, tag):
+        del self._entries[key]
+        self._forget(key, tag)
+
+    def _forget(self, key, tag):
+        keys = self._tags.get(tag)
+
+        if keys is not None:
+            keys.discard(key)
+
+            if not keys:
+                del self._tags[tag]
+
+    # Counters Snapshot
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
@@ -0,0 +1,328 @@
+# app/database/db_async.py
+# Imports
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from app.core import config
+from app.database import db_raw
+
+"""
+    Awaitable mirror of db_raw for the async route handlers.
+    MySQLdb blocks, so every call is handed to a dedicated,
+    bounded thread pool and the event loop keeps serving other
+    requests while the query runs. A semaphore caps how many
+    queries run at once; extra callers wait on the loop rather
+    than piling up inside the executor.
+"""
+
+# Shared Executor and Concurrency Limit (Created in the App Lifespan)
+_executor = None
+_slots = None
+
+# Create the Executor
+def init_executor():
+    global _executor, _slots
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=config.DB_MAX_CONCURRENCY,
+            thread_name_prefix="db"
+        )
+
+    # Bound to the Running Loop, so Recreated on Every Startup
+    _slots = asyncio.Semaphore(config.DB_MAX_CONCURRENCY)
+
+    return _executor
+
+# Stop the Executor
+def shutdown_executor():
+    global _executor, _slots
+
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+    _slots = None
+
+"""STREAMS"""
+
+# Raised When DB_MAX_STREAMS Streams Are Already Open
+class StreamsBusy(Exception):
+    pass
+
+_streams_lock = threading.Lock()
+_streams_open = 0
+
+# One Open Stream's Claim on a Pooled Connection
+# Taken before the response starts, so a full house can still answer 503;
+# given back when the stream ends, or when it is dropped without ever starting
+class StreamSlot:
+    def __init__(self):
+        global _streams_open
+        self._held = False
+
+        with _streams_lock:
+            if _streams_open >= config.DB_MAX_STREAMS:
+                raise StreamsBusy(f"{_streams_open} streams already open")
+
+            _streams_open += 1
+
+        self._held = True
+
+    def release(self):
+        global _streams_open
+
+        with _streams_lock:
+            if self._held:
+                self._held = False
+                _streams_open -= 1
+
+    def __del__(self):
+        self.release()
+
+# Open Streams for GET /metrics
+def stream_stats():
+    return {"open": _streams_open, "limit": config.DB_MAX_STREAMS}
+
+# Run a Blocking db_raw Function Off the Event Loop
+# The worker thread runs inside a copy of the caller's context, so the
+# request's trace sees the pool checkout and statements it causes
+async def run_db(func, *args, **kwargs):
+    if _executor is None or _slots is None:
+        init_executor()
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+
+    async with _slots:
+        return await loop.run_in_executor(
+            _executor,
+            functools.partial(context.run, func, *args, **kwargs)
+        )
+
+"""ZIP CODES"""
+
+# Load Both ZIP Tables Into Memory
+async def load_zip_codes():
+    return await run_db(db_raw.load_zip_codes)
+
+"""GET"""
+
+# Versions Behind a Driver's ETags
+async def fetch_driver_versions(driver_id: int):
+    return await run_db(db_raw.fetch_driver_versions, driver_id)
+
+# Get Driver's Details by ID
+async def fetch_driver_details(driver_id: int, row_version: int = None):
+    return await run_db(db_raw.fetch_driver_details, driver_id, row_version)
+
+# Get Notices Based on the Driver's ID
+async def fetch_driver_notices(driver_id: int, **filters):
+    return await run_db(db_raw.fetch_driver_notices, driver_id, **filters)
+
+# Get a Page of Drivers
+async def fetch_drivers_page(after: int, limit: int):
+    return await run_db(db_raw.fetch_drivers_page, after, limit)
+
+# Stream All Drivers
+# Each chunk is fetched off the loop, one chunk at a time
+# Raises StreamsBusy straight away when DB_MAX_STREAMS streams are open
+def stream_drivers(after: int, chunk_size: int):
+    return _stream_drivers(StreamSlot(), after, chunk_size)
+
+async def _stream_drivers(slot, after: int, chunk_size: int):
+    chunks = db_raw.stream_drivers(after, chunk_size)
+
+    try:
+        while True:
+            rows = await run_db(next, chunks, None)
+
+            if rows is None:
+                break
+
+            yield rows
+
+    finally:
+        try:
+            await run_db(chunks.close)
+        finally:
+            slot.release()
+
+"""SEARCH"""
+
+# Notices Whose Description Matches, Best First
+async def search_notices(text: str, offset: int, limit: int):
+    return await run_db(db_raw.search_notices, text, offset, limit)
+
+# Drivers Whose Name Matches, Best First
+async def search_drivers(text: str, offset: int, limit: int):
+    return await run_db(db_raw.search_drivers, text, offset, limit)
+
+"""OFFICERS"""
+
+# Get an Officer's Login Details
+async def fetch_officer_credentials(username: str):
+    return await run_db(db_raw.fetch_officer_credentials, username)
+
+# Store a Rehashed Password
+async def update_officer_password(badge_number: str, password_hash: str):
+    return await run_db(db_raw.update_officer_password, badge_number, password_hash)
+
+"""SELF-SERVICE"""
+
+# Get a Driver's Login Details
+async def fetch_driver_credentials(username: str):
+    return await run_db(db_raw.fetch_driver_credentials, username)
+
+# Store a Rehashed Driver Password
+async def update_driver_password(driver_id: int, password_hash: str):
+    return await run_db(db_raw.update_driver_password, driver_id, password_hash)
+
+# Get the Signed-In Driver's Own Notices
+async def fetch_my_notices(driver_id: int, after: str, limit: int):
+    return await run_db(db_raw.fetch_my_notices, driver_id, after, limit)
+
+"""POST"""
+
+# Create a New Driver
+async def create_driver(driver, address):
+    return await run_db(db_raw.create_driver, driver, address)
+
+# Create a New Notice
+async def create_notice(notice, violation_zip, violation_address):
+    return await run_db(db_raw.create_notice, notice, violation_zip, violation_address)
+
+"""BULK"""
+
+# Create a Chunk of Drivers
+async def create_drivers_bulk(rows):
+    return await run_db(db_raw.create_drivers_bulk, rows)
+
+# Create a Chunk of Notices
+async def create_notices_bulk(rows):
+    return await run_db(db_raw.create_notices_bulk, rows)
+
+"""DELETE"""
+
+# Delete Notice by ID
+async def delete_notice(notice_id: str):
+    return await run_db(db_raw.delete_notice, notice_id)
+
+# Delete Driver by ID
+async def delete_driver(driver_id: int):
+    return await run_db(db_raw.delete_driver, driver_id)
+
+"""PUT / PATCH"""
+
+# Update Driver and Return Updated Row
+async def update_driver(driver_id: int, payload):
+    return await run_db(db_raw.update_driver, driver_id, payload)
+
+# Update Notice and Return Updated Row
+async def update_notice(notice_id: str, payload):
+    return await run_db(db_raw.update_notice, notice_id, payload)
+
+# Update the Driver Fields a PATCH Sets
+async def patch_driver(driver_id: int, payload):
+    return await run_db(db_raw.patch_driver, driver_id, payload)
+
+# Update the Notice Fields a PATCH Sets
+async def patch_notice(notice_id: str, payload):
+    return await run_db(db_raw.patch_notice, notice_id, payload)
+
+"""EXPIRY"""
+
+# Expire One Batch of Overdue Notices
+async def expire_due_notices(limit: int):
+    return await run_db(db_raw.expire_due_notices, limit)
+
+"""OUTBOX"""
+
+# Oldest Notices Not Yet Notified
+async def fetch_unsent_notices(limit: int):
+    return await run_db(db_raw.fetch_unsent_notices, limit)
+
+# Mark a Delivered Batch as Sent
+async def mark_notifications_sent(notice_ids):
+    return await run_db(db_raw.mark_notifications_sent, notice_ids)
+
+# Count a Failed Batch Against Its Notices, Returns Those Parked
+async def record_notification_failures(notice_ids, park_after: int):
+    return await run_db(db_raw.record_notification_failures, notice_ids, park_after)
+
+"""REPORTS"""
+
+# Notice Counts Grouped by One Dimension
+async def fetch_notice_report(dimension: str):
+    return await run_db(db_raw.fetch_notice_report, dimension)
+
+# Drivers With the Most Out-of-State Violations
+async def fetch_out_of_state_report(limit: int):
+    return await run_db(db_raw.fetch_out_of_state_report, limit)
+
+"""ANALYTICS"""
+
+# Notice Counts by District and Time Bucket
+async def notice_hotspots(bucket: str, severity, top: int):
+    return await run_db(db_raw.notice_hotspots, bucket, severity, top)
+
+"""EXPORTS"""
+
+# Stream One Export Dataset
+# A reader task keeps up to `buffered` chunks fetched ahead of the caller, so
+# the next query round trip overlaps sending the last chunk without ever
+# holding more than that many chunks in memory
+# Raises StreamsBusy straight away when DB_MAX_STREAMS streams are open
+def stream_export(dataset: str, chunk_size: int, buffered: int, **filters):
+    return _stream_export(StreamSlot(), dataset, chunk_size, buffered, **filters)
+
+async def _stream_export(slot, dataset: str, chunk_size: int, buffered: int, **filters):
+    chunks = db_raw.stream_export(dataset, chunk_size, **filters)
+    queue = asyncio.Queue(maxsize=buffered)
+
+    # The Chunk Being Fetched – Awaited Before the Generator Is Closed
+    fetching = None
+
+    async def read():
+        nonlocal fetching
+
+        try:
+            while True:
+                fetching = asyncio.ensure_future(run_db(next, chunks, None))
+                rows = await asyncio.shield(fetching)
+                await queue.put(rows)
+
+                if rows is None:
+                    return
+
+        # Raised to the Caller in Order, After the Chunks Before It
+        except Exception as error:
+            await queue.put(error)
+
+    reader = asyncio.create_task(read())
+
+    try:
+        while True:
+            rows = await queue.get()
+
+            if rows is None:
+                break
+
+            if isinstance(rows, Exception):
+                raise rows
+
+            yield rows
+
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+
+        if fetching is not None:
+            await asyncio.gather(fetching, return_exceptions=True)
+
+        try:
+            await run_db(chunks.close)
+        finally:
+            slot.release()
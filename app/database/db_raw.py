@@ -1,94 +1,710 @@
 # app/database/db_raw.py
 # Imports
+import re
+import time
 import MySQLdb
-
-# Get Connection
-def get_connection():
+import MySQLdb.cursors
+from MySQLdb.constants import CLIENT
+from app.core import config
+from app.core.metrics import timed
+from app.database.pool import ConnectionPool
+from app.database.cache import TTLCache, MISSING
+from app.database.zip_cache import ZipCodes
+from app.database.notice_columns import NoticeColumns, SEVERITIES
+
+# Shared Connection Pool (Created in the App Lifespan)
+_pool = None
+
+# Open a Brand New Connection
+# FOUND_ROWS: an UPDATE's rowcount is the rows it matched, even if unchanged
+def open_connection():
     # Define Connection Parameters
     conn = MySQLdb.connect(
-        host = "localhost",
-        port = 3306,
-        user = "root",
-        password = "SEPS",
-        db = "notice_base",
-        charset="utf8mb4"
+        host = config.DB_HOST,
+        port = config.DB_PORT,
+        user = config.DB_USER,
+        password = config.DB_PASSWORD,
+        db = config.DB_NAME,
+        charset="utf8mb4",
+        client_flag = CLIENT.FOUND_ROWS
     )
 
     return conn
 
+# Create the Pool
+def init_pool():
+    global _pool
+
+    if _pool is None:
+        _pool = ConnectionPool(
+            connect=open_connection,
+            size=config.DB_POOL_SIZE,
+            timeout=config.DB_POOL_TIMEOUT,
+            recycle=config.DB_POOL_RECYCLE,
+            ping_after=config.DB_POOL_PING_AFTER
+        )
+
+    return _pool
+
+# Drain the Pool
+def close_pool():
+    global _pool
+
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+# Pool Metrics
+def pool_stats():
+    return init_pool().stats()
+
+# Get Connection
+# Borrowed from the pool, conn.close() hands it back and conn.discard() drops
+# it; every borrow must end in one of the two, or the pool slot is lost
+def get_connection():
+    return init_pool().acquire()
+
+"""CACHE"""
+
+# Lookup Caches, All Tagged by driver_id
+driver_cache = TTLCache(config.CACHE_MAX_ENTRIES, config.CACHE_TTL_SECONDS)
+notice_cache = TTLCache(config.CACHE_MAX_ENTRIES, config.CACHE_TTL_SECONDS)
+
+# ETag Versions: driver_id -> (row_version, notices_version)
+version_cache = TTLCache(config.CACHE_MAX_ENTRIES, config.CACHE_TTL_SECONDS)
+
+# Columnar Notice Facts Behind /reports/hotspots
+notice_facts = NoticeColumns()
+
+# Cache Counters
+def cache_stats():
+    return {
+        "enabled": config.CACHE_ENABLED,
+        "drivers": driver_cache.stats(),
+        "notices": notice_cache.stats(),
+        "versions": version_cache.stats()
+    }
+
+# A Driver's Own Row Changed (row_version Was Bumped)
+def _driver_changed(driver_id):
+    driver_cache.invalidate(driver_id)
+    version_cache.invalidate(driver_id)
+
+# Notices Belonging to These Drivers Changed (notices_version Was Bumped)
+def _notices_changed(*driver_ids):
+    for driver_id in set(driver_ids):
+        if driver_id is not None:
+            notice_cache.invalidate(driver_id)
+            version_cache.invalidate(driver_id)
+
+"""ZIP CODES"""
+
+# Known ZIP Codes, Loaded at Startup
+reg_zip_codes = ZipCodes()
+violation_zip_codes = ZipCodes()
+
+# Load Both ZIP Tables Into Memory
+@timed
+def load_zip_codes():
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT zip_code FROM reg_zip_code")
+        reg_zip_codes.load(row[0] for row in cursor.fetchall())
+
+        cursor.execute("SELECT zip_code FROM violation_zip_code")
+        violation_zip_codes.load(row[0] for row in cursor.fetchall())
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+# ZIP Lookups Answered From Memory (Hits) vs Sent to MySQL (Misses)
+def zip_code_stats():
+    return {
+        "registration": reg_zip_codes.stats(),
+        "violation": violation_zip_codes.stats()
+    }
+
+# Make Sure a Registration ZIP Exists
+# No round trip at all when the ZIP is already known
+def _ensure_reg_zip(cursor, address):
+    if not reg_zip_codes.known(address.zip_code):
+        cursor.execute(
+            """
+            INSERT IGNORE INTO reg_zip_code (zip_code, state, city)
+            VALUES (%s, %s, %s)
+            """,
+            (address.zip_code, address.state, address.city)
+        )
+
+# Make Sure a Violation ZIP Exists
+def _ensure_violation_zip(cursor, violation_zip):
+    if not violation_zip_codes.known(violation_zip.zip_code):
+        cursor.execute(
+            """
+            INSERT IGNORE INTO violation_zip_code (zip_code, state, city, district)
+            VALUES (%s, %s, %s, %s)
+            """,
+            (
+                violation_zip.zip_code,
+                violation_zip.state,
+                violation_zip.city,
+                violation_zip.district
+            )
+        )
+
+"""SUMMARIES"""
+
+# Summary tables behind /reports. Every write that touches notices applies
+# its change as a set-based delta in the same transaction: sign=-1 while
+# the notices still hold their old values, sign=+1 once they hold the new
+# ones. rebuild_summaries() recomputes everything from scratch.
+
+# Filter Matching a List of Notices
+def _by_notice_ids(notice_ids):
+    return (
+        "notice_info.notice_id IN (" + ", ".join(["%s"] * len(notice_ids)) + ")",
+        list(notice_ids)
+    )
+
+# Counts by Severity, Status, District and Month
+def _count_notices(cursor, where: str, params, sign: int):
+    cursor.execute(
+        f"""
+        INSERT INTO notice_summary (
+            violation_severity,
+            notice_status,
+            district,
+            violation_month,
+            notice_count
+        )
+        SELECT notice_info.violation_severity,
+               notice_info.notice_status,
+               violation_zip_code.district,
+               DATE_FORMAT(notice_info.violation_date_time, '%%Y-%%m'),
+               %s * COUNT(*)
+        FROM notice_info
+        JOIN violation_address ON notice_info.address_id = violation_address.address_id
+        JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
+        WHERE {where}
+        GROUP BY 1, 2, 3, 4
+        ON DUPLICATE KEY UPDATE notice_count = notice_count + VALUES(notice_count)
+        """,
+        [sign, *params]
+    )
+
+# Violations Outside the Driver's Home State, per Driver
+def _count_out_of_state(cursor, where: str, params, sign: int):
+    cursor.execute(
+        f"""
+        INSERT INTO out_of_state_summary (driver_id, notice_count)
+        SELECT car_details.driver_id, %s * COUNT(*)
+        FROM notice_info
+        JOIN car_details ON notice_info.car_id = car_details.car_id
+        JOIN driver_details ON car_details.driver_id = driver_details.driver_id
+        JOIN reg_address ON driver_details.address_id = reg_address.address_id
+        JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
+        JOIN violation_address ON notice_info.address_id = violation_address.address_id
+        JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
+        WHERE reg_zip_code.state != violation_zip_code.state
+          AND {where}
+        GROUP BY car_details.driver_id
+        ON DUPLICATE KEY UPDATE notice_count = notice_count + VALUES(notice_count)
+        """,
+        [sign, *params]
+    )
+
+# Apply Notices to Both Summaries
+def _summarise_notices(cursor, notice_ids, sign: int):
+    where, params = _by_notice_ids(notice_ids)
+
+    _count_notices(cursor, where, params, sign)
+    _count_out_of_state(cursor, where, params, sign)
+
+# Invalidate ETags of Every Driver Owning These Notices
+def _bump_notice_versions(cursor, notice_ids):
+    where, params = _by_notice_ids(notice_ids)
+
+    cursor.execute(
+        f"""
+        UPDATE driver_details
+        JOIN car_details ON car_details.driver_id = driver_details.driver_id
+        JOIN notice_info ON notice_info.car_id = car_details.car_id
+        SET driver_details.notices_version = driver_details.notices_version + 1
+        WHERE {where}
+        """,
+        params
+    )
+
+# Recount One Driver's Out-of-State Violations
+# Used when the driver's home address (and so home state) changes
+def _recount_out_of_state(cursor, driver_id: int):
+    cursor.execute(
+        "DELETE FROM out_of_state_summary WHERE driver_id = %s",
+        (driver_id,)
+    )
+
+    _count_out_of_state(cursor, "car_details.driver_id = %s", [driver_id], 1)
+
 """GET"""
 
-# Get Driver's Details by ID
-def fetch_driver_details(driver_id: int):
+# Columns the API Returns, in SELECT Order
+# Rows leave db_raw as dicts keyed by these names, ready for the response
+DRIVER_COLUMNS = (
+    "driver_id", "licence_number", "state_issue", "last_name", "first_name",
+    "dob", "height_inches", "weight_pounds", "eyes_colour"
+)
+
+NOTICE_COLUMNS = (
+    "notice_id", "violation_date_time", "detachment", "violation_severity",
+    "notice_status", "notification_sent", "entry_date", "expiry_date",
+    "violation_description"
+)
+
+# Notice Columns a Client May Write (notification_sent Belongs to the Outbox)
+NOTICE_WRITABLE = tuple(column for column in NOTICE_COLUMNS[1:] if column != "notification_sent")
+
+DRIVER_SELECT = ", ".join(DRIVER_COLUMNS)
+NOTICE_SELECT = ", ".join(f"notice_info.{column}" for column in NOTICE_COLUMNS)
+
+# Driver Row -> Output Dict
+def _driver(row):
+    if row is None:
+        return None
+
+    return dict(zip(DRIVER_COLUMNS, row))
+
+# Notice Row -> Output Dict (MySQL BOOL Arrives as 0/1)
+def _notice(row):
+    if row is None:
+        return None
+
+    notice = dict(zip(NOTICE_COLUMNS, row))
+    notice["notification_sent"] = bool(notice["notification_sent"])
+
+    return notice
+
+# Versions Behind a Driver's ETags: (row_version, notices_version)
+# Cached like the rows, so a repeat GET or a 304 needs no round trip at all;
+# on a miss it is one primary key lookup
+@timed
+def fetch_driver_versions(driver_id: int):
+    # Served From Cache When Possible
+    if config.CACHE_ENABLED:
+        versions = version_cache.get(driver_id)
+
+        if versions is not MISSING:
+            return versions
+
+        version = version_cache.version()
+
     # Open SQL Connection
     conn = get_connection()
     cursor = conn.cursor()
 
-    # SQL Query
-    query = """SELECT *
-    FROM driver_details
-    WHERE driver_id = %s;
-    """
+    try:
+        # Execute Query
+        cursor.execute(
+            "SELECT row_version, notices_version FROM driver_details WHERE driver_id = %s",
+            (driver_id,)
+        )
+        row = cursor.fetchone()
 
-    # Execute Query
-    cursor.execute(query, (driver_id,))
-    row = cursor.fetchone()
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
 
     # Close Connection
     cursor.close()
     conn.close()
 
+    # Remember Drivers That Exist
+    if config.CACHE_ENABLED and row is not None:
+        version_cache.set(driver_id, row, driver_id, version)
+
     # Output Results
     return row
 
-# Get Notices Based on the Driver's ID
-def fetch_driver_notices(driver_id: int):
-    # Open SQL Bridge
+# Get Driver's Details by ID
+# Cached as (row_version, row); row_version is the newest version the caller
+# has seen, and an older entry (left by a write in another process) is skipped
+@timed
+def fetch_driver_details(driver_id: int, row_version: int = None):
+    # Served From Cache When Possible
+    if config.CACHE_ENABLED:
+        cached = driver_cache.get(driver_id)
+
+        if cached is not MISSING and (row_version is None or cached[0] >= row_version):
+            return cached[1]
+
+        version = driver_cache.version()
+
+    # Open SQL Connection
     conn = get_connection()
     cursor = conn.cursor()
 
-    # SQL Query
+    try:
+        # SQL Query
+        query = f"""SELECT row_version, {DRIVER_SELECT}
+        FROM driver_details
+        WHERE driver_id = %s;
+        """
+
+        # Execute Query
+        cursor.execute(query, (driver_id,))
+        result = cursor.fetchone()
+        row = _driver(result[1:]) if result is not None else None
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+    # Remember Drivers That Exist
+    if config.CACHE_ENABLED and row is not None:
+        driver_cache.set(driver_id, (result[0], row), driver_id, version)
+
+    # Output Results
+    return row
+
+# Build the Driver Notice Listing: (query, params)
+def _driver_notices_query(driver_id: int, severity, status, date_from, date_to, after, limit: int):
     """
         Extracts the notice details based solely
         on the driver's ID. The normalisation indirectly
         links the driver's ID and notice ID field through
         the car's ID, since the notices are directly
         written on cars and inherited to the owner.
+        The filters line up with idx_notice_car_time and
+        idx_notice_car_filters on notice_info, which pick
+        the rows; the returned columns (the description
+        included) are then read from the rows themselves,
+        so neither index covers the query.
     """
 
-    query = """
-    SELECT *
-    FROM notice_info
-    JOIN car_details ON notice_info.car_id = car_details.car_id
+    query = f"""
+    SELECT {NOTICE_SELECT}
+    FROM car_details
+    JOIN notice_info ON notice_info.car_id = car_details.car_id
     WHERE car_details.driver_id = %s
     """
+    params = [driver_id]
+
+    # Filters
+    if severity is not None:
+        query += " AND notice_info.violation_severity = %s"
+        params.append(severity)
+
+    if status is not None:
+        query += " AND notice_info.notice_status = %s"
+        params.append(status)
+
+    if date_from is not None:
+        query += " AND notice_info.violation_date_time >= %s"
+        params.append(date_from)
+
+    if date_to is not None:
+        query += " AND notice_info.violation_date_time < %s"
+        params.append(date_to)
+
+    # Continue After the Last (violation_date_time, notice_id) Seen
+    if after is not None:
+        query += """
+        AND (notice_info.violation_date_time < %s
+             OR (notice_info.violation_date_time = %s AND notice_info.notice_id < %s))
+        """
+        params.extend([after[0], after[0], after[1]])
+
+    query += """
+    ORDER BY notice_info.violation_date_time DESC, notice_info.notice_id DESC
+    LIMIT %s
+    """
+    params.append(limit)
+
+    return query, params
+
+# Get Notices Based on the Driver's ID
+# Optional filters plus keyset pagination, newest violation first
+@timed
+def fetch_driver_notices(
+    driver_id: int,
+    severity=None,
+    status=None,
+    date_from=None,
+    date_to=None,
+    after=None,
+    limit: int = 50,
+    notices_version: int = None
+):
+    # Served From Cache When Possible
+    # The version in the key keeps pages cached before another process wrote apart
+    if config.CACHE_ENABLED:
+        key = (driver_id, severity, status, date_from, date_to, after, limit, notices_version)
+        rows = notice_cache.get(key)
+
+        if rows is not MISSING:
+            return rows
+
+        version = notice_cache.version()
+
+    # Open SQL Bridge
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SQL Query
+        query, params = _driver_notices_query(driver_id, severity, status, date_from, date_to, after, limit)
+
+        # Execute Query
+        cursor.execute(query, params)
+        rows = [_notice(row) for row in cursor.fetchall()]
 
-    # Execute Query
-    cursor.execute(query, (driver_id,))
-    row = cursor.fetchone()
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
 
     # Close Connection
     cursor.close()
     conn.close()
 
+    if config.CACHE_ENABLED:
+        notice_cache.set(key, rows, driver_id, version)
+
     # Output Results
-    return row
+    return rows
 
-# Get All Drivers
-def fetch_all_drivers():
+# Get a Page of Drivers
+# Keyset pagination on driver_id, so every page is an index range scan
+@timed
+def fetch_drivers_page(after: int, limit: int):
     # Open an SQL Bridge
     conn = get_connection()
     cursor = conn.cursor()
 
+    try:
+        # Query
+        query = """
+        SELECT driver_id, state_issue, last_name, first_name
+        FROM driver_details
+        WHERE driver_id > %s
+        ORDER BY driver_id
+        LIMIT %s
+        """
+
+        # Execute Query
+        cursor.execute(query, (after, limit))
+        rows = cursor.fetchall()
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+    # Output Results
+    return rows
+
+# Stream All Drivers
+# Server-side cursor, yields lists of at most chunk_size rows
+@timed
+def stream_drivers(after: int, chunk_size: int):
+    # Open an SQL Bridge
+    conn = get_connection()
+    cursor = conn.cursor(MySQLdb.cursors.SSCursor)
+    finished = False
+
     # Query
     query = """
     SELECT driver_id, state_issue, last_name, first_name
     FROM driver_details
+    WHERE driver_id > %s
+    ORDER BY driver_id
     """
 
-    # Execute Query
-    cursor.execute(query)
-    row = cursor.fetchall()
+    try:
+        # Execute Query
+        cursor.execute(query, (after,))
+
+        # Hand Rows Over Chunk by Chunk
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+
+            if not rows:
+                break
+
+            yield rows
+
+        finished = True
+
+    # Close Connection
+    finally:
+        if finished:
+            cursor.close()
+            conn.close()
+        else:
+            # Abandoned Mid-Result – Drop the Connection Rather Than Drain It
+            conn.discard()
+
+"""SEARCH"""
+
+# Ranked search on the FULLTEXT indexes (ft_notice_description and
+# ft_driver_name). Both use BOOLEAN MODE with the same terms. Hits are
+# ranked and paged in a derived table over notice_info / driver_details
+# alone, so the joins only ever see one page.
+
+# InnoDB's Default FULLTEXT Stopwords (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD)
+# They are never indexed, so a required stopword would match nothing
+FULLTEXT_STOPWORDS = frozenset((
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for",
+    "from", "how", "i", "in", "is", "it", "la", "of", "on", "or", "that", "the",
+    "this", "to", "was", "what", "when", "where", "who", "will", "with", "und", "www"
+))
+
+# "jo smi" -> "+jo* +smi*": Every Word Required, Matched as a Prefix
+# Empty when no word is left, and the search then returns no hits
+def _prefix_query(text: str):
+    words = [word for word in re.findall(r"\w+", text.lower()) if word not in FULLTEXT_STOPWORDS]
+
+    return " ".join(f"+{word}*" for word in words)
+
+# Notices Whose Description Matches Every Word, Best First
+@timed
+def search_notices(text: str, offset: int, limit: int):
+    terms = _prefix_query(text)
+
+    if not terms:
+        return []
+
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SQL Query
+        query = f"""
+        SELECT {NOTICE_SELECT}, car_details.driver_id, hits.score
+        FROM (
+            SELECT notice_id,
+                   MATCH (violation_description) AGAINST (%s IN BOOLEAN MODE) AS score
+            FROM notice_info
+            WHERE MATCH (violation_description) AGAINST (%s IN BOOLEAN MODE)
+            ORDER BY score DESC, notice_id
+            LIMIT %s OFFSET %s
+        ) AS hits
+        JOIN notice_info ON notice_info.notice_id = hits.notice_id
+        JOIN car_details ON notice_info.car_id = car_details.car_id
+        ORDER BY hits.score DESC, hits.notice_id
+        """
+
+        # Execute Query
+        cursor.execute(query, (terms, terms, limit, offset))
+        rows = cursor.fetchall()
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+    # Output Results
+    return [
+        {**_notice(row[:-2]), "driver_id": row[-2], "score": float(row[-1])}
+        for row in rows
+    ]
+
+# Drivers Whose First and Last Name Match Every Word, Best First
+@timed
+def search_drivers(text: str, offset: int, limit: int):
+    terms = _prefix_query(text)
+
+    if not terms:
+        return []
+
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SQL Query
+        query = """
+        SELECT driver_id, state_issue, last_name, first_name,
+               MATCH (first_name, last_name) AGAINST (%s IN BOOLEAN MODE) AS score
+        FROM driver_details
+        WHERE MATCH (first_name, last_name) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY score DESC, driver_id
+        LIMIT %s OFFSET %s
+        """
+
+        # Execute Query
+        cursor.execute(query, (terms, terms, limit, offset))
+        rows = cursor.fetchall()
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+    # Output Results
+    return [
+        {
+            "driver_id": row[0],
+            "state_issue": row[1],
+            "last_name": row[2],
+            "first_name": row[3],
+            "score": float(row[4])
+        }
+        for row in rows
+    ]
+
+"""OFFICERS"""
+
+# Get an Officer's Login Details
+@timed
+def fetch_officer_credentials(username: str):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SQL Query
+        query = """
+        SELECT badge_number, password_hash
+        FROM officer_info
+        WHERE username = %s
+        """
+
+        # Execute Query
+        cursor.execute(query, (username,))
+        row = cursor.fetchone()
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
 
     # Close Connection
     cursor.close()
@@ -97,30 +713,164 @@ def fetch_all_drivers():
     # Output Results
     return row
 
-"""POST"""
+# Store a Rehashed Password
+@timed
+def update_officer_password(badge_number: str, password_hash: str):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
 
-# Create a New Driver
-def create_driver(driver, address):
+    try:
+        cursor.execute(
+            "UPDATE officer_info SET password_hash = %s WHERE badge_number = %s",
+            (password_hash, badge_number)
+        )
+
+        conn.commit()
+
+    # In case things go south – roll back
+    except Exception:
+        conn.rollback()
+        raise
+
+    # Final Leg of the Journey
+    finally:
+        cursor.close()
+        conn.close()
+
+"""SELF-SERVICE"""
+
+# Get a Driver's Login Details
+@timed
+def fetch_driver_credentials(username: str):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SQL Query
+        query = """
+        SELECT driver_id, password_hash
+        FROM driver_login
+        WHERE username = %s
+        """
+
+        # Execute Query
+        cursor.execute(query, (username,))
+        row = cursor.fetchone()
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+    # Output Results
+    return row
+
+# Store a Rehashed Driver Password
+@timed
+def update_driver_password(driver_id: int, password_hash: str):
     # Open SQL Connection
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        # First, Check ZIP
         cursor.execute(
-            "SELECT 1 FROM reg_zip_code WHERE zip_code = %s",
-            (address.zip_code,)
+            "UPDATE driver_login SET password_hash = %s WHERE driver_id = %s",
+            (password_hash, driver_id)
         )
 
-        # Then, If the ZIP doesn't exist, we can insert it
-        if cursor.fetchone() is None:
-            cursor.execute(
-                """
-                INSERT INTO reg_zip_code (zip_code, state, city)
-                VALUES (%s, %s, %s)
-                """,
-                (address.zip_code, address.state, address.city)
-            )
+        conn.commit()
+
+    # In case things go south – roll back
+    except Exception:
+        conn.rollback()
+        raise
+
+    # Final Leg of the Journey
+    finally:
+        cursor.close()
+        conn.close()
+
+# Get the Signed-In Driver's Own Notices
+# Same columns the old per-driver views exposed, one indexed join
+# parameterised by driver_id, keyset paged on notice_id
+@timed
+def fetch_my_notices(driver_id: int, after: str, limit: int):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SQL Query
+        query = """
+        SELECT
+            driver_details.driver_id,
+            driver_details.first_name,
+            driver_details.last_name,
+            car_details.licence_plate,
+            car_details.make,
+            car_details.car_type,
+            car_details.year_production,
+            car_details.plate_state_issue,
+            car_details.vin,
+            car_details.colour,
+            notice_info.notice_id,
+            notice_info.violation_description,
+            notice_info.violation_severity,
+            notice_info.notice_status,
+            notice_info.violation_date_time,
+            reg_zip_code.state,
+            reg_zip_code.city,
+            violation_zip_code.state,
+            violation_zip_code.city,
+            violation_zip_code.district,
+            violation_address.street
+        FROM driver_details
+        JOIN car_details ON driver_details.driver_id = car_details.driver_id
+        JOIN notice_info ON car_details.car_id = notice_info.car_id
+        JOIN reg_address ON driver_details.address_id = reg_address.address_id
+        JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
+        JOIN violation_address ON notice_info.address_id = violation_address.address_id
+        JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
+        WHERE driver_details.driver_id = %s
+          AND notice_info.notice_id > %s
+        ORDER BY notice_info.notice_id
+        LIMIT %s
+        """
+
+        # Execute Query
+        cursor.execute(query, (driver_id, after, limit))
+        rows = cursor.fetchall()
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+    # Output Results
+    return rows
+
+"""POST"""
+
+# Create a New Driver
+@timed
+def create_driver(driver, address):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # First, Make Sure the ZIP Exists
+        _ensure_reg_zip(cursor, address)
 
         # Then, Insert Address
         cursor.execute(
@@ -164,7 +914,8 @@ def create_driver(driver, address):
 
         driver_id = cursor.lastrowid
         conn.commit()
-        
+        reg_zip_codes.add(address.zip_code)
+
         return driver_id
 
     # In case things go south – roll back
@@ -178,6 +929,7 @@ def create_driver(driver, address):
         conn.close()
 
 # Create a New Notice
+@timed
 def create_notice(notice, violation_zip, violation_address):
     # Open SQL Connection
     conn = get_connection()
@@ -185,41 +937,20 @@ def create_notice(notice, violation_zip, violation_address):
 
     # Main Leg
     try:
-        # First, Check That The Car Exists
+        # First, Check That The Car Exists (and Who Owns It)
         cursor.execute(
-            "SELECT 1 FROM car_details WHERE car_id = %s",
+            "SELECT driver_id FROM car_details WHERE car_id = %s",
             (notice.car_id,)
         )
 
+        car = cursor.fetchone()
+
         # If Not, Throw Error
-        if cursor.fetchone() is None:
+        if car is None:
             raise ValueError("Car does not exist. Cannot issue notice.")
 
-        # Then, Check ZIP Code For Violation
-        cursor.execute(
-            "SELECT 1 FROM violation_zip_code WHERE zip_code = %s",
-            (violation_zip.zip_code,)
-        )
-
-        # If ZIP doesn't exist, insert it
-        if cursor.fetchone() is None:
-            cursor.execute(
-                """
-                INSERT INTO violation_zip_code (
-                    zip_code,
-                    state,
-                    city,
-                    district
-                )
-                VALUES (%s, %s, %s, %s)
-                """,
-                (
-                    violation_zip.zip_code,
-                    violation_zip.state,
-                    violation_zip.city,
-                    violation_zip.district
-                )
-            )
+        # Then, Make Sure the Violation ZIP Exists
+        _ensure_violation_zip(cursor, violation_zip)
 
         # Then, Insert Violation Address
         cursor.execute(
@@ -239,6 +970,7 @@ def create_notice(notice, violation_zip, violation_address):
         address_id = cursor.lastrowid
 
         # Finally, Insert Notice
+        # notification_sent is server-owned: FALSE until the outbox delivers it
         cursor.execute(
             """
             INSERT INTO notice_info (
@@ -254,7 +986,7 @@ def create_notice(notice, violation_zip, violation_address):
                 expiry_date,
                 violation_description
             )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, FALSE, %s, %s, %s)
             """,
             (
                 notice.notice_id,
@@ -264,14 +996,19 @@ def create_notice(notice, violation_zip, violation_address):
                 notice.detachment,
                 notice.violation_severity,
                 notice.notice_status,
-                notice.notification_sent,
                 notice.entry_date,
                 notice.expiry_date,
                 notice.violation_description
             )
         )
 
+        # Count It in the Report Summaries
+        _summarise_notices(cursor, [notice.notice_id], 1)
+        _bump_notice_versions(cursor, [notice.notice_id])
+
         conn.commit()
+        violation_zip_codes.add(violation_zip.zip_code)
+        _notices_changed(car[0])
 
         return notice.notice_id
 
@@ -285,24 +1022,382 @@ def create_notice(notice, violation_zip, violation_address):
         cursor.close()
         conn.close()
 
+"""BULK"""
+
+# One Multi-Row INSERT, Returns the First Generated ID
+# See _generated_ids for the IDs of the other rows
+def _insert_many(cursor, prefix: str, placeholder: str, rows):
+    cursor.execute(
+        prefix + " " + ", ".join([placeholder] * len(rows)),
+        [value for row in rows for value in row]
+    )
+
+    if cursor.rowcount != len(rows):
+        raise MySQLdb.DatabaseError("Multi-row insert wrote an unexpected number of rows")
+
+    return cursor.lastrowid
+
+# Gap Between Consecutive AUTO_INCREMENT Values (>1 Under Multi-Primary Replication)
+def _autoinc_step(cursor):
+    cursor.execute("SELECT @@SESSION.auto_increment_increment")
+    return cursor.fetchone()[0]
+
+# IDs a Multi-Row INSERT Generated, Checked Against the Rows Themselves
+# InnoDB normally gives one INSERT a block of AUTO_INCREMENT values `step`
+# apart, so row n got first_id + n * step. With innodb_autoinc_lock_mode=2
+# concurrent inserts can interleave, so the rows at those IDs are read back
+# and compared on `columns`; any mismatch fails the chunk, whose retry row by
+# row uses each insert's own lastrowid
+def _generated_ids(cursor, table: str, id_column: str, columns, first_id: int, step: int, rows):
+    # A Single Row's ID Is Exactly lastrowid
+    if len(rows) == 1:
+        return [first_id]
+
+    ids = [first_id + n * step for n in range(len(rows))]
+
+    cursor.execute(
+        f"SELECT {', '.join(columns)} FROM {table} "
+        f"WHERE {id_column} IN ({', '.join(['%s'] * len(ids))}) ORDER BY {id_column}",
+        ids
+    )
+
+    if [tuple(row) for row in cursor.fetchall()] != [tuple(row) for row in rows]:
+        raise MySQLdb.DatabaseError(f"Multi-row insert into {table} was not given consecutive IDs")
+
+    return ids
+
+# Readable Message From a MySQLdb Error
+def _error_message(error):
+    if len(error.args) > 1:
+        return str(error.args[1])
+
+    return str(error)
+
+# Insert Drivers and Their Addresses, Returns the New driver_ids
+def _insert_drivers(cursor, drivers):
+    # Each Distinct, Not Yet Known ZIP Once
+    zips = {}
+
+    for driver in drivers:
+        address = driver.address
+
+        if address.zip_code not in zips and not reg_zip_codes.known(address.zip_code):
+            zips[address.zip_code] = (address.zip_code, address.state, address.city)
+
+    if zips:
+        cursor.executemany(
+            """
+            INSERT IGNORE INTO reg_zip_code (zip_code, state, city)
+            VALUES (%s, %s, %s)
+            """,
+            list(zips.values())
+        )
+
+    step = _autoinc_step(cursor) if len(drivers) > 1 else 1
+
+    # Then, Insert Addresses
+    addresses = [
+        (driver.address.zip_code, driver.address.street, driver.address.house)
+        for driver in drivers
+    ]
+
+    first_address_id = _insert_many(
+        cursor,
+        "INSERT INTO reg_address (zip_code, street, house) VALUES",
+        "(%s, %s, %s)",
+        addresses
+    )
+
+    address_ids = _generated_ids(
+        cursor, "reg_address", "address_id", ("zip_code", "street", "house"),
+        first_address_id, step, addresses
+    )
+
+    # Then, Insert Drivers Pointing at Them
+    first_driver_id = _insert_many(
+        cursor,
+        """
+        INSERT INTO driver_details (
+            address_id,
+            licence_number,
+            state_issue,
+            last_name,
+            first_name,
+            dob,
+            height_inches,
+            weight_pounds,
+            eyes_colour
+        )
+        VALUES
+        """,
+        "(%s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        [
+            (
+                address_id,
+                driver.licence_number,
+                driver.state_issue,
+                driver.last_name,
+                driver.first_name,
+                driver.dob,
+                driver.height_inches,
+                driver.weight_pounds,
+                driver.eyes_colour
+            )
+            for address_id, driver in zip(address_ids, drivers)
+        ]
+    )
+
+    return _generated_ids(
+        cursor, "driver_details", "driver_id", ("address_id", "licence_number"),
+        first_driver_id, step,
+        [(address_id, driver.licence_number) for address_id, driver in zip(address_ids, drivers)]
+    )
+
+# Create a Chunk of Drivers
+# rows is a list of (index, DriverCreate), one transaction per chunk
+@timed
+def create_drivers_bulk(rows):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # Whole Chunk at Once
+        try:
+            driver_ids = _insert_drivers(cursor, [driver for _, driver in rows])
+            conn.commit()
+            reg_zip_codes.add(*(driver.address.zip_code for _, driver in rows))
+
+            return [
+                {"index": index, "driver_id": driver_id}
+                for (index, _), driver_id in zip(rows, driver_ids)
+            ]
+
+        except MySQLdb.Error:
+            conn.rollback()
+
+        # Chunk Rejected – Retry Row by Row So a Bad Record Only Fails Itself
+        results = []
+
+        for index, driver in rows:
+            try:
+                driver_id = _insert_drivers(cursor, [driver])[0]
+                conn.commit()
+                reg_zip_codes.add(driver.address.zip_code)
+                results.append({"index": index, "driver_id": driver_id})
+
+            except MySQLdb.Error as error:
+                conn.rollback()
+                results.append({"index": index, "error": _error_message(error)})
+
+        return results
+
+    # In case things go south – roll back
+    except Exception:
+        conn.rollback()
+        raise
+
+    # Final Leg of the Journey
+    finally:
+        cursor.close()
+        conn.close()
+
+# Insert Notices and Their Violation Addresses
+def _insert_notices(cursor, notices):
+    # Each Distinct, Not Yet Known Violation ZIP Once
+    zips = {}
+
+    for notice in notices:
+        zip_code = notice.violation_zip
+
+        if zip_code.zip_code not in zips and not violation_zip_codes.known(zip_code.zip_code):
+            zips[zip_code.zip_code] = (
+                zip_code.zip_code,
+                zip_code.state,
+                zip_code.city,
+                zip_code.district
+            )
+
+    if zips:
+        cursor.executemany(
+            """
+            INSERT IGNORE INTO violation_zip_code (zip_code, state, city, district)
+            VALUES (%s, %s, %s, %s)
+            """,
+            list(zips.values())
+        )
+
+    # Then, Insert Violation Addresses
+    addresses = [
+        (notice.violation_zip.zip_code, notice.violation_address.street)
+        for notice in notices
+    ]
+
+    first_address_id = _insert_many(
+        cursor,
+        "INSERT INTO violation_address (zip_code, street) VALUES",
+        "(%s, %s)",
+        addresses
+    )
+
+    address_ids = _generated_ids(
+        cursor, "violation_address", "address_id", ("zip_code", "street"),
+        first_address_id, _autoinc_step(cursor) if len(notices) > 1 else 1, addresses
+    )
+
+    # Finally, Insert Notices
+    # notification_sent is server-owned: FALSE until the outbox delivers them
+    cursor.executemany(
+        """
+        INSERT INTO notice_info (
+            notice_id,
+            car_id,
+            address_id,
+            violation_date_time,
+            detachment,
+            violation_severity,
+            notice_status,
+            notification_sent,
+            entry_date,
+            expiry_date,
+            violation_description
+        )
+        VALUES (%s, %s, %s, %s, %s, %s, %s, FALSE, %s, %s, %s)
+        """,
+        [
+            (
+                notice.notice_id,
+                notice.car_id,
+                address_id,
+                notice.violation_date_time,
+                notice.detachment,
+                notice.violation_severity,
+                notice.notice_status,
+                notice.entry_date,
+                notice.expiry_date,
+                notice.violation_description
+            )
+            for address_id, notice in zip(address_ids, notices)
+        ]
+    )
+
+    # Count Them in the Report Summaries
+    _summarise_notices(cursor, [notice.notice_id for notice in notices], 1)
+    _bump_notice_versions(cursor, [notice.notice_id for notice in notices])
+
+# Create a Chunk of Notices
+# rows is a list of (index, NoticeCreate), one transaction per chunk
+@timed
+def create_notices_bulk(rows):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # Check Every Car in One Query
+        car_ids = sorted({notice.car_id for _, notice in rows})
+
+        cursor.execute(
+            "SELECT car_id, driver_id FROM car_details WHERE car_id IN ("
+            + ", ".join(["%s"] * len(car_ids)) + ")",
+            car_ids
+        )
+
+        owners = dict(cursor.fetchall())
+
+        # Unknown Cars Fail Up Front
+        results = []
+        valid = []
+
+        for index, notice in rows:
+            if notice.car_id in owners:
+                valid.append((index, notice))
+            else:
+                results.append({
+                    "index": index,
+                    "notice_id": notice.notice_id,
+                    "error": "Car does not exist. Cannot issue notice."
+                })
+
+        if not valid:
+            return results
+
+        # Whole Chunk at Once
+        try:
+            _insert_notices(cursor, [notice for _, notice in valid])
+            conn.commit()
+            violation_zip_codes.add(*(notice.violation_zip.zip_code for _, notice in valid))
+            _notices_changed(*(owners[notice.car_id] for _, notice in valid))
+
+            return results + [
+                {"index": index, "notice_id": notice.notice_id}
+                for index, notice in valid
+            ]
+
+        except MySQLdb.Error:
+            conn.rollback()
+
+        # Chunk Rejected – Retry Row by Row So a Bad Record Only Fails Itself
+        for index, notice in valid:
+            try:
+                _insert_notices(cursor, [notice])
+                conn.commit()
+                violation_zip_codes.add(notice.violation_zip.zip_code)
+                _notices_changed(owners[notice.car_id])
+                results.append({"index": index, "notice_id": notice.notice_id})
+
+            except MySQLdb.Error as error:
+                conn.rollback()
+                results.append({
+                    "index": index,
+                    "notice_id": notice.notice_id,
+                    "error": _error_message(error)
+                })
+
+        return results
+
+    # In case things go south – roll back
+    except Exception:
+        conn.rollback()
+        raise
+
+    # Final Leg of the Journey
+    finally:
+        cursor.close()
+        conn.close()
+
 """DELETE"""
 
 # Delete Notice by ID
+@timed
 def delete_notice(notice_id: str):
     # Connect to the Database
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        # First, Check Notice Exists
+        # First, Check Notice Exists (and Whose Car It Is On)
+        # Owner and Hotspot Facts, Locked Until the Delete Commits
         cursor.execute(
-            "SELECT 1 FROM notice_info WHERE notice_id = %s",
+            f"""
+            SELECT {NOTICE_FACTS_COLUMNS}, car_details.driver_id
+            {NOTICE_FACTS_TABLES}
+            JOIN car_details ON notice_info.car_id = car_details.car_id
+            WHERE notice_info.notice_id = %s
+            FOR UPDATE OF notice_info
+            """,
             (notice_id,)
         )
 
+        facts = cursor.fetchone()
+
         # Notice Not Found
-        if cursor.fetchone() is None:
-            return False 
+        if facts is None:
+            return False
+
+        # Take It Out of the Report Summaries
+        _summarise_notices(cursor, [notice_id], -1)
+        _bump_notice_versions(cursor, [notice_id])
 
         # Delete Dependent Legal Actions First
         cursor.execute(
@@ -317,6 +1412,9 @@ def delete_notice(notice_id: str):
         )
 
         conn.commit()
+        _notices_changed(facts[-1])
+        notice_facts.remove([facts[:-1]])
+
         return True
 
     except Exception:
@@ -328,16 +1426,17 @@ def delete_notice(notice_id: str):
         conn.close()
 
 # Delete Driver by ID
-# Uses manual cascading
+# Set-based cascading: the same ten statements however many cars and notices
+@timed
 def delete_driver(driver_id: int):
     # Connect to SQL
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        # Check Driver Exists
+        # Check Driver Exists (and Lock the Row)
         cursor.execute(
-            "SELECT address_id FROM driver_details WHERE driver_id = %s",
+            "SELECT address_id FROM driver_details WHERE driver_id = %s FOR UPDATE",
             (driver_id,)
         )
 
@@ -348,53 +1447,89 @@ def delete_driver(driver_id: int):
 
         driver_address_id = result[0]
 
-        # Get All car_ids Owned by This Driver
+        # Hotspot Facts of Every Notice About to Go, Locked Until Commit
         cursor.execute(
-            "SELECT car_id FROM car_details WHERE driver_id = %s",
+            f"""
+            SELECT {NOTICE_FACTS_COLUMNS}
+            {NOTICE_FACTS_TABLES}
+            JOIN car_details ON notice_info.car_id = car_details.car_id
+            WHERE car_details.driver_id = %s
+            FOR UPDATE OF notice_info
+            """,
             (driver_id,)
         )
+        facts = cursor.fetchall()
+
+        # Take the Driver's Notices Out of the Report Summaries
+        _count_notices(
+            cursor,
+            "notice_info.car_id IN (SELECT car_id FROM car_details WHERE driver_id = %s)",
+            [driver_id],
+            -1
+        )
 
-        cars = cursor.fetchall()
-
-        for car in cars:
-            car_id = car[0]
-
-            # Get All Notices For This Car
-            cursor.execute(
-                "SELECT notice_id FROM notice_info WHERE car_id = %s",
-                (car_id,)
-            )
-
-            notices = cursor.fetchall()
+        cursor.execute(
+            "DELETE FROM out_of_state_summary WHERE driver_id = %s",
+            (driver_id,)
+        )
 
-            for notice in notices:
-                notice_id = notice[0]
+        # Delete Actions Linked to Any of the Driver's Notices
+        cursor.execute(
+            """
+            DELETE actions
+            FROM actions
+            JOIN notice_info ON actions.notice_id = notice_info.notice_id
+            JOIN car_details ON notice_info.car_id = car_details.car_id
+            WHERE car_details.driver_id = %s
+            """,
+            (driver_id,)
+        )
 
-                # Delete Actions Linked to Notice
-                cursor.execute(
-                    "DELETE FROM actions WHERE notice_id = %s",
-                    (notice_id,)
-                )
+        # Delete Notices on Any of the Driver's Cars
+        cursor.execute(
+            """
+            DELETE notice_info
+            FROM notice_info
+            JOIN car_details ON notice_info.car_id = car_details.car_id
+            WHERE car_details.driver_id = %s
+            """,
+            (driver_id,)
+        )
 
-                # Delete Notice
-                cursor.execute(
-                    "DELETE FROM notice_info WHERE notice_id = %s",
-                    (notice_id,)
-                )
+        # Delete Cars
+        cursor.execute(
+            "DELETE FROM car_details WHERE driver_id = %s",
+            (driver_id,)
+        )
 
-            # Delete Car
-            cursor.execute(
-                "DELETE FROM car_details WHERE car_id = %s",
-                (car_id,)
-            )
+        # Delete the Driver's Self-Service Login
+        cursor.execute(
+            "DELETE FROM driver_login WHERE driver_id = %s",
+            (driver_id,)
+        )
 
-        # Finally Delete Driver
+        # Delete Driver
         cursor.execute(
             "DELETE FROM driver_details WHERE driver_id = %s",
             (driver_id,)
         )
 
+        # Finally Delete the Registration Address, Unless Someone Else Uses It
+        cursor.execute(
+            """
+            DELETE FROM reg_address
+            WHERE address_id = %s
+              AND NOT EXISTS (SELECT 1 FROM driver_details WHERE address_id = %s)
+              AND NOT EXISTS (SELECT 1 FROM car_details WHERE address_id = %s)
+            """,
+            (driver_address_id, driver_address_id, driver_address_id)
+        )
+
         conn.commit()
+        _driver_changed(driver_id)
+        _notices_changed(driver_id)
+        notice_facts.remove(facts)
+
         return True
 
     except Exception:
@@ -405,215 +1540,535 @@ def delete_driver(driver_id: int):
         cursor.close()
         conn.close()
 
-"""PUT"""
+"""PUT / PATCH"""
 
-# Update Driver (Full PUT) and return updated row
-def update_driver(driver_id: int, payload):
+# PUT and PATCH share one path: each writes only the fields the payload
+# sets, in a single UPDATE (joined to the address table when the address
+# changes). The connection reports matched rather than changed rows
+# (CLIENT.FOUND_ROWS), so rowcount == 0 means "no such row" without a
+# SELECT first. A full payload is its own response; a partial one is
+# merged with the cached row, or with one read inside the transaction.
+
+# Fields a Payload Sets (None Means Leave the Column Alone)
+def _set_fields(payload, columns):
+    fields = {}
+
+    for column in columns:
+        value = getattr(payload, column, None)
+
+        if value is not None:
+            fields[column] = value
+
+    return fields
+
+# "table.column = %s, ..." and Its Parameters
+def _assignments(table: str, fields):
+    return (
+        [f"{table}.{column} = %s" for column in fields],
+        list(fields.values())
+    )
+
+# Write a Driver's Set Fields, Return the Updated Driver (None When Missing)
+def _update_driver(driver_id: int, payload):
+    fields = _set_fields(payload, DRIVER_COLUMNS[1:])
+    address = getattr(payload, "address", None)
+
+    # Nothing to Write
+    if not fields and address is None:
+        return fetch_driver_details(driver_id)
+
+    # The Row Before the Update, When Cached, Saves the Re-Read of a PATCH
+    # Only if it is the version this update replaced (checked below)
+    cached = MISSING
+
+    if config.CACHE_ENABLED and len(fields) < len(DRIVER_COLUMNS) - 1:
+        cached = driver_cache.get(driver_id)
 
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        # Check driver exists + get address_id
+        assignments, params = _assignments("driver_details", fields)
+        # LAST_INSERT_ID(expr) Hands the New Version Back as the Cursor's lastrowid
+        assignments.append("driver_details.row_version = LAST_INSERT_ID(driver_details.row_version + 1)")
+        tables = "driver_details"
+
+        if address is not None:
+            # Make Sure the ZIP Exists
+            _ensure_reg_zip(cursor, address)
+
+            tables += " JOIN reg_address ON reg_address.address_id = driver_details.address_id"
+            assignments += [
+                "reg_address.zip_code = %s",
+                "reg_address.street = %s",
+                "reg_address.house = %s"
+            ]
+            params += [address.zip_code, address.street, address.house]
+
+        # One Statement for Both Tables
         cursor.execute(
-            "SELECT address_id FROM driver_details WHERE driver_id = %s",
-            (driver_id,)
+            f"""
+            UPDATE {tables}
+            SET {", ".join(assignments)}
+            WHERE driver_details.driver_id = %s
+            """,
+            params + [driver_id]
         )
 
-        result = cursor.fetchone()
-
-        if result is None:
+        if cursor.rowcount == 0:
+            conn.rollback()
             return None
 
-        address_id = result[0]
+        # Read Before Any Other Statement Overwrites It
+        version = cursor.lastrowid
 
-        # Check ZIP exists
-        cursor.execute(
-            "SELECT 1 FROM reg_zip_code WHERE zip_code = %s",
-            (payload.address.zip_code,)
-        )
+        # Home State May Have Changed
+        if address is not None:
+            _recount_out_of_state(cursor, driver_id)
 
-        if cursor.fetchone() is None:
+        # Build the Response From the Update
+        # A cached row another process has since changed is re-read instead
+        if len(fields) == len(DRIVER_COLUMNS) - 1:
+            row = {"driver_id": driver_id, **fields}
+        elif cached is not MISSING and cached[0] + 1 == version:
+            row = {**cached[1], **fields}
+        else:
             cursor.execute(
-                """
-                INSERT INTO reg_zip_code (zip_code, state, city)
-                VALUES (%s, %s, %s)
-                """,
-                (
-                    payload.address.zip_code,
-                    payload.address.state,
-                    payload.address.city
-                )
+                f"SELECT {DRIVER_SELECT} FROM driver_details WHERE driver_id = %s",
+                (driver_id,)
             )
+            row = _driver(cursor.fetchone())
 
-        # Update Address
-        cursor.execute(
-            """
-            UPDATE reg_address
-            SET zip_code = %s,
-                street = %s,
-                house = %s
-            WHERE address_id = %s
-            """,
-            (
-                payload.address.zip_code,
-                payload.address.street,
-                payload.address.house,
-                address_id
-            )
+        conn.commit()
+
+        if address is not None:
+            reg_zip_codes.add(address.zip_code)
+
+        _driver_changed(driver_id)
+
+        return row
+
+    except Exception:
+        conn.rollback()
+        raise
+
+    finally:
+        cursor.close()
+        conn.close()
+
+# Update Driver (Full PUT) and Return the Updated Row
+@timed
+def update_driver(driver_id: int, payload):
+    return _update_driver(driver_id, payload)
+
+# Update Only the Driver Fields the Payload Sets (PATCH)
+@timed
+def patch_driver(driver_id: int, payload):
+    return _update_driver(driver_id, payload)
+
+# Whether an Update Moves a Notice Between Report Summary Rows
+# notice_summary groups by severity, status, district and month, and
+# out_of_state_summary by owner and violation state
+def _summary_moved(old, zip_code, owners, fields, violation_zip):
+    when = old["violation_date_time"]
+    moved_to = fields.get("violation_date_time", when)
+
+    return (
+        (violation_zip is not None and violation_zip.zip_code != zip_code)
+        or owners[0] != owners[1]
+        or fields.get("violation_severity", old["violation_severity"]) != old["violation_severity"]
+        or fields.get("notice_status", old["notice_status"]) != old["notice_status"]
+        or (moved_to.year, moved_to.month) != (when.year, when.month)
+    )
+
+# A Notice's Hotspot Facts Row, as NOTICE_FACTS_COLUMNS Reads It
+# (notice_seq, district, hour of week from Sunday 00:00, severity code)
+def _facts_row(seq: int, district: str, when, severity: str):
+    return (seq, district, when.isoweekday() % 7 * 24 + when.hour, SEVERITIES.index(severity))
+
+# A Notice and the Driver Who Owns It, Read on an Open Cursor
+def _select_notice(cursor, notice_id: str):
+    cursor.execute(
+        f"""
+        SELECT {NOTICE_SELECT}, car_details.driver_id
+        FROM notice_info
+        JOIN car_details ON notice_info.car_id = car_details.car_id
+        WHERE notice_info.notice_id = %s
+        """,
+        (notice_id,)
+    )
+    result = cursor.fetchone()
+
+    if result is None:
+        return None, None
+
+    return _notice(result[:-1]), result[-1]
+
+# Lock a Notice Before Updating It, Reading Everything the Update Needs
+# (notice, notice_seq, violation ZIP, its district, district of `zip_code`,
+# owner, owner of `car_id`), or None When Missing
+def _lock_notice(cursor, notice_id: str, car_id, zip_code):
+    cursor.execute(
+        f"""
+        SELECT {NOTICE_SELECT}, notice_info.notice_seq,
+               violation_address.zip_code, old_zip.district, new_zip.district,
+               old_car.driver_id, new_car.driver_id
+        FROM notice_info
+        JOIN violation_address ON violation_address.address_id = notice_info.address_id
+        JOIN violation_zip_code AS old_zip ON old_zip.zip_code = violation_address.zip_code
+        LEFT JOIN violation_zip_code AS new_zip ON new_zip.zip_code = %s
+        JOIN car_details AS old_car ON old_car.car_id = notice_info.car_id
+        LEFT JOIN car_details AS new_car ON new_car.car_id = %s
+        WHERE notice_info.notice_id = %s
+        FOR UPDATE OF notice_info, violation_address
+        """,
+        (zip_code, car_id, notice_id)
+    )
+    result = cursor.fetchone()
+
+    if result is None:
+        return None
+
+    return _notice(result[:-6]), *result[-6:]
+
+# Bump notices_version of These Drivers
+def _bump_driver_versions(cursor, driver_ids):
+    driver_ids = sorted({driver_id for driver_id in driver_ids if driver_id is not None})
+
+    cursor.execute(
+        "UPDATE driver_details SET notices_version = notices_version + 1 WHERE driver_id IN ("
+        + ", ".join(["%s"] * len(driver_ids)) + ")",
+        driver_ids
+    )
+
+# Write a Notice's Set Fields, Return the Updated Notice (None When Missing)
+# A write is 3 statements: the locking read, the UPDATE and the ETag bump.
+# An unknown violation ZIP adds its INSERT, and a change that moves the
+# notice between report summary rows adds 4 (2 to take it out, 2 to put it back)
+def _update_notice(notice_id: str, payload):
+    fields = _set_fields(payload, ("car_id", *NOTICE_WRITABLE))
+    violation_zip = getattr(payload, "violation_zip", None)
+    violation_address = getattr(payload, "violation_address", None)
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # Nothing to Write
+        if not fields and violation_zip is None and violation_address is None:
+            return _select_notice(cursor, notice_id)[0]
+
+        # The Row Before the Update, Locked Until Commit
+        # Gives the response, both owners, and the facts the summaries are keyed by
+        locked = _lock_notice(
+            cursor, notice_id, fields.get("car_id"), violation_zip.zip_code if violation_zip else None
         )
 
-        # Update Driver Details
+        if locked is None:
+            conn.rollback()
+            return None
+
+        old, seq, zip_code, district, new_district, owner, new_owner = locked
+        owners = (owner, new_owner if "car_id" in fields else owner)
+
+        # Take the Old Version Out of the Report Summaries, Only if It Moves
+        summarised = _summary_moved(old, zip_code, owners, fields, violation_zip)
+
+        if summarised:
+            _summarise_notices(cursor, [notice_id], -1)
+
+        assignments, params = _assignments("notice_info", fields)
+        tables = "notice_info"
+
+        if violation_zip is not None or violation_address is not None:
+            tables += " JOIN violation_address ON violation_address.address_id = notice_info.address_id"
+
+        if violation_zip is not None:
+            # Make Sure the Violation ZIP Exists
+            _ensure_violation_zip(cursor, violation_zip)
+
+            assignments.append("violation_address.zip_code = %s")
+            params.append(violation_zip.zip_code)
+
+        if violation_address is not None:
+            assignments.append("violation_address.street = %s")
+            params.append(violation_address.street)
+
+        # One Statement for Both Tables
         cursor.execute(
-            """
-            UPDATE driver_details
-            SET licence_number = %s,
-                state_issue = %s,
-                last_name = %s,
-                first_name = %s,
-                dob = %s,
-                height_inches = %s,
-                weight_pounds = %s,
-                eyes_colour = %s
-            WHERE driver_id = %s
+            f"""
+            UPDATE {tables}
+            SET {", ".join(assignments)}
+            WHERE notice_info.notice_id = %s
             """,
-            (
-                payload.licence_number,
-                payload.state_issue,
-                payload.last_name,
-                payload.first_name,
-                payload.dob,
-                payload.height_inches,
-                payload.weight_pounds,
-                payload.eyes_colour,
-                driver_id
-            )
+            params + [notice_id]
         )
 
+        if cursor.rowcount == 0:
+            conn.rollback()
+            return None
+
+        # Count the New Version
+        if summarised:
+            _summarise_notices(cursor, [notice_id], 1)
+
+        # Both Owners' Notice Lists Change When the Car Does
+        _bump_driver_versions(cursor, owners)
+
+        # Build the Response From the Locked Row and the Update
+        row = {**old, **fields}
+        row.pop("car_id", None)
+
         conn.commit()
 
-        # Return Updated Row
+        if violation_zip is not None:
+            violation_zip_codes.add(violation_zip.zip_code)
+
+        _notices_changed(*owners)
+
+        # Moved in Time, Place or Severity – Hotspot Columns Swap Its Facts
+        # A new ZIP unknown before the update got the payload's district
+        moved_to = district
+
+        if violation_zip is not None and violation_zip.zip_code != zip_code:
+            moved_to = new_district or violation_zip.district
+
+        before = _facts_row(seq, district, old["violation_date_time"], old["violation_severity"])
+        after = _facts_row(seq, moved_to, row["violation_date_time"], row["violation_severity"])
+
+        if after != before:
+            notice_facts.move(before, after)
+
+        return row
+
+    except Exception:
+        conn.rollback()
+        raise
+
+    finally:
+        cursor.close()
+        conn.close()
+
+# Update Notice (Full PUT) and Return the Updated Row
+@timed
+def update_notice(notice_id: str, payload):
+    return _update_notice(notice_id, payload)
+
+# Update Only the Notice Fields the Payload Sets (PATCH)
+@timed
+def patch_notice(notice_id: str, payload):
+    return _update_notice(notice_id, payload)
+
+"""EXPIRY"""
+
+# Expire One Batch of Overdue Notices, Returns How Many Were Expired
+# Rows are claimed with FOR UPDATE SKIP LOCKED on idx_notice_status_expiry,
+# so any number of workers can run this at once without waiting on or
+# double-counting each other's batches
+@timed
+def expire_due_notices(limit: int):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # Claim the Batch (and Learn Whose Cached Notices It Touches)
         cursor.execute(
             """
-            SELECT driver_id, licence_number, state_issue,
-                   last_name, first_name, dob,
-                   height_inches, weight_pounds, eyes_colour
-            FROM driver_details
-            WHERE driver_id = %s
+            SELECT notice_info.notice_id, car_details.driver_id
+            FROM notice_info
+            JOIN car_details ON notice_info.car_id = car_details.car_id
+            WHERE notice_info.notice_status = 'Active'
+              AND notice_info.expiry_date < CURDATE()
+            ORDER BY notice_info.expiry_date
+            LIMIT %s
+            FOR UPDATE OF notice_info SKIP LOCKED
             """,
-            (driver_id,)
+            (limit,)
         )
+        rows = cursor.fetchall()
+
+        if not rows:
+            return 0
+
+        notice_ids = [row[0] for row in rows]
+        where, params = _by_notice_ids(notice_ids)
 
-        return cursor.fetchone()
+        # Summaries Move the Batch From Active to Expired
+        _summarise_notices(cursor, notice_ids, -1)
+
+        cursor.execute(
+            f"UPDATE notice_info SET notice_status = 'Expired' WHERE {where}",
+            params
+        )
+
+        _summarise_notices(cursor, notice_ids, 1)
+        _bump_notice_versions(cursor, notice_ids)
+
+        conn.commit()
+        _notices_changed(*(row[1] for row in rows))
+
+        return len(notice_ids)
 
     except Exception:
         conn.rollback()
         raise
 
+    # Close Connection
     finally:
         cursor.close()
         conn.close()
 
-# Update Notice and Return Updated Row
-def update_notice(notice_id: str, payload):
+"""OUTBOX"""
+
+# What a Notification Carries, in SELECT Order
+NOTIFICATION_COLUMNS = (
+    "notice_id", "violation_date_time", "violation_severity",
+    "violation_description", "expiry_date",
+    "driver_id", "first_name", "last_name", "licence_plate"
+)
 
+# Oldest Notices Not Yet Notified
+# Walks idx_notice_unsent, so the cost follows the backlog, not the table
+@timed
+def fetch_unsent_notices(limit: int):
+    # Open SQL Connection
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        # Check notice exists + get address_id
-        cursor.execute(
-            "SELECT address_id FROM notice_info WHERE notice_id = %s",
-            (notice_id,)
-        )
+        # SQL Query
+        query = """
+        SELECT notice_info.notice_id,
+               notice_info.violation_date_time,
+               notice_info.violation_severity,
+               notice_info.violation_description,
+               notice_info.expiry_date,
+               driver_details.driver_id,
+               driver_details.first_name,
+               driver_details.last_name,
+               car_details.licence_plate
+        FROM notice_info
+        JOIN car_details ON notice_info.car_id = car_details.car_id
+        JOIN driver_details ON car_details.driver_id = driver_details.driver_id
+        WHERE notice_info.notification_sent = FALSE
+          AND notice_info.notification_parked = FALSE
+        ORDER BY notice_info.entry_date, notice_info.notice_id
+        LIMIT %s
+        """
+
+        # Execute Query
+        cursor.execute(query, (limit,))
+        rows = [dict(zip(NOTIFICATION_COLUMNS, row)) for row in cursor.fetchall()]
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
 
-        result = cursor.fetchone()
+    # Close Connection
+    cursor.close()
+    conn.close()
 
-        if result is None:
-            return None
+    # Output Results
+    return rows
+
+# Mark a Delivered Batch as Sent in One Statement, Returns Rows Changed
+@timed
+def mark_notifications_sent(notice_ids):
+    if not notice_ids:
+        return 0
+
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
 
-        address_id = result[0]
+    try:
+        where, params = _by_notice_ids(notice_ids)
 
-        # Check violation ZIP exists
         cursor.execute(
-            "SELECT 1 FROM violation_zip_code WHERE zip_code = %s",
-            (payload.violation_zip.zip_code,)
+            f"""
+            UPDATE notice_info
+            SET notification_sent = TRUE
+            WHERE {where}
+              AND notification_sent = FALSE
+            """,
+            params
         )
+        marked = cursor.rowcount
+        _bump_notice_versions(cursor, notice_ids)
 
-        if cursor.fetchone() is None:
+        # Owners' Cached Notice Pages Show notification_sent
+        if config.CACHE_ENABLED:
             cursor.execute(
-                """
-                INSERT INTO violation_zip_code (zip_code, state, city, district)
-                VALUES (%s, %s, %s, %s)
+                f"""
+                SELECT DISTINCT car_details.driver_id
+                FROM notice_info
+                JOIN car_details ON notice_info.car_id = car_details.car_id
+                WHERE {where}
                 """,
-                (
-                    payload.violation_zip.zip_code,
-                    payload.violation_zip.state,
-                    payload.violation_zip.city,
-                    payload.violation_zip.district
-                )
+                params
             )
+            owners = [row[0] for row in cursor.fetchall()]
+        else:
+            owners = []
 
-        # Update violation address
-        cursor.execute(
-            """
-            UPDATE violation_address
-            SET zip_code = %s,
-                street = %s
-            WHERE address_id = %s
-            """,
-            (
-                payload.violation_zip.zip_code,
-                payload.violation_address.street,
-                address_id
-            )
-        )
+        conn.commit()
+        _notices_changed(*owners)
+
+        return marked
+
+    except Exception:
+        conn.rollback()
+        raise
+
+    # Close Connection
+    finally:
+        cursor.close()
+        conn.close()
+
+# Count a Failed Delivery Against Each Notice, Parking Those That Reach `park_after`
+# Returns the IDs parked; the outbox skips them until notification_parked is reset
+@timed
+def record_notification_failures(notice_ids, park_after: int):
+    if not notice_ids:
+        return []
+
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        where, params = _by_notice_ids(notice_ids)
 
-        # Update notice_info
+        # Single-Table UPDATEs Assign Left to Right, So the Park Test Sees the New Count
         cursor.execute(
-            """
+            f"""
             UPDATE notice_info
-            SET car_id = %s,
-                violation_date_time = %s,
-                detachment = %s,
-                violation_severity = %s,
-                notice_status = %s,
-                notification_sent = %s,
-                entry_date = %s,
-                expiry_date = %s,
-                violation_description = %s
-            WHERE notice_id = %s
+            SET notification_attempts = notification_attempts + 1,
+                notification_parked = notification_attempts >= %s
+            WHERE {where}
+              AND notification_sent = FALSE
+              AND notification_parked = FALSE
             """,
-            (
-                payload.car_id,
-                payload.violation_date_time,
-                payload.detachment,
-                payload.violation_severity,
-                payload.notice_status,
-                payload.notification_sent,
-                payload.entry_date,
-                payload.expiry_date,
-                payload.violation_description,
-                notice_id
-            )
+            [park_after] + params
         )
 
-        conn.commit()
-
-        # Return updated row
         cursor.execute(
-            """
-            SELECT notice_id, violation_date_time, detachment,
-                   violation_severity, notice_status,
-                   notification_sent, entry_date,
-                   expiry_date, violation_description
+            f"""
+            SELECT notice_info.notice_id
             FROM notice_info
-            WHERE notice_id = %s
+            WHERE {where}
+              AND notification_sent = FALSE
+              AND notification_parked = TRUE
             """,
-            (notice_id,)
+            params
         )
+        parked = [row[0] for row in cursor.fetchall()]
 
-        return cursor.fetchone()
+        conn.commit()
+
+        return parked
 
     except Exception:
         conn.rollback()
@@ -622,3 +2077,366 @@ def update_notice(notice_id: str, payload):
     finally:
         cursor.close()
         conn.close()
+
+"""REPORTS"""
+
+# Summary Columns a Report Can Group By
+REPORT_DIMENSIONS = {
+    "severity": "violation_severity",
+    "status": "notice_status",
+    "district": "district",
+    "month": "violation_month"
+}
+
+# Notice Counts Grouped by One Dimension
+@timed
+def fetch_notice_report(dimension: str):
+    column = REPORT_DIMENSIONS[dimension]
+
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SQL Query
+        query = f"""
+        SELECT {column}, SUM(notice_count) AS total
+        FROM notice_summary
+        GROUP BY {column}
+        HAVING total > 0
+        ORDER BY {column}
+        """
+
+        # Execute Query
+        cursor.execute(query)
+        rows = cursor.fetchall()
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+    # Output Results
+    return rows
+
+# Drivers With the Most Out-of-State Violations
+@timed
+def fetch_out_of_state_report(limit: int):
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SQL Query
+        query = """
+        SELECT out_of_state_summary.driver_id,
+               driver_details.first_name,
+               driver_details.last_name,
+               out_of_state_summary.notice_count
+        FROM out_of_state_summary
+        JOIN driver_details ON out_of_state_summary.driver_id = driver_details.driver_id
+        WHERE out_of_state_summary.notice_count > 0
+        ORDER BY out_of_state_summary.notice_count DESC, out_of_state_summary.driver_id
+        LIMIT %s
+        """
+
+        # Execute Query
+        cursor.execute(query, (limit,))
+        rows = cursor.fetchall()
+
+    # A Failed Read Can Leave the Connection Mid-Result – Drop It
+    except Exception:
+        conn.discard()
+        raise
+
+    # Close Connection
+    cursor.close()
+    conn.close()
+
+    # Output Results
+    return rows
+
+# Recompute Both Summary Tables From Scratch (Backfills)
+@timed
+def rebuild_summaries():
+    # Open SQL Connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("DELETE FROM notice_summary")
+        cursor.execute("DELETE FROM out_of_state_summary")
+
+        _count_notices(cursor, "TRUE", [], 1)
+        _count_out_of_state(cursor, "TRUE", [], 1)
+
+        conn.commit()
+
+    # In case things go south – roll back
+    except Exception:
+        conn.rollback()
+        raise
+
+    # Final Leg of the Journey
+    finally:
+        cursor.close()
+        conn.close()
+
+"""ANALYTICS"""
+
+# One Row per Notice: (notice_seq, district, hour of week, severity code)
+NOTICE_FACTS_COLUMNS = """
+notice_info.notice_seq,
+violation_zip_code.district,
+(DAYOFWEEK(notice_info.violation_date_time) - 1) * 24 + HOUR(notice_info.violation_date_time),
+notice_info.violation_severity - 1
+"""
+
+NOTICE_FACTS_TABLES = """
+FROM notice_info
+JOIN violation_address ON notice_info.address_id = violation_address.address_id
+JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
+"""
+
+NOTICE_FACTS_QUERY = f"SELECT {NOTICE_FACTS_COLUMNS} {NOTICE_FACTS_TABLES}"
+
+# Read Every Notice After a Sequence Number Into `columns`, a Chunk per Round Trip
+def _load_facts(cursor, columns, after: int):
+    while True:
+        cursor.execute(
+            NOTICE_FACTS_QUERY + " WHERE notice_info.notice_seq > %s ORDER BY notice_info.notice_seq LIMIT %s",
+            (after, config.ANALYTICS_CHUNK_SIZE)
+        )
+        rows = cursor.fetchall()
+        columns.append(rows)
+
+        if len(rows) < config.ANALYTICS_CHUNK_SIZE:
+            return
+
+        after = rows[-1][0]
+
+# Bring the Column Cache Up to Date
+# Appends new notices (and late commits into remembered gaps), or rebuilds
+# from scratch on first use, after a write during a rebuild, or when the
+# optional ANALYTICS_REBUILD_SECONDS has passed
+@timed
+def refresh_notice_facts(force: bool = False):
+    with notice_facts.refreshing:
+        now = time.monotonic()
+        rebuild = (
+            force or notice_facts.stale
+            or 0 < config.ANALYTICS_REBUILD_SECONDS < now - notice_facts.built_at
+        )
+
+        # Someone Else Just Refreshed
+        if not rebuild and now - notice_facts.refreshed_at < config.ANALYTICS_REFRESH_SECONDS:
+            return False
+
+        # Open SQL Connection
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        try:
+            if rebuild:
+                # Edits Made From Here On Mark the New Copy Stale Again
+                notice_facts.stale = False
+                notice_facts.rebuilding = True
+
+                # Gaps Tracked Too, So Inserts Still in Flight Are Picked Up Later
+                fresh = NoticeColumns()
+                _load_facts(cursor, fresh, 0)
+                notice_facts.replace(fresh)
+
+            else:
+                # Sequence Numbers Skipped Last Time May Have Committed Since
+                gaps = sorted(notice_facts.gaps)
+
+                if gaps:
+                    cursor.execute(
+                        NOTICE_FACTS_QUERY + " WHERE notice_info.notice_seq IN ("
+                        + ", ".join(["%s"] * len(gaps)) + ")",
+                        gaps
+                    )
+                    notice_facts.append(cursor.fetchall())
+
+                _load_facts(cursor, notice_facts, notice_facts.last_seq)
+
+            notice_facts.refreshed(full=rebuild)
+
+        except Exception:
+            # A Half-Built Copy Is Never Adopted; Try Again Next Time
+            notice_facts.stale = notice_facts.stale or rebuild
+
+            # A Failed Read Can Leave the Connection Mid-Result – Drop It
+            conn.discard()
+            raise
+
+        finally:
+            notice_facts.rebuilding = False
+
+        # Close Connection
+        cursor.close()
+        conn.close()
+
+        return True
+
+# Notice Counts by District and Time Bucket, Refreshed First When Due
+@timed
+def notice_hotspots(bucket: str, severity, top: int):
+    refresh_notice_facts()
+
+    return notice_facts.hotspots(bucket, severity, top)
+
+# Column Cache Size and Freshness for GET /metrics
+def notice_facts_stats():
+    return notice_facts.stats()
+
+"""EXPORTS"""
+
+# Joined Datasets Behind GET /exports/notices
+# columns: (name, type) in SELECT order, the types sizing Parquet columns
+# The joins are notice_base.sql's "cars and their violations with driver info"
+# and "actions taken with full violation context", driven from notice_info
+# so the notice listing's filters apply to both
+EXPORT_DATASETS = {
+    "violations": {
+        "columns": (
+            ("notice_id", "str"), ("violation_date_time", "datetime"),
+            ("violation_severity", "str"), ("notice_status", "str"),
+            ("violation_description", "str"), ("car_id", "int"), ("make", "str"),
+            ("year_production", "int"), ("licence_plate", "str"), ("driver_id", "int"),
+            ("first_name", "str"), ("last_name", "str"), ("city", "str")
+        ),
+        "query": """
+        SELECT notice_info.notice_id, notice_info.violation_date_time,
+               notice_info.violation_severity, notice_info.notice_status,
+               notice_info.violation_description, car_details.car_id, car_details.make,
+               car_details.year_production, car_details.licence_plate, driver_details.driver_id,
+               driver_details.first_name, driver_details.last_name, reg_zip_code.city
+        FROM notice_info
+        JOIN car_details ON notice_info.car_id = car_details.car_id
+        JOIN driver_details ON car_details.driver_id = driver_details.driver_id
+        JOIN reg_address ON driver_details.address_id = reg_address.address_id
+        JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
+        """,
+        "order": "notice_info.notice_seq"
+    },
+    "actions": {
+        "columns": (
+            ("action_id", "str"), ("action_type", "str"), ("badge_number", "str"),
+            ("officer_first_name", "str"), ("officer_last_name", "str"), ("notice_id", "str"),
+            ("violation_date_time", "datetime"), ("violation_severity", "str"),
+            ("notice_status", "str"), ("violation_description", "str"), ("driver_id", "int"),
+            ("driver_first_name", "str"), ("driver_last_name", "str"), ("city", "str"),
+            ("street", "str")
+        ),
+        "query": """
+        SELECT actions.action_id, actions.action_type, officer_info.badge_number,
+               officer_info.first_name, officer_info.last_name, notice_info.notice_id,
+               notice_info.violation_date_time, notice_info.violation_severity,
+               notice_info.notice_status, notice_info.violation_description, driver_details.driver_id,
+               driver_details.first_name, driver_details.last_name, violation_zip_code.city,
+               violation_address.street
+        FROM actions
+        JOIN officer_info ON actions.badge_number = officer_info.badge_number
+        JOIN notice_info ON actions.notice_id = notice_info.notice_id
+        JOIN car_details ON notice_info.car_id = car_details.car_id
+        JOIN driver_details ON car_details.driver_id = driver_details.driver_id
+        JOIN violation_address ON notice_info.address_id = violation_address.address_id
+        JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
+        """,
+        "order": "actions.action_id"
+    }
+}
+
+# Stream One Export Dataset
+# Server-side cursor, yields lists of at most chunk_size rows
+# Filters match GET /notices/{driver_id}; driver_id is optional here
+@timed
+def stream_export(
+    dataset: str,
+    chunk_size: int,
+    driver_id: int = None,
+    severity=None,
+    status=None,
+    date_from=None,
+    date_to=None
+):
+    export = EXPORT_DATASETS[dataset]
+    conditions = []
+    params = []
+
+    # Filters
+    if driver_id is not None:
+        conditions.append("car_details.driver_id = %s")
+        params.append(driver_id)
+
+    if severity is not None:
+        conditions.append("notice_info.violation_severity = %s")
+        params.append(severity)
+
+    if status is not None:
+        conditions.append("notice_info.notice_status = %s")
+        params.append(status)
+
+    if date_from is not None:
+        conditions.append("notice_info.violation_date_time >= %s")
+        params.append(date_from)
+
+    if date_to is not None:
+        conditions.append("notice_info.violation_date_time < %s")
+        params.append(date_to)
+
+    query = export["query"]
+
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+
+    query += f" ORDER BY {export['order']}"
+
+    # Open an SQL Bridge
+    conn = get_connection()
+    cursor = conn.cursor(MySQLdb.cursors.SSCursor)
+    finished = False
+
+    try:
+        # The Server Waits on a Slow Client Between Chunks
+        # (the session's own value is put back before the connection is pooled again)
+        cursor.execute("SELECT @@SESSION.net_write_timeout")
+        previous = cursor.fetchall()[0][0]
+        cursor.execute("SET SESSION net_write_timeout = %s", (config.EXPORT_WRITE_TIMEOUT_SECONDS,))
+
+        # Execute Query
+        cursor.execute(query, params)
+
+        # Hand Rows Over Chunk by Chunk
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+
+            if not rows:
+                break
+
+            yield rows
+
+        finished = True
+
+    # Close Connection
+    finally:
+        if finished:
+            try:
+                cursor.execute("SET SESSION net_write_timeout = %s", (previous,))
+                cursor.close()
+
+            # Never Pool a Connection Still Carrying the Export's Timeout
+            except Exception:
+                finished = False
+
+        if finished:
+            conn.close()
+        else:
+            # Abandoned Mid-Result (or Not Restored) – Drop the Connection Rather Than Drain It
+            conn.discard()
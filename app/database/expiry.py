@@ -0,0 +1,108 @@
+# app/database/expiry.py
+# Imports
+import asyncio
+import logging
+import random
+import time
+from app.core import config
+from app.core.metrics import notices_expired, expiry_batches
+from app.database.db_async import expire_due_notices
+
+"""
+    Background job that moves overdue notices from Active to
+    Expired, so readers can trust notice_status instead of
+    comparing dates. It is started from the app lifespan and
+    wakes every EXPIRY_INTERVAL_SECONDS (with some jitter, so
+    several workers do not wake in step), then expires
+    everything due in batches of EXPIRY_BATCH_SIZE, one short
+    transaction each, until a batch comes back short.
+
+    Batches claim their rows with SKIP LOCKED, so running the
+    job in every worker process is safe: workers split the
+    backlog between them rather than queueing on each other.
+"""
+
+logger = logging.getLogger(__name__)
+
+# The Running Job (Created in the App Lifespan)
+_task = None
+
+# Last Run, for GET /metrics
+_last_run = {
+    "timestamp_seconds": 0.0,
+    "duration_seconds": 0.0,
+    "expired": 0
+}
+
+def expiry_stats():
+    return dict(_last_run)
+
+# One Run: Batch Until Nothing Is Left
+async def expire_once():
+    started = time.perf_counter()
+    total = 0
+
+    while True:
+        try:
+            expired = await expire_due_notices(config.EXPIRY_BATCH_SIZE)
+        except Exception:
+            expiry_batches.inc(("error",))
+            raise
+
+        expiry_batches.inc(("ok",))
+        notices_expired.inc(amount=expired)
+        total += expired
+
+        # A Short Batch Means the Backlog Is Drained (or Held by Another Worker)
+        if expired < config.EXPIRY_BATCH_SIZE:
+            break
+
+        await asyncio.sleep(config.EXPIRY_BATCH_PAUSE_SECONDS)
+
+    _last_run.update(
+        timestamp_seconds=time.time(),
+        duration_seconds=time.perf_counter() - started,
+        expired=total
+    )
+
+    if total:
+        logger.info("Expired %d notices in %.2f s", total, _last_run["duration_seconds"])
+
+    return total
+
+# Run Forever, Surviving Database Errors
+async def _run():
+    while True:
+        try:
+            await expire_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Notice expiry run failed", exc_info=True)
+
+        interval = config.EXPIRY_INTERVAL_SECONDS
+        await asyncio.sleep(interval * random.uniform(0.9, 1.1))
+
+# Start the Job
+def start_expiry():
+    global _task
+
+    if config.EXPIRY_ENABLED and _task is None:
+        _task = asyncio.create_task(_run(), name="notice-expiry")
+
+    return _task
+
+# Stop the Job
+# A batch already on a worker thread still finishes (shutdown_executor waits)
+async def stop_expiry():
+    global _task
+
+    if _task is not None:
+        _task.cancel()
+
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+
+        _task = None
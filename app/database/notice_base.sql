@@ -5,13 +5,6 @@ USE notice_base;
 # Officer Account
 CREATE USER IF NOT EXISTS  'officer_user'@'localhost' IDENTIFIED BY 'officer_password';
 
-# Drivers' Account
-CREATE USER IF NOT EXISTS  'driver_1_user'@'localhost' IDENTIFIED BY 'driver_1_password';
-CREATE USER IF NOT EXISTS  'driver_2_user'@'localhost' IDENTIFIED BY 'driver_2_password';
-CREATE USER IF NOT EXISTS  'driver_3_user'@'localhost' IDENTIFIED BY 'driver_3_password';
-CREATE USER IF NOT EXISTS  'driver_4_user'@'localhost' IDENTIFIED BY 'driver_4_password';
-CREATE USER IF NOT EXISTS  'driver_5_user'@'localhost' IDENTIFIED BY 'driver_5_password';
-
 # Person's ZIP Code
 # Accepts both ZIP and ZIP+4 standards
 CREATE TABLE reg_zip_code (
@@ -46,7 +39,16 @@ CREATE TABLE driver_details (
     weight_pounds INT NOT NULL,
     eyes_colour VARCHAR(10) NOT NULL,
     
+    # Bumped by every write to the driver / to any of the driver's notices
+    # (ETags for GET /drivers/{id} and GET /notices/{driver_id})
+    row_version INT UNSIGNED NOT NULL DEFAULT 1,
+    notices_version INT UNSIGNED NOT NULL DEFAULT 1,
+    
     PRIMARY KEY (driver_id),
+    
+    # Name search (GET /drivers/search)
+    FULLTEXT INDEX ft_driver_name (first_name, last_name),
+    
     FOREIGN KEY (address_id) REFERENCES reg_address(address_id) ON DELETE RESTRICT ON UPDATE RESTRICT,
     
     # Logical age check
@@ -107,6 +109,9 @@ CREATE TABLE violation_address(
 # Details of notice
 CREATE TABLE notice_info (
 	notice_id VARCHAR(100) NOT NULL,
+    
+    # Insertion order, for incremental reads (analytics column cache)
+    notice_seq BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
     car_id INT NOT NULL,
     address_id INT NOT NULL,
     violation_date_time DATETIME NOT NULL,
@@ -114,11 +119,32 @@ CREATE TABLE notice_info (
     violation_severity ENUM('Low', 'Medium', 'High') NOT NULL,
     notice_status ENUM('Active', 'Resolved', 'Expired') NOT NULL,
     notification_sent BOOL NOT NULL,
+    
+    # Failed delivery rounds; a parked notice is skipped by the outbox until reset
+    notification_attempts SMALLINT UNSIGNED NOT NULL DEFAULT 0,
+    notification_parked BOOL NOT NULL DEFAULT FALSE,
     entry_date DATE NOT NULL,
     expiry_date DATE NOT NULL,
     violation_description VARCHAR(400) NOT NULL,
     
     PRIMARY KEY (notice_id),
+    UNIQUE KEY uq_notice_seq (notice_seq),
+    
+    # Per-car listing, newest first (notice_id rides along as the primary key)
+    INDEX idx_notice_car_time (car_id, violation_date_time),
+    
+    # Per-car listing filtered by severity and/or status
+    INDEX idx_notice_car_filters (car_id, violation_severity, notice_status, violation_date_time),
+    
+    # Active/expired sweeps by expiry date
+    INDEX idx_notice_status_expiry (notice_status, expiry_date),
+    
+    # Notification outbox: unsent, unparked notices, oldest first
+    INDEX idx_notice_unsent (notification_sent, notification_parked, entry_date),
+    
+    # Description search (GET /notices/search)
+    FULLTEXT INDEX ft_notice_description (violation_description),
+    
     FOREIGN KEY (car_id) REFERENCES car_details (car_id) ON DELETE RESTRICT ON UPDATE RESTRICT,
     FOREIGN KEY (address_id) REFERENCES violation_address (address_id) ON DELETE RESTRICT ON UPDATE RESTRICT,
     
@@ -136,7 +162,12 @@ CREATE TABLE officer_info (
     last_name VARCHAR(100) NOT NULL,
     first_name VARCHAR(100) NOT NULL,
     
-    PRIMARY KEY (badge_number)
+    # API login (bcrypt hash, never the plain password)
+    username VARCHAR(100) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    
+    PRIMARY KEY (badge_number),
+    UNIQUE KEY uq_officer_username (username)
 );
 
 # Actions taken by the officer in regards to the notice
@@ -151,189 +182,47 @@ CREATE TABLE actions (
     FOREIGN KEY (badge_number) REFERENCES officer_info (badge_number) ON DELETE RESTRICT ON UPDATE RESTRICT
 );
 
-# Permissions
-# Officer's Full Access
-GRANT ALL PRIVILEGES ON notice_base.* TO 'officer_user'@'localhost';
-
-# Driver 1 Limited Access
-CREATE VIEW driver_1_view AS
-SELECT 
-    driver_details.driver_id,
-    driver_details.first_name,
-    driver_details.last_name,
-    car_details.licence_plate,
-    car_details.make,
-    car_details.car_type,
-    car_details.year_production,
-    car_details.plate_state_issue,
-    car_details.vin,
-    car_details.colour,
-    notice_info.notice_id,
-    notice_info.violation_description,
-    notice_info.violation_severity,
-    notice_info.notice_status,
-    notice_info.violation_date_time,
-    reg_zip_code.state AS reg_state,
-    reg_zip_code.city AS reg_city,
-    violation_zip_code.state AS violation_state,
-    violation_zip_code.city AS violation_city,
-    violation_zip_code.district AS violation_district,
-    violation_address.street AS violation_street
-FROM driver_details
-JOIN car_details ON driver_details.driver_id = car_details.driver_id
-JOIN notice_info ON car_details.car_id = notice_info.car_id
-JOIN reg_address ON driver_details.address_id = reg_address.address_id
-JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
-JOIN violation_address ON notice_info.address_id = violation_address.address_id
-JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
-WHERE driver_details.driver_id = 1;
-
-# Grant Access
-GRANT SELECT ON notice_base.driver_1_view TO 'driver_1_user'@'localhost';
-
-# Driver 2 Limited Access
-CREATE VIEW driver_2_view AS
-SELECT 
-    driver_details.driver_id,
-    driver_details.first_name,
-    driver_details.last_name,
-    car_details.licence_plate,
-    car_details.make,
-    car_details.car_type,
-    car_details.year_production,
-    car_details.plate_state_issue,
-    car_details.vin,
-    car_details.colour,
-    notice_info.notice_id,
-    notice_info.violation_description,
-    notice_info.violation_severity,
-    notice_info.notice_status,
-    notice_info.violation_date_time,
-    reg_zip_code.state AS reg_state,
-    reg_zip_code.city AS reg_city,
-    violation_zip_code.state AS violation_state,
-    violation_zip_code.city AS violation_city,
-    violation_zip_code.district AS violation_district,
-    violation_address.street AS violation_street
-FROM driver_details
-JOIN car_details ON driver_details.driver_id = car_details.driver_id
-JOIN notice_info ON car_details.car_id = notice_info.car_id
-JOIN reg_address ON driver_details.address_id = reg_address.address_id
-JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
-JOIN violation_address ON notice_info.address_id = violation_address.address_id
-JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
-WHERE driver_details.driver_id = 2;
-
-# Grant Access
-GRANT SELECT ON notice_base.driver_2_view TO 'driver_2_user'@'localhost';
-
-# Driver 3 Limited Access
-CREATE VIEW driver_3_view AS
-SELECT 
-    driver_details.driver_id,
-    driver_details.first_name,
-    driver_details.last_name,
-    car_details.licence_plate,
-    car_details.make,
-    car_details.car_type,
-    car_details.year_production,
-    car_details.plate_state_issue,
-    car_details.vin,
-    car_details.colour,
-    notice_info.notice_id,
-    notice_info.violation_description,
-    notice_info.violation_severity,
-    notice_info.notice_status,
-    notice_info.violation_date_time,
-    reg_zip_code.state AS reg_state,
-    reg_zip_code.city AS reg_city,
-    violation_zip_code.state AS violation_state,
-    violation_zip_code.city AS violation_city,
-    violation_zip_code.district AS violation_district,
-    violation_address.street AS violation_street
-FROM driver_details
-JOIN car_details ON driver_details.driver_id = car_details.driver_id
-JOIN notice_info ON car_details.car_id = notice_info.car_id
-JOIN reg_address ON driver_details.address_id = reg_address.address_id
-JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
-JOIN violation_address ON notice_info.address_id = violation_address.address_id
-JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
-WHERE driver_details.driver_id = 3;
-
-# Grant Access
-GRANT SELECT ON notice_base.driver_3_view TO 'driver_3_user'@'localhost';
-
-# Driver 4 Limited Access
-CREATE VIEW driver_4_view AS
-SELECT 
-    driver_details.driver_id,
-    driver_details.first_name,
-    driver_details.last_name,
-    car_details.licence_plate,
-    car_details.make,
-    car_details.car_type,
-    car_details.year_production,
-    car_details.plate_state_issue,
-    car_details.vin,
-    car_details.colour,
-    notice_info.notice_id,
-    notice_info.violation_description,
-    notice_info.violation_severity,
-    notice_info.notice_status,
-    notice_info.violation_date_time,
-    reg_zip_code.state AS reg_state,
-    reg_zip_code.city AS reg_city,
-    violation_zip_code.state AS violation_state,
-    violation_zip_code.city AS violation_city,
-    violation_zip_code.district AS violation_district,
-    violation_address.street AS violation_street
-FROM driver_details
-JOIN car_details ON driver_details.driver_id = car_details.driver_id
-JOIN notice_info ON car_details.car_id = notice_info.car_id
-JOIN reg_address ON driver_details.address_id = reg_address.address_id
-JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
-JOIN violation_address ON notice_info.address_id = violation_address.address_id
-JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
-WHERE driver_details.driver_id = 4;
+# Drivers' self-service login
+# One row per driver; GET /me/notices reads only the caller's own notices,
+# so no per-driver database users or views are needed
+CREATE TABLE driver_login (
+	driver_id INT NOT NULL,
+    username VARCHAR(100) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    
+    PRIMARY KEY (driver_id),
+    UNIQUE KEY uq_driver_username (username),
+    FOREIGN KEY (driver_id) REFERENCES driver_details (driver_id) ON DELETE RESTRICT ON UPDATE RESTRICT
+);
 
-# Grant Access
-GRANT SELECT ON notice_base.driver_4_view TO 'driver_4_user'@'localhost';
+# Report summaries
+# Kept current by the API's write functions (db_raw.py) in the same
+# transaction as the notice change; rebuilt from scratch with
+# python -m app.database.rebuild_reports
+CREATE TABLE notice_summary (
+    violation_severity ENUM('Low', 'Medium', 'High') NOT NULL,
+    notice_status ENUM('Active', 'Resolved', 'Expired') NOT NULL,
+    district VARCHAR(40) NOT NULL,
+    
+    # YYYY-MM of the violation
+    violation_month CHAR(7) NOT NULL,
+    notice_count INT NOT NULL,
+    
+    PRIMARY KEY (violation_severity, notice_status, district, violation_month)
+);
 
-# Driver 5 Limited Access
-CREATE VIEW driver_5_view AS
-SELECT 
-    driver_details.driver_id,
-    driver_details.first_name,
-    driver_details.last_name,
-    car_details.licence_plate,
-    car_details.make,
-    car_details.car_type,
-    car_details.year_production,
-    car_details.plate_state_issue,
-    car_details.vin,
-    car_details.colour,
-    notice_info.notice_id,
-    notice_info.violation_description,
-    notice_info.violation_severity,
-    notice_info.notice_status,
-    notice_info.violation_date_time,
-    reg_zip_code.state AS reg_state,
-    reg_zip_code.city AS reg_city,
-    violation_zip_code.state AS violation_state,
-    violation_zip_code.city AS violation_city,
-    violation_zip_code.district AS violation_district,
-    violation_address.street AS violation_street
-FROM driver_details
-JOIN car_details ON driver_details.driver_id = car_details.driver_id
-JOIN notice_info ON car_details.car_id = notice_info.car_id
-JOIN reg_address ON driver_details.address_id = reg_address.address_id
-JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
-JOIN violation_address ON notice_info.address_id = violation_address.address_id
-JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
-WHERE driver_details.driver_id = 5;
+# Violations outside the driver's home state, per driver
+CREATE TABLE out_of_state_summary (
+    driver_id INT NOT NULL,
+    notice_count INT NOT NULL,
+    
+    PRIMARY KEY (driver_id),
+    INDEX idx_out_of_state_count (notice_count)
+);
 
-# Grant Access
-GRANT SELECT ON notice_base.driver_5_view TO 'driver_5_user'@'localhost';
+# Permissions
+# Officer's Full Access
+GRANT ALL PRIVILEGES ON notice_base.* TO 'officer_user'@'localhost';
 
 # Commit Privileges
 FLUSH PRIVILEGES;
@@ -396,10 +285,11 @@ VALUES (
 );
 
 INSERT INTO officer_info (
-	badge_number, last_name, first_name
+	badge_number, last_name, first_name, username, password_hash
 )
 VALUES (
-	'B001', 'Holt', 'Raymond'
+	'B001', 'Holt', 'Raymond', 'officer_user',
+    '$2b$12$61bC1Sx4pWEQWSCHMKt3XOY/oS7sOK8zZ0iaUE8IXdVXE1fJDM9Ia'
 );
 
 INSERT INTO actions (
@@ -529,10 +419,11 @@ VALUES (
 );
 
 INSERT INTO officer_info (
-	badge_number, last_name, first_name
+	badge_number, last_name, first_name, username, password_hash
 )
 VALUES (
-	'B002', 'Draper', 'Jacob'
+	'B002', 'Draper', 'Jacob', 'jdraper',
+    '$2b$12$i3HPzOOXqeuNpMrI9Qd7VOhBXOdNITzmkr.CRfUpNWwd19H/ojK8a'
 );
 
 INSERT INTO actions (
@@ -613,10 +504,11 @@ VALUES (
 );
 
 INSERT INTO officer_info (
-	badge_number, last_name, first_name
+	badge_number, last_name, first_name, username, password_hash
 )
 VALUES (
-	'B003', 'Peralta', 'Jacob'
+	'B003', 'Peralta', 'Jacob', 'jperalta',
+    '$2b$12$n2xiLtSYP6cC5CfL9D6hve57O.h6W9XSUyskThKWEUOsWqFzOvAmu'
 );
 
 INSERT INTO actions (
@@ -703,8 +595,71 @@ VALUES (
 	'A005', 'N005', 'B003', 'Warning'
 );
 
+# Driver logins
+INSERT INTO driver_login (
+	driver_id, username, password_hash
+)
+VALUES (
+	1, 'driver_1_user', '$2b$12$1uE/3wsFMkmLgJ/dB9bcHO.wjEgofAHfIiu7GwFjhDoYXysKqSm5W'
+);
+
+INSERT INTO driver_login (
+	driver_id, username, password_hash
+)
+VALUES (
+	2, 'driver_2_user', '$2b$12$NB7JFZ/QusfIrAR7CQRmre/Ty/GTo7XoicyvrCiFo2uhzcVLBTKkK'
+);
+
+INSERT INTO driver_login (
+	driver_id, username, password_hash
+)
+VALUES (
+	3, 'driver_3_user', '$2b$12$676YDWPYT/G77RgqIJlQUek6D32tWHwG/yQ.UA6NDSFHr9eHyOse.'
+);
+
+INSERT INTO driver_login (
+	driver_id, username, password_hash
+)
+VALUES (
+	4, 'driver_4_user', '$2b$12$e6PnZhgrmDYWbItoYuALtu/jgE0BAGpM1IhqVCHSwwKz73vjB2jsy'
+);
+
+INSERT INTO driver_login (
+	driver_id, username, password_hash
+)
+VALUES (
+	5, 'driver_5_user', '$2b$12$b1F5spB/2lJBgTm9vztGaePI6csEKwQgnx3ulorMUTF85F4rbsYyS'
+);
+
+# Fill the report summaries from the data above
+INSERT INTO notice_summary (
+    violation_severity, notice_status, district, violation_month, notice_count
+)
+SELECT notice_info.violation_severity,
+       notice_info.notice_status,
+       violation_zip_code.district,
+       DATE_FORMAT(notice_info.violation_date_time, '%Y-%m'),
+       COUNT(*)
+FROM notice_info
+JOIN violation_address ON notice_info.address_id = violation_address.address_id
+JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
+GROUP BY 1, 2, 3, 4;
+
+INSERT INTO out_of_state_summary (driver_id, notice_count)
+SELECT car_details.driver_id, COUNT(*)
+FROM notice_info
+JOIN car_details ON notice_info.car_id = car_details.car_id
+JOIN driver_details ON car_details.driver_id = driver_details.driver_id
+JOIN reg_address ON driver_details.address_id = reg_address.address_id
+JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
+JOIN violation_address ON notice_info.address_id = violation_address.address_id
+JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
+WHERE reg_zip_code.state != violation_zip_code.state
+GROUP BY car_details.driver_id;
+
 # DML Queries
 # Administrative Officer Queries
+# (dashboards read the summaries above through GET /reports/...)
 # Find all drivers from Los Angeles
 SELECT
     driver_details.driver_id,
@@ -864,19 +819,26 @@ LEFT JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code;
 
 # Citizen Queries
 # Check violations that occurred outside his home state
+# (what GET /me/notices runs, with the driver ID taken from the login token)
 SELECT 
-    driver_4_view.notice_id,
-    driver_4_view.violation_description,
-    driver_4_view.violation_severity,
-    driver_4_view.licence_plate,
-    driver_4_view.make,
-    driver_4_view.reg_state,
-    driver_4_view.reg_city,
-    driver_4_view.violation_state,
-    driver_4_view.violation_city,
-    driver_4_view.violation_district,
-    driver_4_view.violation_street,
-    driver_4_view.violation_date_time
-FROM driver_4_view
-WHERE driver_4_view.reg_state != driver_4_view.violation_state
-    AND driver_4_view.notice_id IS NOT NULL;
+    notice_info.notice_id,
+    notice_info.violation_description,
+    notice_info.violation_severity,
+    car_details.licence_plate,
+    car_details.make,
+    reg_zip_code.state AS reg_state,
+    reg_zip_code.city AS reg_city,
+    violation_zip_code.state AS violation_state,
+    violation_zip_code.city AS violation_city,
+    violation_zip_code.district AS violation_district,
+    violation_address.street AS violation_street,
+    notice_info.violation_date_time
+FROM driver_details
+JOIN car_details ON driver_details.driver_id = car_details.driver_id
+JOIN notice_info ON car_details.car_id = notice_info.car_id
+JOIN reg_address ON driver_details.address_id = reg_address.address_id
+JOIN reg_zip_code ON reg_address.zip_code = reg_zip_code.zip_code
+JOIN violation_address ON notice_info.address_id = violation_address.address_id
+JOIN violation_zip_code ON violation_address.zip_code = violation_zip_code.zip_code
+WHERE driver_details.driver_id = 4
+    AND reg_zip_code.state != violation_zip_code.state;
\ No newline at end of file
@@ -0,0 +1,339 @@
+# app/database/notice_columns.py
+# Imports
+import threading
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+"""
+    Columnar copy of the notice facts behind /reports/hotspots:
+    one entry per notice holding its violation district, hour of
+    week and severity as small integer codes (4 bytes a notice,
+    so ~200 MB at 50M notices). Counts are computed over whole
+    columns at once with NumPy (pip install numpy); without it
+    the same counts come from a plain Python loop.
+
+    New notices are appended incrementally by notice_seq (an
+    AUTO_INCREMENT column on notice_info), so a refresh reads
+    only rows it has not seen. Sequence numbers can commit out
+    of order, so skipped numbers are remembered for a few
+    refreshes and asked for again. Deletes and edits are handed
+    over by db_raw with the facts they change: a notice already
+    in the copy is subtracted as a tombstone (and, for an edit,
+    added again with its new facts), and one not read yet is
+    skipped or counted with its new facts when it arrives. A
+    full rebuild only runs on first use, when a write lands
+    during a rebuild, or every ANALYTICS_REBUILD_SECONDS if set,
+    to pick up edits made by other processes.
+"""
+
+# Severity Codes Are notice_info.violation_severity's ENUM Index Minus One
+SEVERITIES = ("Low", "Medium", "High")
+
+# Hours in a Week (0 = Sunday 00:00)
+HOURS_OF_WEEK = 168
+
+# Bucket Name -> Number of Buckets
+BUCKETS = {
+    "hour_of_week": HOURS_OF_WEEK,
+    "hour": 24,
+    "weekday": 7
+}
+
+# Skipped Sequence Numbers Are Asked for This Many More Refreshes
+GAP_REFRESHES = 3
+
+# Most Skipped Numbers Remembered at Once (the Newest Are Kept)
+MAX_GAPS = 10000
+
+# Flat Counts of One Set of Columns Over Every (District, Bucket, Severity) Cell
+def _bincount(district, hour, severity, buckets: int, districts: int):
+    district = np.frombuffer(district, dtype=np.uint16).astype(np.int64)
+    hour = np.frombuffer(hour, dtype=np.uint8).astype(np.int64)
+    severity = np.frombuffer(severity, dtype=np.uint8)
+
+    if buckets == 24:
+        hour %= 24
+    elif buckets == 7:
+        hour //= 24
+
+    codes = (district * buckets + hour) * len(SEVERITIES) + severity
+
+    return np.bincount(codes, minlength=districts * buckets * len(SEVERITIES))
+
+class NoticeColumns:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.reset()
+
+        # Set by Writes the Append-Only Refresh Cannot See
+        # (cleared when a rebuild starts, so a write during one is not lost)
+        self.stale = True
+
+        # Held by Whoever Is Refreshing, So Rows Are Never Appended Twice
+        self.refreshing = threading.Lock()
+
+        # Set While a Full Rebuild Reads Into a Fresh Copy
+        self.rebuilding = False
+
+    # Drop Everything (Start of a Full Rebuild)
+    def reset(self):
+        with self._lock:
+            self._districts = []
+            self._district_codes = {}
+            self._district = array("H")
+            self._hour = array("B")
+            self._severity = array("B")
+
+            # Tombstones: Facts of Deleted Notices, Subtracted From the Counts
+            self._gone_district = array("H")
+            self._gone_hour = array("B")
+            self._gone_severity = array("B")
+
+            self.last_seq = 0
+            self.gaps = {}
+
+            # Deleted Sequence Numbers Not Read Yet, Skipped if They Arrive
+            self.deleted = set()
+
+            # Edited Sequence Numbers Not Read Yet -> Their New Facts
+            self.moved = {}
+
+            self.built_at = 0.0
+            self.refreshed_at = 0.0
+
+    def __len__(self):
+        return len(self._district) - len(self._gone_district)
+
+    # Adopt a Freshly Built Copy (End of a Full Rebuild)
+    def replace(self, other):
+        with self._lock, other._lock:
+            self._districts = other._districts
+            self._district_codes = other._district_codes
+            self._district = other._district
+            self._hour = other._hour
+            self._severity = other._severity
+            self._gone_district = other._gone_district
+            self._gone_hour = other._gone_hour
+            self._gone_severity = other._gone_severity
+            self.last_seq = other.last_seq
+            self.gaps = other.gaps
+            self.deleted = other.deleted
+            self.moved = other.moved
+
+    # Append Rows of (notice_seq, district, hour_of_week, severity code)
+    # Sequence numbers skipped between rows are remembered as gaps
+    def append(self, rows):
+        if not rows:
+            return
+
+        with self._lock:
+            seqs = [row[0] for row in rows]
+            self._track_gaps(seqs)
+
+            self.last_seq = max(self.last_seq, max(seqs))
+
+            # Read Before Their Delete Committed – Never Counted
+            if self.deleted:
+                rows = [row for row in rows if row[0] not in self.deleted]
+                self.deleted.difference_update(seqs)
+
+            # Possibly Read Before Their Edit Committed – Counted With the New Facts
+            if self.moved:
+                rows = [self.moved.pop(row[0], row) for row in rows]
+
+            self._add(rows)
+
+    # Add Rows to the Live Columns, Whole Columns at a Time
+    def _add(self, rows):
+        if not rows:
+            return
+
+        _, districts, hours, severities = zip(*rows)
+
+        self._district.extend(map(self._code, districts))
+        self._hour.extend(hours)
+        self._severity.extend(severities)
+
+    # Small Integer Code of a District Name
+    def _code(self, district):
+        code = self._district_codes.get(district)
+
+        if code is None:
+            code = self._district_codes[district] = len(self._districts)
+            self._districts.append(district)
+
+        return code
+
+    # Take Deleted Notices Out: Rows of (notice_seq, district, hour_of_week, severity code)
+    # Called after the delete commits, with the facts read in its transaction
+    def remove(self, rows):
+        with self._lock:
+            # The Fresh Copy Being Built May or May Not Have Read Them
+            if self.rebuilding and rows:
+                self.stale = True
+
+            for seq, district, hour, severity in rows:
+                # Not Read Yet (or Still a Gap) – Make Sure It Never Is
+                if not self._holds(seq):
+                    self.gaps.pop(seq, None)
+                    self.moved.pop(seq, None)
+                    self.deleted.add(seq)
+                    continue
+
+                self._tombstone(district, hour, severity)
+
+    # An Edit Moved a Notice: `old` and `new` Are Its Rows Before and After
+    # Called after the update commits, with `old` read in its transaction
+    def move(self, old, new):
+        with self._lock:
+            if self.rebuilding:
+                self.stale = True
+
+            # Not Read Yet – Whichever Version a Refresh Reads, Count the New One
+            if not self._holds(old[0]):
+                self.moved[old[0]] = new
+                return
+
+            # Already Counted – Take the Old Facts Out and Add the Seq Again
+            self._tombstone(*old[1:])
+            self._add([new])
+
+    # Whether a Sequence Number Has Been Read Into the Copy
+    def _holds(self, seq):
+        return seq <= self.last_seq and seq not in self.gaps
+
+    # Subtract One Notice's Facts From the Counts
+    def _tombstone(self, district, hour, severity):
+        self._gone_district.append(self._code(district))
+        self._gone_hour.append(hour)
+        self._gone_severity.append(severity)
+
+    # Sequence Numbers Skipped by a Batch (Possibly Still Uncommitted)
+    def _track_gaps(self, seqs):
+        expected = self.last_seq + 1
+
+        for seq in sorted(seqs):
+            # A Late Commit Filling a Remembered Gap
+            if seq in self.gaps:
+                del self.gaps[seq]
+                continue
+
+            for missing in range(expected, seq):
+                # Full – Forget the Oldest; In-Flight Inserts Hold Recent Numbers
+                if len(self.gaps) >= MAX_GAPS:
+                    del self.gaps[next(iter(self.gaps))]
+
+                self.gaps[missing] = GAP_REFRESHES
+
+            expected = max(expected, seq + 1)
+
+    # One Refresh Done: Age the Gaps, Forget the Ones That Never Filled
+    def refreshed(self, full: bool = False):
+        with self._lock:
+            now = time.monotonic()
+
+            if full:
+                self.built_at = now
+            else:
+                self.gaps = {seq: left - 1 for seq, left in self.gaps.items() if left > 1}
+
+            # Numbers This Refresh Has Read Past Can No Longer Arrive
+            self.deleted = {seq for seq in self.deleted if not self._holds(seq)}
+            self.moved = {seq: row for seq, row in self.moved.items() if not self._holds(seq)}
+
+            self.refreshed_at = now
+
+    """COUNTS"""
+
+    # Counts per (District, Bucket, Severity), Tombstones Subtracted
+    def _counts(self, buckets: int):
+        districts = len(self._districts)
+        live = (self._district, self._hour, self._severity)
+        gone = (self._gone_district, self._gone_hour, self._gone_severity)
+
+        if np is not None:
+            counts = _bincount(*live, buckets, districts)
+
+            if gone[0]:
+                counts -= _bincount(*gone, buckets, districts)
+
+            return counts.reshape(districts, buckets, len(SEVERITIES))
+
+        counts = [[[0] * len(SEVERITIES) for _ in range(buckets)] for _ in range(districts)]
+        divisor, modulus = {24: (1, 24), 7: (24, 7)}.get(buckets, (1, HOURS_OF_WEEK))
+
+        for columns, step in ((live, 1), (gone, -1)):
+            for district, hour, severity in zip(*columns):
+                counts[district][hour // divisor % modulus][severity] += step
+
+        return counts
+
+    # Notice Counts by District and Time Bucket, Plus the Busiest Cells
+    def hotspots(self, bucket: str = "hour_of_week", severity=None, top: int = 20):
+        buckets = BUCKETS[bucket]
+        levels = [SEVERITIES.index(severity)] if severity else range(len(SEVERITIES))
+
+        with self._lock:
+            counts = self._counts(buckets)
+            districts = list(self._districts)
+            total = len(self)
+            as_of_seq = self.last_seq
+
+        if np is not None:
+            by_severity = counts.sum(axis=1)
+            histograms = counts[:, :, list(levels)].sum(axis=2)
+            flat = histograms.ravel()
+            best = np.argsort(-flat, kind="stable")[:top]
+            cells = [(int(index), int(flat[index])) for index in best if flat[index] > 0]
+            histograms = histograms.tolist()
+            by_severity = by_severity.tolist()
+        else:
+            by_severity = [[sum(cell[level] for cell in rows) for level in range(len(SEVERITIES))] for rows in counts]
+            histograms = [[sum(cell[level] for level in levels) for cell in rows] for rows in counts]
+            flat = [value for rows in histograms for value in rows]
+            best = sorted(range(len(flat)), key=lambda index: flat[index], reverse=True)[:top]
+            cells = [(index, flat[index]) for index in best if flat[index] > 0]
+
+        return {
+            "bucket": bucket,
+            "buckets": buckets,
+            "severity": severity,
+            "notices": total,
+            "as_of_seq": as_of_seq,
+            "districts": sorted(
+                (
+                    {
+                        "district": name,
+                        "total": sum(by_severity[code]),
+                        "by_severity": dict(zip(SEVERITIES, by_severity[code])),
+                        "histogram": histograms[code]
+                    }
+                    for code, name in enumerate(districts)
+                ),
+                key=lambda item: item["district"]
+            ),
+            "hotspots": [
+                {"district": districts[index // buckets], "bucket": index % buckets, "notices": count}
+                for index, count in cells
+            ]
+        }
+
+    # Size and Freshness for GET /metrics
+    def stats(self):
+        with self._lock:
+            now = time.monotonic()
+
+            return {
+                "notices": len(self),
+                "tombstones": len(self._gone_district),
+                "districts": len(self._districts),
+                "last_seq": self.last_seq,
+                "pending_gaps": len(self.gaps),
+                "seconds_since_refresh": now - self.refreshed_at if self.refreshed_at else -1,
+                "seconds_since_rebuild": now - self.built_at if self.built_at else -1
+            }
@@ -0,0 +1,162 @@
+# app/database/outbox.py
+# Imports
+import asyncio
+import logging
+import time
+from app.core import config
+from app.core.metrics import notifications_sent, notification_batches, notifications_parked, notification_send_seconds
+from app.core.notifications import get_sender
+from app.database.db_async import fetch_unsent_notices, mark_notifications_sent, record_notification_failures
+
+"""
+    Outbox worker for driver notifications. notice_info itself
+    is the outbox: a notice with notification_sent = FALSE is
+    waiting to be delivered, so creating a notice never waits
+    on the sender.
+
+    A poller reads the oldest unsent notices in batches and
+    puts them on a bounded queue; NOTIFICATION_CONCURRENCY
+    tasks take batches off it, hand them to the sender
+    (retrying with exponential backoff) and mark each
+    delivered batch sent with one UPDATE ... IN (...). When the
+    sender falls behind the queue fills and the poller waits,
+    so a slow sender costs at most NOTIFICATION_QUEUE batches
+    of memory and never a growing backlog of queries.
+
+    A batch that still fails after its retries counts one
+    attempt against each of its notices (notification_attempts)
+    and goes back to the outbox. A notice that reaches
+    NOTIFICATION_PARK_AFTER attempts is parked
+    (notification_parked = TRUE) and never read again until an
+    operator resets it, so one undeliverable notice cannot
+    keep the worker busy forever.
+
+    Delivery is at-least-once: a crash between send and mark
+    sends that batch again on the next start.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Running Tasks and Their Shared State (Created in the App Lifespan)
+_tasks = []
+_queue = None
+
+# Notices Queued or Being Sent, So the Poller Does Not Read Them Twice
+_in_flight = set()
+
+# Queue Depth for GET /metrics
+def outbox_stats():
+    return {
+        "queued_batches": _queue.qsize() if _queue is not None else 0,
+        "in_flight": len(_in_flight)
+    }
+
+"""POLLER"""
+
+# Read Unsent Notices Into the Queue, Waiting Whenever It Is Full
+async def _poll(queue):
+    size = config.NOTIFICATION_BATCH_SIZE
+
+    while True:
+        try:
+            rows = await fetch_unsent_notices(size + len(_in_flight))
+        except Exception:
+            logger.warning("Could not read the notification outbox", exc_info=True)
+            await asyncio.sleep(config.NOTIFICATION_POLL_SECONDS)
+            continue
+
+        batch = [row for row in rows if row["notice_id"] not in _in_flight][:size]
+
+        if batch:
+            _in_flight.update(row["notice_id"] for row in batch)
+            await queue.put(batch)
+
+        # Outbox Drained – Wait for New Notices
+        if len(batch) < size:
+            await asyncio.sleep(config.NOTIFICATION_POLL_SECONDS)
+
+"""DELIVERY"""
+
+# Send One Batch, Retrying With Backoff; True Once Delivered
+async def send_batch(sender, batch):
+    for attempt in range(1, config.NOTIFICATION_MAX_ATTEMPTS + 1):
+        started = time.perf_counter()
+
+        try:
+            await sender.send(batch)
+        except Exception:
+            if attempt == config.NOTIFICATION_MAX_ATTEMPTS:
+                notification_batches.inc(("failed",))
+                logger.warning("Giving up on %d notifications after %d attempts", len(batch), attempt, exc_info=True)
+                return False
+
+            notification_batches.inc(("retried",))
+            await asyncio.sleep(min(config.NOTIFICATION_RETRY_SECONDS * 2 ** (attempt - 1), 60.0))
+            continue
+
+        notification_send_seconds.observe((), time.perf_counter() - started)
+        notification_batches.inc(("sent",))
+        notifications_sent.inc(amount=len(batch))
+        return True
+
+    return False
+
+# Count a Given-Up Batch Against Its Notices, Parking the Ones Out of Attempts
+async def _record_failure(notice_ids):
+    parked = await record_notification_failures(notice_ids, config.NOTIFICATION_PARK_AFTER)
+
+    if parked:
+        notifications_parked.inc(amount=len(parked))
+        logger.error("Parked %d notifications after %d failed batches: %s", len(parked), config.NOTIFICATION_PARK_AFTER, parked)
+
+# Take Batches Off the Queue Until Cancelled
+async def _deliver(queue, sender):
+    while True:
+        batch = await queue.get()
+        notice_ids = [row["notice_id"] for row in batch]
+
+        try:
+            if await send_batch(sender, batch):
+                await mark_notifications_sent(notice_ids)
+            else:
+                await _record_failure(notice_ids)
+
+        # Undelivered or Unmarked Batches Are Picked Up Again by the Poller
+        except Exception:
+            logger.warning("Could not update %d notifications after sending", len(notice_ids), exc_info=True)
+
+        finally:
+            _in_flight.difference_update(notice_ids)
+            queue.task_done()
+
+"""LIFECYCLE"""
+
+# Start the Poller and Senders
+def start_outbox(sender=None):
+    global _queue
+
+    if not config.NOTIFICATIONS_ENABLED or _tasks:
+        return _tasks
+
+    sender = sender or get_sender()
+    _queue = asyncio.Queue(maxsize=config.NOTIFICATION_QUEUE)
+
+    _tasks.append(asyncio.create_task(_poll(_queue), name="outbox-poll"))
+
+    for number in range(config.NOTIFICATION_CONCURRENCY):
+        _tasks.append(asyncio.create_task(_deliver(_queue, sender), name=f"outbox-send-{number}"))
+
+    return _tasks
+
+# Stop Everything; Queued Batches Stay Unsent and Are Read Again Next Start
+async def stop_outbox():
+    global _queue
+
+    for task in _tasks:
+        task.cancel()
+
+    await asyncio.gather(*_tasks, return_exceptions=True)
+
+    _tasks.clear()
+    _in_flight.clear()
+    _queue = None
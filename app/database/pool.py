@@ -0,0 +1,245 @@
+# app/database/pool.py
+# Imports
+import threading
+import time
+from collections import deque
+from app.core.metrics import instrument_cursor
+from app.core.tracing import span
+
+"""
+    A small bounded pool of MySQLdb connections. Connections
+    are opened lazily up to the configured size, pinged on
+    checkout when they have been idle for a while, recycled
+    once they have sat idle for too long and rolled back on
+    return so the next borrower never inherits an open
+    transaction or a stale snapshot.
+"""
+
+# Raised When No Connection Frees Up in Time
+class PoolTimeout(Exception):
+    pass
+
+# Connection Handed Out to Callers
+class PooledConnection:
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+
+    # Cursor on the Underlying Connection, Timed Statement by Statement
+    def cursor(self, *args, **kwargs):
+        return instrument_cursor(self._raw.cursor(*args, **kwargs))
+
+    def commit(self):
+        self._raw.commit()
+
+    def rollback(self):
+        self._raw.rollback()
+
+    # Return to the Pool Instead of Closing
+    def close(self):
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool._release(raw)
+
+    # Close For Good Instead of Returning
+    # Used when the connection is mid-result (e.g. an abandoned stream)
+    def discard(self):
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool._drop(raw)
+
+    # Everything Else Goes Straight to MySQLdb
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def __enter__(self):
+        return self
+
+    # A Block That Raised May Have Left It Mid-Result, So It Is Dropped
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+# The Pool Itself
+class ConnectionPool:
+    def __init__(self, connect, size: int, timeout: float, recycle: float, ping_after: float):
+        self._connect = connect
+        self._size = size
+        self._timeout = timeout
+        self._recycle = recycle
+        self._ping_after = ping_after
+
+        # Idle Connections as (connection, returned_at)
+        self._idle = deque()
+        self._lock = threading.Condition()
+        self._closed = False
+
+        # Metrics
+        self._opened = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._discarded = 0
+        self._checkout_seconds_total = 0.0
+        self._checkout_seconds_max = 0.0
+
+    # Borrow a Connection
+    def acquire(self):
+        with span("pool"):
+            return self._acquire()
+
+    def _acquire(self):
+        started = time.perf_counter()
+        deadline = started + self._timeout
+
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+
+                # Reuse an Idle Connection
+                if self._idle:
+                    raw, returned_at = self._idle.pop()
+                    break
+
+                # Open a New One While Below the Limit
+                if self._opened < self._size:
+                    self._opened += 1
+                    raw, returned_at = None, None
+                    break
+
+                # Otherwise Wait For a Release
+                remaining = deadline - time.perf_counter()
+
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout("Timed out waiting for a database connection")
+
+                self._waiting += 1
+                try:
+                    self._lock.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+            self._in_use += 1
+
+        # Network Work Happens Outside the Lock
+        try:
+            raw = self._prepare(raw, returned_at)
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._opened -= 1
+                self._lock.notify()
+            raise
+
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._checkouts += 1
+            self._checkout_seconds_total += elapsed
+            self._checkout_seconds_max = max(self._checkout_seconds_max, elapsed)
+
+        return PooledConnection(self, raw)
+
+    # Health Check and Recycling
+    def _prepare(self, raw, returned_at):
+        if raw is None:
+            return self._connect()
+
+        idle_for = time.monotonic() - returned_at
+
+        # Idle Too Long – Replace It
+        if idle_for > self._recycle:
+            self._discard(raw)
+            return self._connect()
+
+        # Idle a While – Make Sure the Server Still Knows Us
+        if idle_for > self._ping_after:
+            try:
+                raw.ping()
+            except Exception:
+                self._discard(raw)
+                return self._connect()
+
+        return raw
+
+    # Hand a Connection Back
+    def _release(self, raw):
+        # Never Leak an Open Transaction to the Next Borrower
+        try:
+            raw.rollback()
+            healthy = True
+        except Exception:
+            healthy = False
+
+        with self._lock:
+            self._in_use -= 1
+
+            if healthy and not self._closed:
+                self._idle.append((raw, time.monotonic()))
+                raw = None
+            else:
+                self._opened -= 1
+
+            self._lock.notify()
+
+        if raw is not None:
+            self._discard(raw)
+
+    # Forget a Borrowed Connection
+    def _drop(self, raw):
+        with self._lock:
+            self._in_use -= 1
+            self._opened -= 1
+            self._lock.notify()
+
+        self._discard(raw)
+
+    # Close a Connection and Count It
+    def _discard(self, raw):
+        with self._lock:
+            self._discarded += 1
+
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    # Drain the Pool
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._opened -= len(idle)
+            self._lock.notify_all()
+
+        for raw, _ in idle:
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+    # Snapshot of the Pool Metrics
+    def stats(self):
+        with self._lock:
+            return {
+                "size": self._size,
+                "opened": self._opened,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "discarded": self._discarded,
+                "checkout_seconds_total": self._checkout_seconds_total,
+                "checkout_seconds_max": self._checkout_seconds_max,
+                "checkout_seconds_avg": (
+                    self._checkout_seconds_total / self._checkouts
+                    if self._checkouts else 0.0
+                )
+            }
@@ -0,0 +1,21 @@
+# app/database/rebuild_reports.py
+# Imports
+from app.database.db_raw import init_pool, close_pool, rebuild_summaries
+
+"""
+    Recomputes the /reports summary tables from the notices
+    themselves. Run it after loading data behind the API's back
+    (bulk SQL imports, manual fixes) or whenever the summaries
+    are suspected to have drifted:
+
+        python -m app.database.rebuild_reports
+"""
+
+if __name__ == "__main__":
+    init_pool()
+
+    try:
+        rebuild_summaries()
+        print("Report summaries rebuilt")
+    finally:
+        close_pool()
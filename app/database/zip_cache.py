@@ -0,0 +1,53 @@
+# app/database/zip_cache.py
+# Imports
+import threading
+
+"""
+    In-memory copy of the ZIP code dimension tables. They are
+    small and almost never change, so the write paths ask this
+    set instead of running SELECT 1 ... WHERE zip_code = %s.
+    A ZIP is only added once the transaction that wrote it has
+    committed; anything not in the set goes through a race-safe
+    INSERT IGNORE, so a cold or partial set only costs a round
+    trip, never correctness.
+"""
+
+class ZipCodes:
+    def __init__(self):
+        self._known = set()
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+
+    # Replace the Whole Set (Startup Load)
+    def load(self, zip_codes):
+        known = set(zip_codes)
+
+        with self._lock:
+            self._known = known
+
+    # Is the ZIP Already in the Table?
+    def known(self, zip_code: str):
+        with self._lock:
+            if zip_code in self._known:
+                self.hits += 1
+                return True
+
+            self.misses += 1
+            return False
+
+    # Remember ZIPs That Are Now Committed
+    def add(self, *zip_codes):
+        with self._lock:
+            self._known.update(zip_codes)
+
+    # Counters Snapshot
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._known),
+                "hits": self.hits,
+                "misses": self.misses
+            }
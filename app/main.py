@@ -1,21 +1,74 @@
 # main.py
 # Imports
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.database.db_raw import *
+from app.database.db_async import init_executor, shutdown_executor, load_zip_codes
+from app.database.expiry import start_expiry, stop_expiry
+from app.database.outbox import start_outbox, stop_outbox
+from app.core.security import shutdown_password_executor
+from app.core.metrics import MetricsMiddleware
+from app.core.tracing import TracingMiddleware
 from app.api.routers.drivers import *
 from app.api.routers.notices import *
 from app.api.routers.auth import *
+from app.api.routers.me import *
+from app.api.routers.reports import *
+from app.api.routers.exports import *
+from app.api.routers.metrics import *
+
+logger = logging.getLogger(__name__)
+
+# App Lifespan
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup – Create the Connection Pool and Query Executor
+    init_pool()
+    init_executor()
+
+    # Warm the ZIP Code Dimension (Write Paths Fall Back to INSERT IGNORE)
+    try:
+        await load_zip_codes()
+    except Exception:
+        logger.warning("Could not preload ZIP codes", exc_info=True)
+
+    # Expire Overdue Notices in the Background
+    start_expiry()
+
+    # Deliver Notifications for New Notices (NOTIFICATIONS_ENABLED)
+    start_outbox()
+
+    yield
+
+    # Shutdown – Let Running Queries Finish, Then Drain the Pool
+    await stop_expiry()
+    await stop_outbox()
+    shutdown_password_executor()
+    shutdown_executor()
+    close_pool()
 
 # App Entrypoint
 app = FastAPI(
     title="NYPD Road Traffic Notice API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Per-Route Request Timing for GET /metrics
+app.add_middleware(MetricsMiddleware)
+
+# Per-Request Spans and Server-Timing (Added Last, So It Wraps the Metrics)
+app.add_middleware(TracingMiddleware)
+
 # Adding Router
 app.include_router(drivers_router)
 app.include_router(notices_router)
 app.include_router(auth_router)
+app.include_router(me_router)
+app.include_router(reports_router)
+app.include_router(exports_router)
+app.include_router(metrics_router)
 
 @app.get("/")
 async def root():
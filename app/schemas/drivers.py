@@ -1,6 +1,7 @@
 # app/schemas/drivers.py
 from pydantic import BaseModel
 from datetime import date
+from typing import Optional
 
 # Base Model
 class DriverBase(BaseModel):
@@ -18,6 +19,29 @@ class DriverBase(BaseModel):
 class DriverOut(DriverBase):
     driver_id: int
 
+# Driver Listing Entry
+class DriverSummary(BaseModel):
+    driver_id: int
+    state_issue: str
+    last_name: str
+    first_name: str
+
+# One Page of Drivers
+# next_cursor is passed back as ?after= to get the following page
+class DriverPage(BaseModel):
+    drivers: list[DriverSummary]
+    next_cursor: Optional[int]
+
+# Search Hit – Higher Score Is a Better Match
+class DriverHit(DriverSummary):
+    score: float
+
+# One Page of Search Hits
+# next_offset is passed back as ?offset= to get the following page
+class DriverSearchPage(BaseModel):
+    drivers: list[DriverHit]
+    next_offset: Optional[int]
+
 """POST"""
 
 # Address Input (Required for the Nested Query)
@@ -38,4 +62,31 @@ class DriverCreate(BaseModel):
     dob: date
     height_inches: int
     weight_pounds: int
-    eyes_colour: str
\ No newline at end of file
+    eyes_colour: str
+
+# Outcome of One Bulk Record
+class BulkDriverRow(BaseModel):
+    index: int
+    driver_id: Optional[int] = None
+    error: Optional[str] = None
+
+# Bulk Import Report
+class BulkDriverResult(BaseModel):
+    inserted: int
+    failed: int
+    results: list[BulkDriverRow]
+
+"""PATCH"""
+
+# Partial Update – Only the Fields Sent Are Written (null Leaves a Field Alone)
+# The address is replaced as a whole, since a new ZIP needs its state and city
+class DriverPatch(BaseModel):
+    address: Optional[AddressCreate] = None
+    licence_number: Optional[str] = None
+    state_issue: Optional[str] = None
+    last_name: Optional[str] = None
+    first_name: Optional[str] = None
+    dob: Optional[date] = None
+    height_inches: Optional[int] = None
+    weight_pounds: Optional[int] = None
+    eyes_colour: Optional[str] = None
@@ -0,0 +1,34 @@
+# app/schemas/me.py
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Literal, Optional
+
+# One Notice as the Driver Sees It
+class MyNotice(BaseModel):
+    driver_id: int
+    first_name: str
+    last_name: str
+    licence_plate: str
+    make: str
+    car_type: str
+    year_production: int
+    plate_state_issue: str
+    vin: str
+    colour: str
+    notice_id: str
+    violation_description: str
+    violation_severity: Literal["Low", "Medium", "High"]
+    notice_status: Literal["Active", "Resolved", "Expired"]
+    violation_date_time: datetime
+    reg_state: str
+    reg_city: str
+    violation_state: str
+    violation_city: str
+    violation_district: str
+    violation_street: Optional[str]
+
+# One Page of the Driver's Notices
+# next_cursor is passed back as ?after= to get the following page
+class MyNoticePage(BaseModel):
+    notices: list[MyNotice]
+    next_cursor: Optional[str]
@@ -1,7 +1,7 @@
 # app/schemas/notices.py
 from pydantic import BaseModel
 from datetime import datetime, date
-from typing import Literal
+from typing import Literal, Optional
 
 # ZIP Code Model
 class ViolationZipCode(BaseModel):
@@ -14,20 +14,57 @@ class ViolationZipCode(BaseModel):
 class ViolationAddress(BaseModel):
     street: str
 
-# Notice Base Model
-class NoticeBase(BaseModel):
+# Notice Fields a Client Writes
+# notification_sent is server-owned (set by the outbox), so it is not here
+# and a client that sends it is ignored
+class NoticeFields(BaseModel):
     notice_id: str
     violation_date_time: datetime
     detachment: str
     violation_severity: Literal["Low", "Medium", "High"]
     notice_status: Literal["Active", "Resolved", "Expired"]
-    notification_sent: bool
     entry_date: date
     expiry_date: date
     violation_description: str
 
+# Notice Base Model
+class NoticeBase(NoticeFields):
+    notification_sent: bool
+
+# One Page of a Driver's Notices
+# next_cursor is passed back as ?after= to get the following page
+class NoticePage(BaseModel):
+    notices: list[NoticeBase]
+    next_cursor: Optional[str]
+
+# Search Hit, With the Driver It Belongs To – Higher Score Is a Better Match
+class NoticeHit(NoticeBase):
+    driver_id: int
+    score: float
+
+# One Page of Search Hits
+# next_offset is passed back as ?offset= to get the following page
+class NoticeSearchPage(BaseModel):
+    notices: list[NoticeHit]
+    next_offset: Optional[int]
+
 # Notice Create Model
-class NoticeCreate(NoticeBase):
+class NoticeCreate(NoticeFields):
     car_id: int
     violation_zip: ViolationZipCode
     violation_address: ViolationAddress
+
+"""PATCH"""
+
+# Partial Update – Only the Fields Sent Are Written (null Leaves a Field Alone)
+class NoticePatch(BaseModel):
+    car_id: Optional[int] = None
+    violation_zip: Optional[ViolationZipCode] = None
+    violation_address: Optional[ViolationAddress] = None
+    violation_date_time: Optional[datetime] = None
+    detachment: Optional[str] = None
+    violation_severity: Optional[Literal["Low", "Medium", "High"]] = None
+    notice_status: Optional[Literal["Active", "Resolved", "Expired"]] = None
+    entry_date: Optional[date] = None
+    expiry_date: Optional[date] = None
+    violation_description: Optional[str] = None
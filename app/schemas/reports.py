@@ -0,0 +1,50 @@
+# app/schemas/reports.py
+from typing import Optional
+from pydantic import BaseModel
+
+# One Group of a Notice Count Report
+class ReportRow(BaseModel):
+    value: str
+    notice_count: int
+
+# Notice Counts Grouped by One Dimension
+class NoticeReport(BaseModel):
+    dimension: str
+    rows: list[ReportRow]
+
+# One Driver in the Out-of-State Report
+class OutOfStateRow(BaseModel):
+    driver_id: int
+    first_name: str
+    last_name: str
+    notice_count: int
+
+# Drivers With the Most Out-of-State Violations
+class OutOfStateReport(BaseModel):
+    drivers: list[OutOfStateRow]
+
+"""HOTSPOTS"""
+
+# One District's Notice Counts
+# histogram has one count per bucket (hour of week from Sunday 00:00, hour of day, or weekday from Sunday)
+class DistrictHotspots(BaseModel):
+    district: str
+    total: int
+    by_severity: dict[str, int]
+    histogram: list[int]
+
+# One of the Busiest District/Bucket Cells
+class HotspotCell(BaseModel):
+    district: str
+    bucket: int
+    notices: int
+
+# Notice Counts by District and Time Bucket
+class HotspotReport(BaseModel):
+    bucket: str
+    buckets: int
+    severity: Optional[str]
+    notices: int
+    as_of_seq: int
+    districts: list[DistrictHotspots]
+    hotspots: list[HotspotCell]
@@ -0,0 +1,119 @@
+# benchmarks/export_memory.py
+# Imports
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api import exports
+from app.api.routers.exports import _export_body
+from app.database import db_async, db_raw
+
+"""
+    Checks that GET /exports/notices streams in constant memory:
+
+        python benchmarks/export_memory.py [--rows N] [--format csv|parquet]
+
+    The export body is built exactly as the route builds it
+    (db_async.stream_export's read-ahead buffer, the encoder on
+    a worker thread), but db_raw.stream_export is swapped for a
+    generator of synthetic rows, so no database is needed. The
+    same export runs at a small and a large row count and the
+    peak memory of each is compared: Python allocations via
+    tracemalloc, plus Arrow's own allocator for Parquet. Exits
+    with status 1 if the large run's peak grows with the row
+    count.
+"""
+
+# Peak May Grow This Much Between the Small and Large Runs (Allocator Noise)
+TOLERANCE = 1.25
+
+# Chunks Shaped Like the "violations" Dataset, Built Lazily
+def synthetic_rows(dataset, chunk_size, rows=0, **filters):
+    started = datetime(2025, 1, 1, 8, 30)
+
+    for first in range(0, rows, chunk_size):
+        yield [
+            (
+                f"NTC{index:09d}", started - timedelta(minutes=index),
+                ("Low", "Medium", "High")[index % 3], "Active",
+                "Failure to yield to a pedestrian at a marked crosswalk",
+                index // 3, "Toyota", 2015 + index % 10, f"KX{index % 99999:05d}",
+                index // 5, "Jordan", "Rivera", "Brooklyn"
+            )
+            for index in range(first, min(first + chunk_size, rows))
+        ]
+
+# Stream One Export, Discarding the Bytes; (Bytes Sent, Peak Bytes)
+async def run_export(format: str, rows: int, chunk_size: int, buffered: int):
+    stream_export = db_raw.stream_export
+    db_raw.stream_export = lambda dataset, size, **filters: synthetic_rows(dataset, size, rows)
+
+    try:
+        encoder = exports.ENCODERS[format](db_raw.EXPORT_DATASETS["violations"]["columns"])
+        chunks = db_async.stream_export("violations", chunk_size, buffered)
+        sent = 0
+
+        tracemalloc.start()
+        arrow_before = exports.pa.default_memory_pool().max_memory() if exports.pa else 0
+
+        async for data in _export_body(encoder, chunks):
+            sent += len(data)
+
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Arrow's Pool Only Ever Reports Its Lifetime Maximum
+        if exports.pa:
+            peak += max(0, exports.pa.default_memory_pool().max_memory() - arrow_before)
+
+        return sent, peak
+
+    finally:
+        db_raw.stream_export = stream_export
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000, help="rows in the large run")
+    parser.add_argument("--format", choices=sorted(exports.ENCODERS), default=None, help="default: every available format")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--buffered", type=int, default=2)
+    args = parser.parse_args()
+
+    formats = [args.format] if args.format else [name for name in sorted(exports.ENCODERS) if exports.available(name)]
+    small = args.chunk_size * 5
+    failed = False
+
+    db_async.init_executor()
+
+    try:
+        for format in formats:
+            peaks = []
+
+            for rows in (small, args.rows):
+                started = time.perf_counter()
+                sent, peak = asyncio.run(run_export(format, rows, args.chunk_size, args.buffered))
+                elapsed = time.perf_counter() - started
+                peaks.append(peak)
+
+                print(
+                    f"{format:8} {rows:>10,} rows  {sent / 1e6:9.1f} MB sent  "
+                    f"peak {peak / 1e6:7.1f} MB  {rows / elapsed:10,.0f} rows/s"
+                )
+
+            if peaks[1] > peaks[0] * TOLERANCE:
+                failed = True
+                print(f"{format}: peak memory grew {peaks[1] / peaks[0]:.2f}x with {args.rows / small:.0f}x the rows")
+
+    finally:
+        db_async.shutdown_executor()
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
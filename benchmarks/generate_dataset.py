@@ -0,0 +1,416 @@
+# benchmarks/generate_dataset.py
+# Imports
+import argparse
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+from multiprocessing import Pool
+
+"""
+    Builds a synthetic notice_base dataset at production scale
+    and writes it as tab-separated files plus a load.sql that
+    pulls them in with LOAD DATA LOCAL INFILE.
+
+    Drivers are split into fixed-size chunks and every chunk is
+    generated by its own worker from its own seed, so the output
+    is identical for the same --seed however many --workers run.
+    IDs are explicit and start at --first-id, which keeps them
+    clear of the five seed cases in notice_base.sql.
+
+        python benchmarks/generate_dataset.py --notices 1000000 --out data/1m
+        mysql --local-infile=1 -u root -p notice_base < data/1m/load.sql
+        python -m app.database.rebuild_reports
+
+    The skew is deliberate: notices per car follow a Pareto
+    curve (a handful of cars collect hundreds of notices),
+    most violations happen in Manhattan and Brooklyn and most
+    drivers are registered in New York.
+"""
+
+"""REFERENCE DATA"""
+
+# Last Day the Schema's CHECK Constraints Allow
+REFERENCE_DATE = date(2025, 11, 11)
+
+# Violations Are Spread Over These Years
+FIRST_VIOLATION = date(2019, 1, 1)
+
+# Registration States, Weighted Towards New York
+REG_STATES = [
+    ("New York", "NY", ["New York", "Buffalo", "Yonkers", "Albany", "Rochester"], 70),
+    ("New Jersey", "NJ", ["Newark", "Jersey City", "Paterson", "Hoboken"], 12),
+    ("Connecticut", "CT", ["Stamford", "Hartford", "New Haven"], 5),
+    ("Pennsylvania", "PA", ["Philadelphia", "Pittsburgh", "Scranton"], 4),
+    ("Florida", "FL", ["Miami", "Orlando", "Tampa"], 3),
+    ("Massachusetts", "MA", ["Boston", "Worcester"], 2),
+    ("California", "CA", ["Los Angeles", "San Francisco", "San Diego"], 2),
+    ("Texas", "TX", ["Houston", "Dallas", "Austin"], 2)
+]
+
+# Boroughs Where Violations Are Written, Weighted by Volume
+DISTRICTS = [
+    ("Manhattan", 35),
+    ("Brooklyn", 28),
+    ("Queens", 20),
+    ("Bronx", 12),
+    ("Staten Island", 5)
+]
+
+STREETS = [
+    "Madison Avenue", "Broadway", "First Avenue", "Second Avenue", "Lexington Avenue",
+    "Park Avenue", "Atlantic Avenue", "Flatbush Avenue", "Queens Boulevard", "Jamaica Avenue",
+    "Grand Concourse", "Fordham Road", "Canal Street", "Houston Street", "Delancey Street",
+    "Ocean Parkway", "Northern Boulevard", "Victory Boulevard", "Hylan Boulevard", "Main Street",
+    "Bedford Avenue", "Myrtle Avenue", "Fulton Street", "Court Street", "Amsterdam Avenue"
+]
+
+FIRST_NAMES = [
+    "John", "Kevin", "Maria", "Jake", "Amy", "Rosa", "Charles", "Gina", "Terry", "Raymond",
+    "Sarah", "Michael", "Emily", "David", "Laura", "James", "Olivia", "Daniel", "Sofia", "Ahmed",
+    "Wei", "Priya", "Lucas", "Chloe", "Mateo", "Hannah", "Omar", "Grace", "Ivan", "Nina"
+]
+
+LAST_NAMES = [
+    "Doe", "Nicholas", "Smith", "Peralta", "Santiago", "Diaz", "Boyle", "Linetti", "Jeffords",
+    "Holt", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Martinez",
+    "Lopez", "Wilson", "Anderson", "Thomas", "Moore", "Jackson", "Lee", "Chen", "Patel", "Kim"
+]
+
+EYES = ["Brown", "Blue", "Green", "Hazel", "Grey", "Amber"]
+
+COLOURS = ["Black", "White", "Silver", "Grey", "Blue", "Red", "Green", "Yellow"]
+
+MAKES = [
+    ("Toyota", 18), ("Honda", 14), ("Ford", 13), ("Chevrolet", 10), ("Nissan", 9),
+    ("Hyundai", 7), ("BMW", 6), ("Mercedes-Benz", 6), ("Tesla", 5), ("Subaru", 5),
+    ("Volkswagen", 4), ("Kia", 3)
+]
+
+CAR_TYPES = [("Sedan", 45), ("SUV", 30), ("Hatchback", 10), ("Pickup", 8), ("Van", 4), ("Coupe", 3)]
+
+SEVERITIES = [("Low", 60), ("Medium", 30), ("High", 10)]
+
+# Days a Notice Stays Open, by Severity
+EXPIRY_DAYS = {"Low": 90, "Medium": 180, "High": 365}
+
+DESCRIPTIONS = [
+    "Vehicle was parked in a no-parking area near {street}.",
+    "Vehicle exceeded the speed limit on {street}.",
+    "Driver ran a red light at the junction with {street}.",
+    "Vehicle was double parked on {street}.",
+    "Vehicle was blocking a fire hydrant on {street}.",
+    "Driver failed to yield to pedestrians on {street}.",
+    "Vehicle was parked in a bus lane on {street}.",
+    "Expired meter on {street}."
+]
+
+ACTION_TYPES = [("Warning", 50), ("Fine", 35), ("Court Summons", 10), ("Vehicle Towed", 5)]
+
+# bcrypt (cost 12) of "officer_password" and "driver_password"
+OFFICER_HASH = "$2b$12$61bC1Sx4pWEQWSCHMKt3XOY/oS7sOK8zZ0iaUE8IXdVXE1fJDM9Ia"
+DRIVER_HASH = "$2b$12$/x914Ci/RcFvrL7L2PljoOviJFureJpz.FZcCAluWbwCXpVYLYjqu"
+
+"""TABLES"""
+
+# Load Order (Parents Before Children) and Column Lists
+TABLES = [
+    ("reg_zip_code", ["zip_code", "state", "city"]),
+    ("violation_zip_code", ["zip_code", "state", "city", "district"]),
+    ("officer_info", ["badge_number", "last_name", "first_name", "username", "password_hash"]),
+    ("reg_address", ["address_id", "zip_code", "street", "house"]),
+    ("driver_details", [
+        "driver_id", "address_id", "licence_number", "state_issue", "last_name", "first_name",
+        "dob", "height_inches", "weight_pounds", "eyes_colour"
+    ]),
+    ("driver_login", ["driver_id", "username", "password_hash"]),
+    ("car_details", [
+        "car_id", "driver_id", "address_id", "licence_plate", "plate_state_issue",
+        "vin", "colour", "make", "year_production", "car_type"
+    ]),
+    ("violation_address", ["address_id", "zip_code", "street"]),
+    ("notice_info", [
+        "notice_id", "car_id", "address_id", "violation_date_time", "detachment",
+        "violation_severity", "notice_status", "notification_sent", "entry_date",
+        "expiry_date", "violation_description"
+    ]),
+    ("actions", ["action_id", "notice_id", "badge_number", "action_type"])
+]
+
+# Tables Written Once by the Main Process
+SHARED_TABLES = ("reg_zip_code", "violation_zip_code", "officer_info")
+
+"""HELPERS"""
+
+# Weighted Picker That Avoids Rebuilding Cumulative Weights per Call
+class Weighted:
+    def __init__(self, pairs):
+        self.values = [value for value, _ in pairs]
+        self.cum_weights = []
+
+        total = 0
+        for _, weight in pairs:
+            total += weight
+            self.cum_weights.append(total)
+
+    def pick(self, rng, k=1):
+        return rng.choices(self.values, cum_weights=self.cum_weights, k=k)
+
+# One Line of a LOAD DATA File
+def _line(values):
+    return "\t".join("\\N" if value is None else str(value) for value in values) + "\n"
+
+# Pareto Weights – Few Heavy Hitters, Long Tail
+def _skewed_weights(rng, count: int):
+    return [rng.paretovariate(1.2) for _ in range(count)]
+
+"""SHARED DATA"""
+
+# ZIP Codes and Officers, Built Once From the Seed
+# ZIP+4 codes keep them apart from the seed cases' five-digit ZIPs
+def build_shared(seed: int, drivers: int, notices: int, officers: int):
+    rng = random.Random(seed)
+
+    reg_zips = []
+    reg_zip_count = min(40000, max(100, drivers // 50))
+    states = Weighted([((name, abbr, cities), weight) for name, abbr, cities, weight in REG_STATES])
+
+    for n, (name, abbr, cities) in enumerate(states.pick(rng, reg_zip_count)):
+        reg_zips.append((f"{10000 + n // 10000:05d}-{n % 10000:04d}", name, rng.choice(cities), abbr))
+
+    violation_zips = []
+    violation_zip_count = min(5000, max(50, notices // 2000))
+    districts = Weighted(DISTRICTS)
+
+    for n, district in enumerate(districts.pick(rng, violation_zip_count)):
+        violation_zips.append((f"{11000 + n // 10000:05d}-{n % 10000:04d}", "New York", "New York", district))
+
+    officer_rows = []
+    for n in range(officers):
+        officer_rows.append((
+            f"S{n:06d}", rng.choice(LAST_NAMES), rng.choice(FIRST_NAMES),
+            f"officer_{n}", OFFICER_HASH
+        ))
+
+    return reg_zips, violation_zips, officer_rows
+
+"""CHUNKS"""
+
+# Shared Data Handed to Each Worker Once
+_shared = None
+
+def _init_worker(shared):
+    global _shared
+    _shared = shared
+
+# Generate One Chunk of Drivers With Their Cars, Notices and Actions
+def write_chunk(task):
+    chunk, seed, first_id, driver_start, driver_end, notice_start, notice_end, out_dir = task
+    reg_zips, violation_zips, officer_rows = _shared
+
+    # Seeded per Chunk, so Output Does Not Depend on Worker Count
+    rng = random.Random(seed * 1_000_003 + chunk)
+
+    # Violations Crowd Into a Few ZIPs Too
+    violation_zip_weights = Weighted(list(zip(violation_zips, _skewed_weights(random.Random(seed), len(violation_zips)))))
+    officer_weights = Weighted(list(zip(officer_rows, _skewed_weights(random.Random(seed + 1), len(officer_rows)))))
+
+    makes = Weighted(MAKES)
+    car_types = Weighted(CAR_TYPES)
+    severities = Weighted(SEVERITIES)
+    action_types = Weighted(ACTION_TYPES)
+
+    files = {
+        table: open(os.path.join(out_dir, f"{table}.{chunk:05d}.tsv"), "w", encoding="utf-8", newline="\n")
+        for table, _ in TABLES if table not in SHARED_TABLES
+    }
+
+    try:
+        cars = []
+
+        # Drivers, Their Addresses and Cars
+        for driver_index in range(driver_start, driver_end):
+            driver_id = first_id + driver_index
+            zip_code, state, city, abbr = rng.choice(reg_zips)
+
+            files["reg_address"].write(_line((
+                driver_id, zip_code, rng.choice(STREETS), f"{rng.randint(1, 400)}{rng.choice('ABCDEF')}"
+            )))
+
+            dob = date(rng.randint(1945, 2007), rng.randint(1, 12), rng.randint(1, 28))
+
+            files["driver_details"].write(_line((
+                driver_id, driver_id, f"{abbr}{driver_id:09d}", state,
+                rng.choice(LAST_NAMES), rng.choice(FIRST_NAMES), dob,
+                rng.randint(58, 80), rng.randint(110, 300), rng.choice(EYES)
+            )))
+
+            files["driver_login"].write(_line((driver_id, f"driver_{driver_id}_user", DRIVER_HASH)))
+
+            # One Car Each, a Fifth of Drivers Have Two
+            # Car IDs leave a slot per driver for the second car
+            for slot in range(2 if rng.random() < 0.2 else 1):
+                car_id = first_id + driver_index * 2 + slot
+                cars.append(car_id)
+
+                files["car_details"].write(_line((
+                    car_id, driver_id, driver_id, f"{abbr}{car_id:08d}", state,
+                    f"SV{car_id:015d}", rng.choice(COLOURS), makes.pick(rng)[0],
+                    rng.randint(1995, 2025), car_types.pick(rng)[0]
+                )))
+
+        # Notices, Spread Unevenly Over the Chunk's Cars
+        notice_cars = Weighted(list(zip(cars, _skewed_weights(rng, len(cars)))))
+        span = (REFERENCE_DATE - FIRST_VIOLATION).days
+
+        for notice_index in range(notice_start, notice_end):
+            address_id = first_id + notice_index
+            notice_id = f"S{notice_index:010d}"
+            zip_code, _, _, district = violation_zip_weights.pick(rng)[0]
+            street = rng.choice(STREETS)
+
+            files["violation_address"].write(_line((address_id, zip_code, street)))
+
+            violated_at = datetime.combine(
+                FIRST_VIOLATION + timedelta(days=rng.randrange(span)),
+                datetime.min.time()
+            ) + timedelta(minutes=rng.randrange(24 * 60))
+
+            severity = severities.pick(rng)[0]
+            entry_date = violated_at.date() + timedelta(days=rng.randint(0, 3))
+            expiry_date = entry_date + timedelta(days=EXPIRY_DAYS[severity])
+
+            # Status Follows the Expiry Date
+            if expiry_date < REFERENCE_DATE:
+                notice_status = "Expired" if rng.random() < 0.6 else "Resolved"
+            else:
+                notice_status = "Active" if rng.random() < 0.7 else "Resolved"
+
+            # Recent Notices May Still Be Waiting For Their Letter
+            notification_sent = 0 if (REFERENCE_DATE - entry_date).days < 14 and rng.random() < 0.5 else 1
+
+            files["notice_info"].write(_line((
+                notice_id, notice_cars.pick(rng)[0], address_id,
+                violated_at.strftime("%Y-%m-%d %H:%M:%S"),
+                f"NYD-{rng.randint(1, 99):02d}", severity, notice_status, notification_sent,
+                entry_date, expiry_date, rng.choice(DESCRIPTIONS).format(street=street)
+            )))
+
+            # About a Third of Notices Have an Officer Action
+            if rng.random() < 0.3:
+                files["actions"].write(_line((
+                    f"SA{notice_index:010d}", notice_id,
+                    officer_weights.pick(rng)[0][0], action_types.pick(rng)[0]
+                )))
+
+    finally:
+        for handle in files.values():
+            handle.close()
+
+    return chunk, driver_end - driver_start, notice_end - notice_start
+
+"""OUTPUT"""
+
+# Write the Main Process' Tables
+def write_shared(out_dir: str, shared):
+    reg_zips, violation_zips, officer_rows = shared
+
+    rows = {
+        "reg_zip_code": [(zip_code, state, city) for zip_code, state, city, _ in reg_zips],
+        "violation_zip_code": violation_zips,
+        "officer_info": officer_rows
+    }
+
+    for table, table_rows in rows.items():
+        with open(os.path.join(out_dir, f"{table}.tsv"), "w", encoding="utf-8", newline="\n") as handle:
+            handle.writelines(_line(row) for row in table_rows)
+
+# One LOAD DATA Statement per File, Parents First
+def write_load_script(out_dir: str, chunks: int):
+    statements = [
+        "# Generated by benchmarks/generate_dataset.py",
+        "# Run with: mysql --local-infile=1 notice_base < load.sql",
+        "SET foreign_key_checks = 0;",
+        "SET unique_checks = 0;",
+        ""
+    ]
+
+    for table, columns in TABLES:
+        if table in SHARED_TABLES:
+            names = [f"{table}.tsv"]
+        else:
+            names = [f"{table}.{chunk:05d}.tsv" for chunk in range(chunks)]
+
+        for name in names:
+            path = os.path.abspath(os.path.join(out_dir, name)).replace("\\", "/")
+
+            statements.append(
+                f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table} "
+                f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)});"
+            )
+
+    statements += [
+        "",
+        "SET unique_checks = 1;",
+        "SET foreign_key_checks = 1;",
+        "",
+        "# Afterwards: python -m app.database.rebuild_reports",
+        ""
+    ]
+
+    with open(os.path.join(out_dir, "load.sql"), "w", encoding="utf-8", newline="\n") as handle:
+        handle.write("\n".join(statements))
+
+"""MAIN"""
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic notice_base dataset for LOAD DATA.")
+    parser.add_argument("--notices", type=int, default=10000, help="Total notices (10k to 50M)")
+    parser.add_argument("--notices-per-driver", type=float, default=8.0, help="Average notices per driver")
+    parser.add_argument("--officers", type=int, default=None, help="Officers (default: one per 20k notices, at least 10)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--first-id", type=int, default=1000, help="First integer ID, clear of the seed data")
+    parser.add_argument("--chunk-drivers", type=int, default=25000, help="Drivers generated per task")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="data")
+    args = parser.parse_args()
+
+    drivers = max(1, int(args.notices / args.notices_per_driver))
+    officers = args.officers or max(10, args.notices // 20000)
+    chunks = -(-drivers // args.chunk_drivers)
+
+    os.makedirs(args.out, exist_ok=True)
+
+    shared = build_shared(args.seed, drivers, args.notices, officers)
+    write_shared(args.out, shared)
+
+    # Each Chunk Gets Its Share of Notices, Totals Stay Exact
+    tasks = []
+    for chunk in range(chunks):
+        driver_start = chunk * args.chunk_drivers
+        driver_end = min(drivers, driver_start + args.chunk_drivers)
+
+        tasks.append((
+            chunk, args.seed, args.first_id, driver_start, driver_end,
+            args.notices * driver_start // drivers, args.notices * driver_end // drivers,
+            args.out
+        ))
+
+    started = time.perf_counter()
+    written = 0
+
+    with Pool(args.workers, initializer=_init_worker, initargs=(shared,)) as pool:
+        for chunk, _, chunk_notices in pool.imap_unordered(write_chunk, tasks):
+            written += chunk_notices
+            print(f"chunk {chunk + 1}/{chunks} done, {written:,}/{args.notices:,} notices", flush=True)
+
+    write_load_script(args.out, chunks)
+
+    print(
+        f"{drivers:,} drivers, {args.notices:,} notices, {officers:,} officers "
+        f"in {time.perf_counter() - started:.1f}s -> {os.path.join(args.out, 'load.sql')}"
+    )
+
+if __name__ == "__main__":
+    main()
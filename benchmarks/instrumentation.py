@@ -0,0 +1,67 @@
+# benchmarks/instrumentation.py
+# Imports
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import metrics
+
+"""
+    Measures what the /metrics instrumentation adds to a db_raw
+    call, with a stand-in cursor so only the wrapper is timed:
+
+        python benchmarks/instrumentation.py
+
+    A typical call (one statement, one fetch) against a real
+    MySQL round trip of 100-500 microseconds is the yardstick.
+"""
+
+# Cursor That Answers Instantly
+class FakeCursor:
+    description = (("driver_id",),)
+    rowcount = 1
+
+    def execute(self, query, args=None):
+        return 1
+
+    def fetchone(self):
+        return (1, "New York", "Doe", "John")
+
+    def close(self):
+        pass
+
+QUERY = "SELECT driver_id, state_issue, last_name, first_name FROM driver_details WHERE driver_id = %s"
+
+# One Statement, One Row – the Shape of fetch_driver_details
+def lookup(cursor):
+    cursor.execute(QUERY, (1,))
+    row = cursor.fetchone()
+    cursor.close()
+    return row
+
+def plain():
+    return lookup(FakeCursor())
+
+@metrics.timed
+def instrumented():
+    return lookup(metrics.InstrumentedCursor(FakeCursor()))
+
+def main(number: int = 200000):
+    results = {}
+
+    for name, func in (("plain", plain), ("instrumented", instrumented)):
+        # Best of Five Damps Scheduler Noise
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        results[name] = best / number * 1e9
+
+    overhead = results["instrumented"] - results["plain"]
+
+    print(f"plain call         {results['plain']:8.0f} ns")
+    print(f"instrumented call  {results['instrumented']:8.0f} ns")
+    print(f"overhead           {overhead:8.0f} ns per db_raw call")
+    print(f"                   {overhead / 1000 / 200:8.2%} of a 200 us query")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,679 @@
+# benchmarks/run.py
+# Imports
+import argparse
+import http.client
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote, urlsplit
+from generate_dataset import FIRST_NAMES, LAST_NAMES
+
+"""
+    End-to-end benchmark for the API. Boots the app with
+    uvicorn (or targets an already running one with --url),
+    drives the drivers, notices and auth routes from a pool of
+    client threads and reports throughput and p50/p95/p99
+    latency per route and per mix. Mixes that combine token
+    routes with other routes (the login storm) also report the
+    two groups separately.
+
+    Expects a database filled by generate_dataset.py; pass the
+    same --notices / --notices-per-driver / --first-id so the
+    harness knows which driver and car IDs exist. Writes only
+    ever touch rows the run created itself.
+
+        python benchmarks/run.py --mix shift --mix login --concurrency 32 --duration 30
+        python benchmarks/run.py --save-baseline            # record benchmarks/baseline.json
+        python benchmarks/run.py --threshold 0.15           # exit 1 on a >15% regression
+"""
+
+"""SETTINGS"""
+
+# Seed Logins (notice_base.sql and generate_dataset.py)
+OFFICER_USER = ("officer_user", "officer_password")
+DRIVER_PASSWORD = "driver_password"
+
+# Records per Bulk Request
+BULK_SIZE = 500
+
+# Drivers per NDJSON Stream (Each Stream Reads the Last This Many Drivers)
+STREAM_ROWS = 10000
+
+# Description Searches, From Narrow (Few Hits) to Broad
+NOTICE_SEARCHES = ["hydrant", "bus lane", "double parked", "red light junction", "pedestrians", "meter"]
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+"""HTTP CLIENT"""
+
+# One Keep-Alive Connection per Client Thread
+class Client:
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        self._host = parts.hostname
+        self._port = parts.port or 80
+        self._timeout = timeout
+        self._conn = None
+
+    def request(self, method: str, path: str, body=None, token=None, content_type="application/json"):
+        headers = {}
+
+        if token is not None:
+            headers["Authorization"] = f"Bearer {token}"
+
+        if body is not None:
+            headers["Content-Type"] = content_type
+
+            if not isinstance(body, (bytes, str)):
+                body = json.dumps(body)
+
+        # Reconnect Once if the Server Closed a Keep-Alive Connection
+        for attempt in range(2):
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+                self._conn.connect()
+
+                # Small Requests Go Out Immediately
+                self._conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            try:
+                self._conn.request(method, path, body=body, headers=headers)
+                response = self._conn.getresponse()
+                data = response.read()
+                return response.status, data
+
+            except (http.client.HTTPException, ConnectionError):
+                self._conn.close()
+                self._conn = None
+
+                if attempt:
+                    raise
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+
+"""DATASET"""
+
+# Which Rows Exist, Mirroring generate_dataset.py's ID Layout
+class Dataset:
+    def __init__(self, notices: int, notices_per_driver: float, first_id: int):
+        self.drivers = max(1, int(notices / notices_per_driver))
+        self.first_id = first_id
+
+    def driver_id(self, rng):
+        return self.first_id + rng.randrange(self.drivers)
+
+    # Every Driver Has a Car in Slot 0
+    def car_id(self, rng):
+        return self.first_id + rng.randrange(self.drivers) * 2
+
+"""PAYLOADS"""
+
+def driver_payload(rng, tag: str):
+    return {
+        "address": {
+            "zip_code": "10103",
+            "state": "New York",
+            "city": "New York",
+            "street": "Madison Avenue",
+            "house": f"{rng.randint(1, 400)}A"
+        },
+        "licence_number": f"BN{tag}"[:20],
+        "state_issue": "New York",
+        "last_name": "Bench",
+        "first_name": "Mark",
+        "dob": "1990-01-01",
+        "height_inches": rng.randint(58, 80),
+        "weight_pounds": rng.randint(110, 300),
+        "eyes_colour": "Brown"
+    }
+
+def notice_payload(rng, notice_id: str, car_id: int):
+    violated_at = datetime(2025, 1, 1) + timedelta(minutes=rng.randrange(300 * 24 * 60))
+
+    return {
+        "notice_id": notice_id,
+        "car_id": car_id,
+        "violation_date_time": violated_at.isoformat(),
+        "detachment": "NYD-01",
+        "violation_severity": rng.choice(["Low", "Medium", "High"]),
+        "notice_status": "Active",
+        "entry_date": violated_at.date().isoformat(),
+        "expiry_date": (violated_at.date() + timedelta(days=90)).isoformat(),
+        "violation_description": "Benchmark notice.",
+        "violation_zip": {
+            "zip_code": "11201",
+            "state": "New York",
+            "city": "New York",
+            "district": "Brooklyn"
+        },
+        "violation_address": {"street": "First Avenue"}
+    }
+
+"""OPERATIONS"""
+
+# Each Operation Returns (route label, HTTP status)
+# `worker` carries the thread's client, RNG and the rows it created
+
+def op_driver_get(worker):
+    return "GET /drivers/{id}", worker.get(f"/drivers/{worker.dataset.driver_id(worker.rng)}")
+
+def op_driver_page(worker):
+    after = worker.dataset.driver_id(worker.rng)
+    return "GET /drivers", worker.get(f"/drivers?after={after}&limit=100")
+
+# Officers Only; Holds a Stream Slot and a Server-Side Cursor Until the Body Is Read
+def op_driver_stream(worker):
+    after = max(0, worker.dataset.first_id + worker.dataset.drivers - 1 - STREAM_ROWS)
+    status, _ = worker.send("GET", f"/drivers?format=ndjson&after={after}")
+    return "GET /drivers?format=ndjson", status
+
+def op_notice_get(worker):
+    return "GET /notices/{driver_id}", worker.get(f"/notices/{worker.dataset.driver_id(worker.rng)}")
+
+def op_notice_filtered(worker):
+    driver_id = worker.dataset.driver_id(worker.rng)
+    return "GET /notices/{driver_id}?filters", worker.get(f"/notices/{driver_id}?violation_severity=High&notice_status=Active")
+
+def op_driver_post(worker):
+    status, data = worker.send("POST", "/drivers", driver_payload(worker.rng, worker.tag()))
+
+    if status == 201:
+        worker.drivers.append(json.loads(data)["driver_id"])
+
+    return "POST /drivers", status
+
+def op_driver_put(worker):
+    if not worker.drivers:
+        return op_driver_post(worker)
+
+    driver_id = worker.rng.choice(worker.drivers)
+    status, _ = worker.send("PUT", f"/drivers/{driver_id}", driver_payload(worker.rng, worker.tag()))
+    return "PUT /drivers/{id}", status
+
+# One or Two Fields, Like a Clerk Correcting a Record
+def op_driver_patch(worker):
+    if not worker.drivers:
+        return op_driver_post(worker)
+
+    driver_id = worker.rng.choice(worker.drivers)
+    body = {"weight_pounds": worker.rng.randint(110, 300)}
+
+    if worker.rng.random() < 0.5:
+        body["eyes_colour"] = worker.rng.choice(["Brown", "Blue", "Green", "Hazel"])
+
+    status, _ = worker.send("PATCH", f"/drivers/{driver_id}", body)
+    return "PATCH /drivers/{id}", status
+
+def op_driver_delete(worker):
+    if not worker.drivers:
+        return op_driver_post(worker)
+
+    status, _ = worker.send("DELETE", f"/drivers/{worker.drivers.pop()}")
+    return "DELETE /drivers/{id}", status
+
+def op_notice_post(worker):
+    notice_id = worker.tag()
+    status, _ = worker.send("POST", "/notices", notice_payload(worker.rng, notice_id, worker.dataset.car_id(worker.rng)))
+
+    if status == 200:
+        worker.notices.append(notice_id)
+
+    return "POST /notices", status
+
+def op_notice_put(worker):
+    if not worker.notices:
+        return op_notice_post(worker)
+
+    notice_id = worker.rng.choice(worker.notices)
+    status, _ = worker.send("PUT", f"/notices/{notice_id}", notice_payload(worker.rng, notice_id, worker.dataset.car_id(worker.rng)))
+    return "PUT /notices/{id}", status
+
+# Status Change, Sometimes With a Severity Correction
+def op_notice_patch(worker):
+    if not worker.notices:
+        return op_notice_post(worker)
+
+    notice_id = worker.rng.choice(worker.notices)
+    body = {"notice_status": worker.rng.choice(["Active", "Resolved"])}
+
+    if worker.rng.random() < 0.5:
+        body["violation_severity"] = worker.rng.choice(["Low", "Medium", "High"])
+
+    status, _ = worker.send("PATCH", f"/notices/{notice_id}", body)
+    return "PATCH /notices/{id}", status
+
+def op_notice_delete(worker):
+    if not worker.notices:
+        return op_notice_post(worker)
+
+    status, _ = worker.send("DELETE", f"/notices/{worker.notices.pop()}")
+    return "DELETE /notices/{id}", status
+
+def op_driver_bulk(worker):
+    body = [driver_payload(worker.rng, worker.tag()) for _ in range(BULK_SIZE)]
+    status, _ = worker.send("POST", "/drivers/bulk", body)
+    return "POST /drivers/bulk", status
+
+def op_notice_bulk(worker):
+    body = "".join(
+        json.dumps(notice_payload(worker.rng, worker.tag(), worker.dataset.car_id(worker.rng))) + "\n"
+        for _ in range(BULK_SIZE)
+    )
+    status, _ = worker.send("POST", "/notices/bulk", body, content_type="application/x-ndjson")
+    return "POST /notices/bulk", status
+
+def op_login(worker):
+    status, _ = worker.client.request("POST", "/token", {"username": OFFICER_USER[0], "password": OFFICER_USER[1]})
+    return "POST /token", status
+
+def op_driver_login(worker):
+    driver_id = worker.dataset.driver_id(worker.rng)
+    status, _ = worker.client.request(
+        "POST", "/token/driver",
+        {"username": f"driver_{driver_id}_user", "password": DRIVER_PASSWORD}
+    )
+    return "POST /token/driver", status
+
+def op_refresh(worker):
+    status, _ = worker.send("PUT", "/token")
+    return "PUT /token", status
+
+# Logs Out a Freshly Refreshed Token, Never the Shared One
+def op_logout(worker):
+    status, data = worker.send("PUT", "/token")
+
+    if status != 200:
+        return "DELETE /token", status
+
+    token = json.loads(data)["access_token"]
+    status, _ = worker.client.request("DELETE", "/token", token=token)
+    return "DELETE /token", status
+
+def op_notice_search(worker):
+    q = quote(worker.rng.choice(NOTICE_SEARCHES))
+    status, _ = worker.send("GET", f"/notices/search?q={q}&limit=20")
+    return "GET /notices/search", status
+
+# Last Name, Sometimes With a First-Name Prefix
+def op_driver_search(worker):
+    q = worker.rng.choice(LAST_NAMES)
+
+    if worker.rng.random() < 0.5:
+        q = f"{worker.rng.choice(FIRST_NAMES)[:3]} {q}"
+
+    status, _ = worker.send("GET", f"/drivers/search?q={quote(q)}&limit=20")
+    return "GET /drivers/search", status
+
+"""MIXES"""
+
+# Operation Weights per Scenario
+MIXES = {
+    # Officers looking drivers and notices up during a shift
+    "shift": [
+        (op_driver_get, 30), (op_notice_get, 35), (op_notice_filtered, 10),
+        (op_driver_page, 8), (op_driver_stream, 2), (op_notice_post, 5), (op_notice_put, 3),
+        (op_notice_patch, 2), (op_driver_patch, 2), (op_refresh, 3)
+    ],
+    # Single-record writes across both routers
+    "crud": [
+        (op_driver_post, 20), (op_driver_put, 10), (op_driver_patch, 10), (op_driver_delete, 10),
+        (op_notice_post, 20), (op_notice_put, 10), (op_notice_patch, 10), (op_notice_delete, 10)
+    ],
+    # Batch imports
+    "bulk": [(op_driver_bulk, 40), (op_notice_bulk, 60)],
+    # Free-text lookups (the 50 ms target is for p95 at millions of notices)
+    "search": [(op_notice_search, 60), (op_driver_search, 40)],
+    # Everyone signing in at once (start of a shift), while lookups carry on
+    "login": [
+        (op_login, 45), (op_driver_login, 20), (op_refresh, 5), (op_logout, 5),
+        (op_driver_get, 15), (op_notice_get, 10)
+    ]
+}
+
+# Token Routes, Reported Apart From Everything Else in a Mix
+AUTH_ROUTES = {"POST /token", "POST /token/driver", "PUT /token", "DELETE /token"}
+
+"""RUNNER"""
+
+# State of One Client Thread
+class Worker:
+    def __init__(self, run_id: str, index: int, base_url: str, token: str, dataset: Dataset, seed: int, timeout: float):
+        self.client = Client(base_url, timeout)
+        self.rng = random.Random(seed * 1000 + index)
+        self.token = token
+        self.dataset = dataset
+        self.drivers = []
+        self.notices = []
+        self._prefix = f"{run_id}{index:03d}"
+        self._counter = 0
+
+        # Route Label -> Latencies (Seconds), Error Count
+        self.latencies = {}
+        self.errors = {}
+
+    # Unique Suffix For IDs the Run Creates
+    def tag(self):
+        self._counter += 1
+        return f"{self._prefix}{self._counter:07d}"
+
+    def get(self, path: str):
+        return self.client.request("GET", path)[0]
+
+    def send(self, method: str, path: str, body=None, content_type="application/json"):
+        return self.client.request(method, path, body=body, token=self.token, content_type=content_type)
+
+    def run(self, operations, weights, warmup_until: float, stop_at: float):
+        while True:
+            started = time.perf_counter()
+
+            if started >= stop_at:
+                break
+
+            operation = self.rng.choices(operations, cum_weights=weights)[0]
+
+            try:
+                route, status = operation(self)
+            except Exception:
+                route, status = operation.__name__, None
+
+            elapsed = time.perf_counter() - started
+
+            # Warm-Up Requests Are Not Counted
+            if started < warmup_until:
+                continue
+
+            self.latencies.setdefault(route, []).append(elapsed)
+
+            if status is None or status >= 400:
+                self.errors[route] = self.errors.get(route, 0) + 1
+
+# Nearest-Rank Percentile of a Sorted List
+def percentile(values, p: float):
+    if not values:
+        return 0.0
+
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+# Summary of One Set of Latencies
+def summarise(latencies, errors: int, seconds: float):
+    latencies.sort()
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / seconds if seconds else 0.0,
+        "mean_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+        "p50_ms": 1000 * percentile(latencies, 50),
+        "p95_ms": 1000 * percentile(latencies, 95),
+        "p99_ms": 1000 * percentile(latencies, 99),
+        "max_ms": 1000 * latencies[-1] if latencies else 0.0
+    }
+
+# Run One Mix and Summarise It
+def run_mix(name: str, args, token: str, dataset: Dataset):
+    operations = [operation for operation, _ in MIXES[name]]
+    weights = []
+    total = 0
+
+    for _, weight in MIXES[name]:
+        total += weight
+        weights.append(total)
+
+    run_id = f"{int(time.time()) % 100000:05d}{name[0].upper()}"
+    workers = [
+        Worker(run_id, index, args.url, token, dataset, args.seed, args.timeout)
+        for index in range(args.concurrency)
+    ]
+
+    now = time.perf_counter()
+    warmup_until = now + args.warmup
+    stop_at = warmup_until + args.duration
+
+    threads = [
+        threading.Thread(target=worker.run, args=(operations, weights, warmup_until, stop_at))
+        for worker in workers
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    for worker in workers:
+        worker.client.close()
+
+    # Merge Per-Thread Results
+    latencies = {}
+    errors = {}
+
+    for worker in workers:
+        for route, values in worker.latencies.items():
+            latencies.setdefault(route, []).extend(values)
+
+        for route, count in worker.errors.items():
+            errors[route] = errors.get(route, 0) + count
+
+    every = [value for values in latencies.values() for value in values]
+    result = {
+        "overall": summarise(every, sum(errors.values()), args.duration),
+        "routes": {
+            route: summarise(values, errors.get(route, 0), args.duration)
+            for route, values in sorted(latencies.items())
+        }
+    }
+
+    # Mixes With Both Kinds of Route Also Get a Summary per Kind
+    groups = {"auth": [], "other": []}
+
+    for route in latencies:
+        groups["auth" if route in AUTH_ROUTES else "other"].append(route)
+
+    if groups["auth"] and groups["other"]:
+        result["groups"] = {
+            group: summarise(
+                [value for route in routes for value in latencies[route]],
+                sum(errors.get(route, 0) for route in routes),
+                args.duration
+            )
+            for group, routes in groups.items()
+        }
+
+    return result
+
+"""SERVER"""
+
+# Start uvicorn and Wait Until the Health Check Answers
+def boot_server(args):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(args.port),
+            "--workers", str(args.server_workers),
+            "--log-level", "warning", "--no-access-log"
+        ],
+        cwd=root
+    )
+
+    client = Client(args.url, 1.0)
+    deadline = time.monotonic() + 30
+
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("uvicorn exited during start-up")
+
+        try:
+            if client.request("GET", "/")[0] == 200:
+                client.close()
+                return server
+        except OSError:
+            pass
+
+        time.sleep(0.2)
+
+    server.terminate()
+    raise SystemExit("uvicorn did not become healthy within 30s")
+
+# Officer Token Used by the Write Routes
+def officer_token(args):
+    client = Client(args.url, args.timeout)
+    status, data = client.request("POST", "/token", {"username": OFFICER_USER[0], "password": OFFICER_USER[1]})
+    client.close()
+
+    if status != 200:
+        raise SystemExit(f"Officer login failed ({status}): {data[:200]!r}")
+
+    return json.loads(data)["access_token"]
+
+"""BASELINE"""
+
+# Routes That Got Slower or Lost Throughput Beyond the Threshold
+def compare(results, baseline, threshold: float):
+    regressions = []
+
+    for mix, current in results["mixes"].items():
+        previous = baseline.get("mixes", {}).get(mix)
+
+        if previous is None:
+            continue
+
+        groups = {f"[{group}]": row for group, row in current.get("groups", {}).items()}
+
+        for route, now in [("overall", current["overall"]), *groups.items(), *current["routes"].items()]:
+            if route == "overall":
+                before = previous["overall"]
+            elif route in groups:
+                before = previous.get("groups", {}).get(route[1:-1])
+            else:
+                before = previous["routes"].get(route)
+
+            if before is None:
+                continue
+
+            if before["throughput"] and now["throughput"] < before["throughput"] * (1 - threshold):
+                regressions.append(f"{mix} {route}: throughput {before['throughput']:.1f} -> {now['throughput']:.1f} req/s")
+
+            for key in ("p95_ms", "p99_ms"):
+                if before[key] and now[key] > before[key] * (1 + threshold):
+                    regressions.append(f"{mix} {route}: {key} {before[key]:.2f} -> {now[key]:.2f}")
+
+            # New Errors Are Always a Regression
+            if now["errors"] > before["errors"] and now["errors"] / max(now["requests"], 1) > 0.001:
+                regressions.append(f"{mix} {route}: errors {before['errors']} -> {now['errors']}")
+
+    return regressions
+
+"""REPORT"""
+
+def print_mix(name: str, result):
+    print(f"\n{name}")
+    print(f"  {'route':<34} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+
+    groups = [(f"[{group}]", row) for group, row in result.get("groups", {}).items()]
+
+    for route, row in [*result["routes"].items(), *groups, ("overall", result["overall"])]:
+        print(
+            f"  {route:<34} {row['throughput']:>9.1f} {row['p50_ms']:>8.2f} "
+            f"{row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['errors']:>7}"
+        )
+
+"""MAIN"""
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end API benchmark.")
+    parser.add_argument("--url", help="Benchmark a running server instead of booting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--server-workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--mix", action="append", choices=sorted(MIXES), help="Repeatable (default: all)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Client threads")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds per mix")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured seconds per mix")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--notices", type=int, default=10000, help="As passed to generate_dataset.py")
+    parser.add_argument("--notices-per-driver", type=float, default=8.0)
+    parser.add_argument("--first-id", type=int, default=1000)
+    parser.add_argument("--out", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed regression (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    server = None
+
+    if args.url is None:
+        args.url = f"http://127.0.0.1:{args.port}"
+        server = boot_server(args)
+
+    try:
+        token = officer_token(args)
+        dataset = Dataset(args.notices, args.notices_per_driver, args.first_id)
+
+        results = {
+            "meta": {
+                "started": datetime.now(timezone.utc).isoformat(),
+                "url": args.url,
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "server_workers": args.server_workers,
+                "drivers": dataset.drivers,
+                "python": platform.python_version(),
+                "machine": platform.machine()
+            },
+            "mixes": {}
+        }
+
+        for name in args.mix or list(MIXES):
+            results["mixes"][name] = run_mix(name, args, token, dataset)
+            print_mix(name, results["mixes"][name])
+
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    with open(args.out, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2)
+
+    print(f"\nResults written to {args.out}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against (run with --save-baseline)")
+        return
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+
+    regressions = compare(results, baseline, args.threshold)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+
+        for line in regressions:
+            print(f"  {line}")
+
+        sys.exit(1)
+
+    print(f"No regressions beyond {args.threshold:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/verify_token.py
+# Imports
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jose import jwt
+from app.core import security
+
+"""
+    Measures verify_token, the check every protected request
+    makes, and the revocation list behind logout:
+
+        python benchmarks/verify_token.py [--revoked N] [--storm N]
+
+    "cached" reuses fewer distinct tokens than the verified-token
+    cache holds, so the signature is checked once per token;
+    "uncached" cycles through more than it holds, so every call
+    decodes and checks the HMAC (what every call did before the
+    cache). Both run with --revoked live revocations in the
+    list. The logout storm then revokes tokens that expire a
+    few seconds later and shows the list emptying on its own.
+"""
+
+def tokens(count: int):
+    return [security.create_access_token({"sub": f"officer{n}", "role": "officer"}) for n in range(count)]
+
+# Calls per Second Over a Token Working Set, Best of Three
+def throughput(working_set, calls: int):
+    best = 0.0
+
+    for _ in range(3):
+        started = time.perf_counter()
+
+        for n in range(calls):
+            security.verify_token(working_set[n % len(working_set)])
+
+        best = max(best, calls / (time.perf_counter() - started))
+
+    return best
+
+# Plain jwt.decode per Call, for Reference
+def decode_throughput(working_set, calls: int):
+    started = time.perf_counter()
+
+    for n in range(calls):
+        jwt.decode(working_set[n % len(working_set)], security.SECRET_KEY, algorithms=[security.ALGORITHM])
+
+    return calls / (time.perf_counter() - started)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--revoked", type=int, default=100000, help="live revocations while measuring")
+    parser.add_argument("--storm", type=int, default=200000, help="logouts in the storm")
+    args = parser.parse_args()
+
+    cache_size = security.VERIFIED_TOKEN_CACHE_SIZE
+
+    # Live Revocations the Lookups Run Against
+    live_until = time.time() + 3600
+
+    for _ in range(args.revoked):
+        security.revoked_tokens.revoke(str(uuid.uuid4()), live_until)
+
+    hot = tokens(cache_size // 2)
+    cold = tokens(cache_size * 4)
+
+    print(f"verify_token with {len(security.revoked_tokens)} revoked tokens listed")
+    print(f"{'jwt.decode only':22} {decode_throughput(cold, args.calls // 5):12,.0f} calls/s")
+    print(f"{'uncached':22} {throughput(cold, args.calls // 5):12,.0f} calls/s")
+    print(f"{'cached':22} {throughput(hot, args.calls):12,.0f} calls/s")
+
+    # Logout Storm – Tokens Expiring Shortly After the Last Logout
+    security.revoked_tokens = security.RevocationList()
+
+    tracemalloc.start()
+    expires = time.time() + 10.0
+
+    for _ in range(args.storm):
+        security.revoked_tokens.revoke(str(uuid.uuid4()), expires)
+
+    listed = len(security.revoked_tokens)
+    _, peak = tracemalloc.get_traced_memory()
+
+    time.sleep(max(0.0, expires - time.time()) + 0.1)
+
+    # The Next Logout Purges Everything Already Expired
+    security.revoked_tokens.revoke(str(uuid.uuid4()), time.time() + 60)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"\nlogout storm: {args.storm:,} revocations, {listed:,} listed at the peak "
+        f"({peak / 1e6:.1f} MB), {len(security.revoked_tokens)} listed once they expired "
+        f"({current / 1e6:.1f} MB)"
+    )
+
+if __name__ == "__main__":
+    main()
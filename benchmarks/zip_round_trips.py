@@ -0,0 +1,158 @@
+# benchmarks/zip_round_trips.py
+# Imports
+import argparse
+import os
+import random
+import sys
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import tracing
+from app.database import db_raw
+from app.database.pool import ConnectionPool
+from app.schemas.drivers import DriverCreate
+from app.schemas.notices import NoticeCreate
+
+"""
+    Counts the SQL round trips the in-memory ZIP dimension saves
+    on the four write paths that take a ZIP code:
+
+        python benchmarks/zip_round_trips.py [--writes N] [--zips N] [--rtt-ms MS]
+
+    Each write runs against a stand-in connection, so only the
+    statements db_raw sends are counted (the same count the
+    Server-Timing header reports). Before the set, every write
+    ran SELECT 1 FROM ..._zip_code first and an INSERT when the
+    ZIP was new; now a known ZIP costs nothing and a new one a
+    single INSERT IGNORE, so each write saves exactly the one
+    SELECT. The mix replays N writes over a pool of ZIPs and
+    shows how often the set answers.
+"""
+
+# Connection That Answers Every Statement Instantly
+class FakeCursor:
+    description = None
+    rowcount = 1
+    lastrowid = 1
+
+    def execute(self, query, args=None):
+        return 1
+
+    # Every Existence Check Finds Its Row (the Car Being Ticketed, the Old Owner)
+    def fetchone(self):
+        return (1,)
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def cursor(self, *args):
+        return FakeCursor()
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def ping(self):
+        pass
+
+    def close(self):
+        pass
+
+def driver(zip_code: str):
+    return DriverCreate(
+        address={"zip_code": zip_code, "state": "NY", "city": "New York", "street": "Main St", "house": "1"},
+        licence_number="L00001", state_issue="NY", last_name="Doe", first_name="Jo",
+        dob=date(1990, 1, 1), height_inches=70, weight_pounds=160, eyes_colour="Brown"
+    )
+
+def notice(zip_code: str):
+    return NoticeCreate(
+        notice_id="NTC0000001", car_id=1, violation_date_time=datetime(2025, 1, 1, 8),
+        detachment="North", violation_severity="Low", notice_status="Active",
+        entry_date=date(2025, 1, 2), expiry_date=date(2025, 4, 2),
+        violation_description="Speeding",
+        violation_zip={"zip_code": zip_code, "state": "NY", "city": "New York", "district": "Manhattan"},
+        violation_address={"street": "Canal St"}
+    )
+
+# The Four Writes, Each Taking the ZIP to Use
+WRITES = {
+    "create_driver": lambda zip_code: db_raw.create_driver(driver(zip_code), driver(zip_code).address),
+    "update_driver": lambda zip_code: db_raw.update_driver(1, driver(zip_code)),
+    "create_notice": lambda zip_code: db_raw.create_notice(
+        notice(zip_code), notice(zip_code).violation_zip, notice(zip_code).violation_address
+    ),
+    "update_notice": lambda zip_code: db_raw.update_notice("NTC0000001", notice(zip_code))
+}
+
+# Statements One Write Sends
+def round_trips(write, zip_code: str):
+    trace = tracing.Trace()
+    token = tracing._trace.set(trace)
+
+    try:
+        write(zip_code)
+    finally:
+        tracing._trace.reset(token)
+
+    return trace.statements
+
+# ZIP Set Hits and Misses So Far, Both Tables Together
+def lookups():
+    stats = (db_raw.reg_zip_codes.stats(), db_raw.violation_zip_codes.stats())
+    return sum(item["hits"] for item in stats), sum(item["misses"] for item in stats)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=10000, help="writes in the replayed mix")
+    parser.add_argument("--zips", type=int, default=200, help="distinct ZIP codes in the mix")
+    parser.add_argument("--rtt-ms", type=float, default=0.3, help="round trip time used for the latency estimate")
+    args = parser.parse_args()
+
+    db_raw._pool = ConnectionPool(FakeConnection, 1, 1.0, 3600.0, 3600.0)
+
+    # Per Write
+    print(f"{'write':15} {'known ZIP':>16} {'new ZIP':>16}")
+    print(f"{'':15} {'before':>8}{'now':>8} {'before':>8}{'now':>8}")
+
+    for name, write in WRITES.items():
+        db_raw.reg_zip_codes.load(["10001"])
+        db_raw.violation_zip_codes.load(["10001"])
+
+        known = round_trips(write, "10001")
+        new = round_trips(write, "99999")
+
+        # Before: the Same Statements Plus the SELECT 1 Existence Check
+        print(f"{name:15} {known + 1:8d}{known:8d} {new + 1:8d}{new:8d}")
+
+    # Replayed Mix – the Set Fills as New ZIPs Commit
+    random.seed(1)
+    db_raw.reg_zip_codes.load([])
+    db_raw.violation_zip_codes.load([])
+
+    zips = [f"{10000 + n:05d}" for n in range(args.zips)]
+    writes = list(WRITES.values())
+    statements = 0
+    counted = lookups()
+
+    for _ in range(args.writes):
+        statements += round_trips(random.choice(writes), random.choice(zips))
+
+    hits, misses = (after - before for after, before in zip(lookups(), counted))
+
+    print(
+        f"\n{args.writes} writes over {args.zips} ZIPs: {statements + args.writes} round trips before, "
+        f"{statements} now ({args.writes / (statements + args.writes):.0%} of them saved, "
+        f"~{args.writes * args.rtt_ms / 1000:.1f} s at {args.rtt_ms} ms each); "
+        f"the set answered {hits / (hits + misses):.1%} of ZIP lookups"
+    )
+
+if __name__ == "__main__":
+    main()
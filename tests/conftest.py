@@ -0,0 +1,85 @@
+# tests/conftest.py
+# Imports
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# db_raw Needs the MySQLdb Driver Importable (mysqlclient), Never a Server
+pytest.importorskip("MySQLdb")
+
+from app.database import db_raw
+from app.database.pool import ConnectionPool
+
+"""
+    Shared fakes for tests that run db_raw without a MySQL
+    server. A FakeConnection answers every statement through a
+    handler(query, args) returning (rows, rowcount) or
+    (rows, rowcount, lastrowid), and keeps
+    the statements it was sent in order.
+"""
+
+class FakeCursor:
+    def __init__(self, connection, *args):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self._rows = []
+
+    def execute(self, query, args=None):
+        self.connection.statements.append((" ".join(query.split()), args))
+        rows, self.rowcount, *lastrowid = self.connection.handler(query, args)
+        self.lastrowid = lastrowid[0] if lastrowid else None
+        self._rows = list(rows)
+        self.description = (("column",),) if self._rows else None
+        return self.rowcount
+
+    def executemany(self, query, args):
+        for item in args:
+            self.execute(query, item)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=1):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, handler):
+        self.handler = handler
+        self.statements = []
+
+    def cursor(self, *args):
+        return FakeCursor(self, *args)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def ping(self):
+        pass
+
+    def close(self):
+        pass
+
+# Point db_raw at a Pool of Fake Connections: fake_db(handler) -> connection
+@pytest.fixture
+def fake_db(monkeypatch):
+    def install(handler):
+        connection = FakeConnection(handler)
+        monkeypatch.setattr(db_raw, "_pool", ConnectionPool(lambda: connection, 2, 1.0, 3600.0, 3600.0))
+        return connection
+
+    yield install
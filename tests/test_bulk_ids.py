@@ -0,0 +1,121 @@
+# tests/test_bulk_ids.py
+# Imports
+import re
+from types import SimpleNamespace
+import MySQLdb
+import pytest
+from app.database import db_raw
+from conftest import FakeConnection
+
+"""
+    Bulk inserts link each driver and notice to the address
+    row inserted for it by the IDs the multi-row INSERT was
+    given. Those IDs are only derived from lastrowid after
+    reading the rows back, so a non-consecutive block (another
+    writer interleaving, or auto_increment_increment > 1) fails
+    the chunk instead of linking rows to the wrong addresses.
+"""
+
+# Columns Stored per Table, in INSERT Order
+COLUMNS = {
+    "reg_address": ("zip_code", "street", "house"),
+    "violation_address": ("zip_code", "street"),
+    "driver_details": (
+        "address_id", "licence_number", "state_issue", "last_name", "first_name",
+        "dob", "height_inches", "weight_pounds", "eyes_colour"
+    )
+}
+
+# A Table Store Handing Out the Given IDs to Each Multi-Row INSERT, in Turn
+def database(step: int, id_blocks):
+    tables = {name: {} for name in COLUMNS}
+    blocks = iter(id_blocks)
+
+    def handler(query, args):
+        query = " ".join(query.split())
+
+        if query == "SELECT @@SESSION.auto_increment_increment":
+            return [(step,)], 1
+
+        insert = re.match(r"INSERT INTO (\w+) \(", query)
+
+        if insert and insert.group(1) in tables:
+            table = insert.group(1)
+            width = len(COLUMNS[table])
+            rows = [tuple(args[n:n + width]) for n in range(0, len(args), width)]
+            ids = next(blocks)
+            tables[table].update(zip(ids, rows))
+            return [], len(rows), ids[0]
+
+        select = re.match(r"SELECT (.+) FROM (\w+) WHERE \w+ IN", query)
+
+        if select:
+            table = select.group(2)
+            picked = [COLUMNS[table].index(name) for name in select.group(1).split(", ")]
+            found = sorted(id for id in args if id in tables[table])
+            return [tuple(tables[table][id][n] for n in picked) for id in found], len(found)
+
+        return [], 0
+
+    return handler
+
+def drivers(count: int):
+    return [
+        SimpleNamespace(
+            address=SimpleNamespace(zip_code="10001", state="NY", city="New York", street=f"{n} Main St", house=str(n)),
+            licence_number=f"L{n:05d}", state_issue="NY", last_name="Doe", first_name="Jo",
+            dob="1990-01-01", height_inches=70, weight_pounds=160, eyes_colour="Brown"
+        )
+        for n in range(count)
+    ]
+
+@pytest.mark.parametrize("step, id_blocks, driver_ids", [
+    (1, [[11, 12, 13], [21, 22, 23]], [21, 22, 23]),
+    (2, [[11, 13, 15], [21, 23, 25]], [21, 23, 25])
+])
+def test_ids_follow_the_increment(step, id_blocks, driver_ids):
+    connection = FakeConnection(database(step, id_blocks))
+
+    assert db_raw._insert_drivers(connection.cursor(), drivers(3)) == driver_ids
+
+    # Each Driver Points at Its Own Address
+    inserted = next(args for query, args in connection.statements if query.startswith("INSERT INTO driver_details"))
+    assert inserted[0::9] == id_blocks[0]
+
+def test_interleaved_ids_fail_the_chunk():
+    # Another Writer Took 12 Mid-Insert, So the Addresses Got 11, 13, 14
+    connection = FakeConnection(database(1, [[11, 13, 14], [21, 22, 23]]))
+
+    with pytest.raises(MySQLdb.DatabaseError):
+        db_raw._insert_drivers(connection.cursor(), drivers(3))
+
+    assert not any(query.startswith("INSERT INTO driver_details") for query, _ in connection.statements)
+
+def notices(count: int):
+    return [
+        SimpleNamespace(
+            notice_id=f"NTC{n:05d}", car_id=n, violation_date_time="2025-01-01 08:00:00",
+            detachment="North", violation_severity="Low", notice_status="Active",
+            entry_date="2025-01-02", expiry_date="2025-04-02",
+            violation_description="Speeding",
+            violation_zip=SimpleNamespace(zip_code="10002", state="NY", city="New York", district="Manhattan"),
+            violation_address=SimpleNamespace(street=f"{n} Canal St")
+        )
+        for n in range(count)
+    ]
+
+def test_notice_addresses_follow_the_increment():
+    connection = FakeConnection(database(2, [[31, 33, 35]]))
+
+    db_raw._insert_notices(connection.cursor(), notices(3))
+
+    inserted = [args for query, args in connection.statements if query.startswith("INSERT INTO notice_info")]
+    assert [(args[0], args[2]) for args in inserted] == [("NTC00000", 31), ("NTC00001", 33), ("NTC00002", 35)]
+
+def test_interleaved_notice_addresses_fail_the_chunk():
+    connection = FakeConnection(database(1, [[31, 33, 34]]))
+
+    with pytest.raises(MySQLdb.DatabaseError):
+        db_raw._insert_notices(connection.cursor(), notices(3))
+
+    assert not any(query.startswith("INSERT INTO notice_info") for query, _ in connection.statements)
@@ -0,0 +1,63 @@
+# tests/test_db_async.py
+# Imports
+import asyncio
+import threading
+import httpx
+from app.database import db_async, db_raw
+from app.main import app
+
+"""
+    db_async runs every db_raw call on its own thread pool, so a
+    query held open must not stop other requests, including
+    ones that query the database themselves.
+"""
+
+# Seconds to Wait Before Calling a Request Stuck
+TIMEOUT = 5.0
+
+# Driver 1's Version Lookup Blocks Until Released; Any Other Driver Is Missing
+def held_lookup(release: threading.Event, started: threading.Event):
+    def fetch_driver_versions(driver_id: int):
+        if driver_id == 1:
+            started.set()
+            release.wait(TIMEOUT)
+
+        return None
+
+    return fetch_driver_versions
+
+def test_requests_move_while_one_query_is_held(monkeypatch):
+    release = threading.Event()
+    started = threading.Event()
+    monkeypatch.setattr(db_raw, "fetch_driver_versions", held_lookup(release, started))
+
+    async def scenario():
+        db_async.init_executor()
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            held = asyncio.create_task(client.get("/drivers/1"))
+
+            # Wait (Off the Loop) Until the Held Query Is Running
+            assert await asyncio.to_thread(started.wait, TIMEOUT)
+
+            # Other Requests Finish While It Is Still Held
+            for _ in range(5):
+                health = await asyncio.wait_for(client.get("/"), TIMEOUT)
+                assert health.status_code == 200
+
+                other = await asyncio.wait_for(client.get("/drivers/2"), TIMEOUT)
+                assert other.status_code == 404
+
+            assert not held.done()
+
+            # Released – the Held Request Completes Too
+            release.set()
+            response = await asyncio.wait_for(held, TIMEOUT)
+            assert response.status_code == 404
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        db_async.shutdown_executor()
@@ -0,0 +1,70 @@
+# tests/test_delete_driver.py
+# Imports
+import pytest
+from app.core import tracing
+from app.database import db_raw
+
+"""
+    delete_driver removes a driver with set-based statements, so
+    the number of round trips must not depend on how many cars
+    and notices the driver has. Statements are counted the way
+    the Server-Timing header counts them (the instrumented
+    cursor recording into the current trace).
+"""
+
+# Run a db_raw Call Under a Trace: (result, statements sent)
+def count_statements(func, *args):
+    trace = tracing.Trace()
+    token = tracing._trace.set(trace)
+
+    try:
+        result = func(*args)
+    finally:
+        tracing._trace.reset(token)
+
+    return result, trace.statements
+
+# A Driver With `cars` Cars and `notices` Notices on Each
+def driver_with(cars: int, notices: int):
+    def handler(query, args):
+        query = " ".join(query.split())
+
+        if query.startswith("SELECT address_id FROM driver_details"):
+            return [(10,)], 1
+
+        if query.startswith("DELETE notice_info") or query.startswith("DELETE actions"):
+            return [], cars * notices
+
+        if query.startswith("DELETE FROM car_details"):
+            return [], cars
+
+        return [], 1
+
+    return handler
+
+@pytest.mark.parametrize("cars, notices", [(1, 1), (10, 20), (200, 50)])
+def test_statement_count_is_constant(fake_db, cars, notices):
+    baseline = fake_db(driver_with(0, 0))
+    deleted, expected = count_statements(db_raw.delete_driver, 7)
+    assert deleted is True
+
+    connection = fake_db(driver_with(cars, notices))
+    deleted, statements = count_statements(db_raw.delete_driver, 7)
+    assert deleted is True
+
+    assert statements == expected == len(baseline.statements)
+    assert [query for query, _ in connection.statements] == [query for query, _ in baseline.statements]
+
+def test_registration_address_is_cleaned_up(fake_db):
+    connection = fake_db(driver_with(3, 3))
+    db_raw.delete_driver(7)
+
+    query, args = connection.statements[-1]
+    assert query.startswith("DELETE FROM reg_address")
+    assert args == (10, 10, 10)
+
+def test_missing_driver_stops_after_the_lookup(fake_db):
+    connection = fake_db(lambda query, args: ([], 0))
+
+    assert db_raw.delete_driver(7) is False
+    assert len(connection.statements) == 1
@@ -0,0 +1,80 @@
+# tests/test_etags.py
+# Imports
+import asyncio
+import httpx
+import pytest
+from datetime import date
+from app.core import config
+from app.database import db_raw
+from app.main import app
+
+"""
+    The versions behind GET /drivers/{id} and GET /notices/{id}
+    ETags are cached with the rows. A repeat GET and a 304 send
+    no statements to MySQL; a write to the driver or to its
+    notices drops the cached versions, so the next GET looks
+    them up again.
+"""
+
+DRIVER = (3, 1, "L1", "NY", "Doe", "John", date(1980, 1, 1), 70, 180, "Brown")
+
+def handler(query, args):
+    query = " ".join(query.split())
+
+    if query.startswith("SELECT row_version, notices_version"):
+        return [(3, 5)], 1
+
+    if query.startswith("SELECT row_version"):
+        return [DRIVER], 1
+
+    return [], 0
+
+@pytest.fixture
+def driver_db(fake_db, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_ENABLED", True)
+
+    for cache in (db_raw.driver_cache, db_raw.notice_cache, db_raw.version_cache):
+        cache.clear()
+
+    yield fake_db(handler)
+
+    for cache in (db_raw.driver_cache, db_raw.notice_cache, db_raw.version_cache):
+        cache.clear()
+
+def get(path, etag=None):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers={"If-None-Match": etag} if etag else {})
+
+    return asyncio.run(scenario())
+
+@pytest.mark.parametrize("path", ["/drivers/1", "/notices/1"])
+def test_repeat_get_and_304_skip_mysql(driver_db, path):
+    first = get(path)
+    assert first.status_code == 200
+    sent = len(driver_db.statements)
+
+    assert get(path).status_code == 200
+    assert get(path, first.headers["ETag"]).status_code == 304
+    assert len(driver_db.statements) == sent
+
+@pytest.mark.parametrize("changed", [db_raw._driver_changed, db_raw._notices_changed])
+def test_writes_drop_the_cached_versions(driver_db, changed):
+    assert db_raw.fetch_driver_versions(1) == (3, 5)
+    assert db_raw.fetch_driver_versions(1) == (3, 5)
+    assert len(driver_db.statements) == 1
+
+    changed(1)
+
+    assert db_raw.fetch_driver_versions(1) == (3, 5)
+    assert len(driver_db.statements) == 2
+
+def test_unknown_driver_is_not_cached(fake_db, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_ENABLED", True)
+    connection = fake_db(lambda query, args: ([], 0))
+
+    assert db_raw.fetch_driver_versions(9) is None
+    assert db_raw.fetch_driver_versions(9) is None
+    assert len(connection.statements) == 2
@@ -0,0 +1,139 @@
+# tests/test_exports.py
+# Imports
+import asyncio
+import tracemalloc
+from datetime import datetime, timedelta
+import pytest
+from app.api import exports
+from app.api.routers.exports import _export_body
+from app.database import db_async, db_raw
+
+"""
+    GET /exports/notices streams CSV and Parquet in constant
+    memory, and the body is a complete file. The
+    pooled connection it borrows goes back with the session's
+    own net_write_timeout, or is dropped if that cannot be
+    restored.
+"""
+
+# Peak May Grow This Much Between the Small and Large Runs (Allocator Noise)
+# Holding on to every chunk would grow it about tenfold
+TOLERANCE = 1.5
+
+CHUNK_SIZE = 1000
+
+"""CONNECTION"""
+
+def exporting(rows):
+    def handler(query, args):
+        query = " ".join(query.split())
+
+        if query == "SELECT @@SESSION.net_write_timeout":
+            return [(60,)], 1
+
+        if query.startswith("SET SESSION net_write_timeout"):
+            return [], 0
+
+        return rows, len(rows)
+
+    return handler
+
+def test_finished_export_restores_the_timeout(fake_db):
+    connection = fake_db(exporting([("N1",), ("N2",), ("N3",)]))
+
+    assert sum(len(chunk) for chunk in db_raw.stream_export("violations", 2)) == 3
+
+    timeouts = [args for query, args in connection.statements if query.startswith("SET SESSION net_write_timeout")]
+    assert timeouts[-1] == (60,)
+    assert db_raw.pool_stats()["idle"] == 1
+    assert db_raw.pool_stats()["discarded"] == 0
+
+def test_abandoned_export_drops_the_connection(fake_db):
+    fake_db(exporting([("N1",), ("N2",), ("N3",)]))
+
+    chunks = db_raw.stream_export("violations", 2)
+    next(chunks)
+    chunks.close()
+
+    assert db_raw.pool_stats()["idle"] == 0
+    assert db_raw.pool_stats()["discarded"] == 1
+
+"""MEMORY"""
+
+# Chunks Shaped Like the "violations" Dataset, Built Lazily
+def synthetic_rows(rows):
+    started = datetime(2025, 1, 1, 8, 30)
+
+    def stream_export(dataset, chunk_size, **filters):
+        for first in range(0, rows, chunk_size):
+            yield [
+                (
+                    f"NTC{index:09d}", started - timedelta(minutes=index),
+                    ("Low", "Medium", "High")[index % 3], "Active",
+                    "Failure to yield to a pedestrian at a marked crosswalk",
+                    index // 3, "Toyota", 2015 + index % 10, f"KX{index % 99999:05d}",
+                    index // 5, "Jordan", "Rivera", "Brooklyn"
+                )
+                for index in range(first, min(first + chunk_size, rows))
+            ]
+
+    return stream_export
+
+# Peak Allocations While the Route's Export Body Is Drained Into `sink`
+# Arrow's own buffers are not seen by tracemalloc, so they are sampled per chunk
+def export_peak(monkeypatch, format: str, rows: int, sink):
+    monkeypatch.setattr(db_raw, "stream_export", synthetic_rows(rows))
+    arrow = pytest.importorskip("pyarrow") if format == "parquet" else None
+
+    async def scenario():
+        encoder = exports.ENCODERS[format](db_raw.EXPORT_DATASETS["violations"]["columns"])
+        chunks = db_async.stream_export("violations", CHUNK_SIZE, 2)
+        sent = 0
+        arrow_peak = 0
+
+        tracemalloc.start()
+
+        async for data in _export_body(encoder, chunks):
+            sent += len(data)
+            sink.write(data)
+
+            if arrow is not None:
+                arrow_peak = max(arrow_peak, arrow.total_allocated_bytes())
+
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return sent, peak + arrow_peak
+
+    return asyncio.run(scenario())
+
+@pytest.mark.parametrize("format", ["csv", "parquet"])
+def test_export_memory_does_not_grow_with_rows(monkeypatch, tmp_path, format):
+    if format == "parquet":
+        pytest.importorskip("pyarrow")
+
+    db_async.init_executor()
+
+    try:
+        # The Small Run Is Long Enough to Fill the Read-Ahead Buffer
+        with open(tmp_path / "small", "wb") as sink:
+            small_sent, small_peak = export_peak(monkeypatch, format, CHUNK_SIZE * 20, sink)
+
+        with open(tmp_path / "large", "wb") as sink:
+            large_sent, large_peak = export_peak(monkeypatch, format, CHUNK_SIZE * 200, sink)
+    finally:
+        db_async.shutdown_executor()
+
+    assert large_sent > small_sent * 9
+    assert large_peak <= small_peak * TOLERANCE
+
+    # The Body Is a Complete File
+    if format == "parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+        table = pq.read_table(tmp_path / "large")
+
+        assert table.num_rows == CHUNK_SIZE * 200
+        assert table.schema.names == [name for name, _ in db_raw.EXPORT_DATASETS["violations"]["columns"]]
+    else:
+        with open(tmp_path / "large", encoding="utf-8") as body:
+            assert sum(1 for _ in body) == CHUNK_SIZE * 200 + 1
@@ -0,0 +1,48 @@
+# tests/test_metrics.py
+# Imports
+import asyncio
+import httpx
+from app.database import db_raw
+from app.main import app
+
+"""
+    GET /metrics exports running totals (cache and ZIP hits,
+    misses, evictions, pool checkouts) as counters ending in
+    _total, and point-in-time values (sizes, in-use) as gauges.
+"""
+
+def scrape():
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/metrics")
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 200
+
+    # Metric Name -> Declared Type
+    return dict(
+        line.split()[2:4] for line in response.text.splitlines() if line.startswith("# TYPE ")
+    )
+
+def test_totals_are_counters_and_levels_are_gauges(fake_db):
+    fake_db(lambda query, args: ([], 0))
+    db_raw.driver_cache.get(1)
+    db_raw.reg_zip_codes.known("00000")
+
+    types = scrape()
+
+    for name in (
+        "cache_hits_total", "cache_misses_total", "cache_evictions_total", "cache_invalidations_total",
+        "zip_codes_hits_total", "zip_codes_misses_total",
+        "db_pool_checkouts_total", "db_pool_timeouts_total", "db_pool_discarded_total",
+        "db_pool_checkout_seconds_total"
+    ):
+        assert types.get(name) == "counter", name
+
+    for name in ("cache_entries", "zip_codes_size", "db_pool_in_use", "db_pool_idle", "db_streams_open"):
+        assert types.get(name) == "gauge", name
+
+    # Every Counter Follows the _total Convention
+    assert [name for name, kind in types.items() if kind == "counter" and not name.endswith("_total")] == []
@@ -0,0 +1,133 @@
+# tests/test_notice_columns.py
+# Imports
+import pytest
+from app.database import db_raw
+from app.database.notice_columns import NoticeColumns
+
+"""
+    Deleting and editing notices keeps the /reports/hotspots
+    column cache incremental. A notice already in the copy is subtracted as
+    a tombstone; one not read yet (beyond last_seq, or a gap
+    still open) is skipped if a refresh that read it before the
+    delete appends it afterwards. A full rebuild tracks gaps, so
+    notices still in flight when it read are picked up later.
+"""
+
+# (notice_seq, district, hour of week, severity code)
+def fact(seq, district="Midtown", hour=10, severity=2):
+    return (seq, district, hour, severity)
+
+def total(columns):
+    return columns.hotspots("hour_of_week")["notices"]
+
+def test_delete_of_a_counted_notice_is_subtracted():
+    columns = NoticeColumns()
+    columns.append([fact(1), fact(2), fact(3, "Chelsea")])
+
+    columns.remove([fact(2), fact(3, "Chelsea")])
+    report = columns.hotspots("hour_of_week")
+
+    assert total(columns) == 1
+    assert {item["district"]: item["total"] for item in report["districts"]} == {"Midtown": 1, "Chelsea": 0}
+    assert columns.stats()["tombstones"] == 2
+
+def test_delete_before_the_row_is_appended_skips_it():
+    columns = NoticeColumns()
+    columns.append([fact(1)])
+
+    # A Refresh Read Seq 2 Before the Delete Committed, and Appends It After
+    columns.remove([fact(2)])
+    columns.append([fact(2), fact(3)])
+
+    assert total(columns) == 2
+    assert columns.stats()["tombstones"] == 0
+
+def test_delete_of_an_open_gap_closes_it():
+    columns = NoticeColumns()
+    columns.append([fact(1), fact(3)])
+    assert 2 in columns.gaps
+
+    columns.remove([fact(2)])
+    columns.append([fact(2)])
+    columns.refreshed()
+
+    assert total(columns) == 2
+    assert columns.gaps == {} and columns.deleted == set()
+
+def test_edit_of_a_counted_notice_swaps_its_facts():
+    columns = NoticeColumns()
+    columns.append([fact(1), fact(2)])
+
+    columns.move(fact(2), fact(2, "Chelsea", 11, 0))
+
+    assert total(columns) == 2
+    assert columns.hotspots("hour_of_week", "Low")["hotspots"] == [{"district": "Chelsea", "bucket": 11, "notices": 1}]
+
+def test_edit_before_the_row_is_appended_counts_the_new_facts():
+    columns = NoticeColumns()
+    columns.append([fact(1)])
+
+    # A Refresh Read Seq 2 Before the Edit Committed, and Appends It After
+    columns.move(fact(2), fact(2, "Chelsea"))
+    columns.append([fact(2)])
+    columns.refreshed()
+
+    assert total(columns) == 2
+    assert columns.stats()["tombstones"] == 0
+    assert columns.hotspots("hour_of_week")["hotspots"][1]["district"] == "Chelsea"
+    assert columns.moved == {}
+
+def test_delete_during_a_rebuild_marks_the_copy_stale():
+    columns = NoticeColumns()
+    columns.stale = False
+    columns.rebuilding = True
+
+    columns.remove([fact(1)])
+
+    assert columns.stale is True
+
+def test_rebuild_keeps_its_gaps():
+    columns = NoticeColumns()
+    fresh = NoticeColumns()
+    fresh.append([fact(1), fact(4)])
+
+    columns.replace(fresh)
+
+    assert sorted(columns.gaps) == [2, 3]
+
+def test_gaps_keep_the_newest_when_full(monkeypatch):
+    monkeypatch.setattr("app.database.notice_columns.MAX_GAPS", 3)
+    columns = NoticeColumns()
+
+    columns.append([fact(1), fact(7)])
+
+    assert sorted(columns.gaps) == [4, 5, 6]
+
+@pytest.fixture
+def facts_db(fake_db, monkeypatch):
+    columns = NoticeColumns()
+    columns.append([fact(5), fact(6)])
+    columns.stale = False
+    monkeypatch.setattr(db_raw, "notice_facts", columns)
+
+    def handler(query, args):
+        query = " ".join(query.split())
+
+        if query.startswith("SELECT address_id FROM driver_details"):
+            return [(10,)], 1
+
+        if query.startswith("SELECT notice_info.notice_seq"):
+            return [(*fact(5), 7)] if "notice_id" in query else [fact(5), fact(6)], 1
+
+        return [], 1
+
+    fake_db(handler)
+    return columns
+
+@pytest.mark.parametrize("delete, key", [(db_raw.delete_notice, "N5"), (db_raw.delete_driver, 7)])
+def test_deletes_keep_the_cache_incremental(facts_db, delete, key):
+    expected = 1 if delete is db_raw.delete_notice else 0
+
+    assert delete(key) is True
+    assert facts_db.stale is False
+    assert total(facts_db) == expected
@@ -0,0 +1,66 @@
+# tests/test_notice_plans.py
+# Imports
+import MySQLdb
+import MySQLdb.cursors
+import pytest
+from app.database import db_raw
+
+"""
+    EXPLAINs the driver notice listing against the configured
+    MySQL database (skipped when none is reachable). notice_info
+    must be read through idx_notice_car_time or
+    idx_notice_car_filters, never scanned and sorted on its own.
+    The final merge of a driver's cars into one newest-first
+    page is a sort of the joined rows and shows on the
+    car_details row, not on notice_info.
+"""
+
+NOTICE_INDEXES = ("idx_notice_car_time", "idx_notice_car_filters")
+
+@pytest.fixture(scope="module")
+def live_cursor():
+    try:
+        conn = db_raw.open_connection()
+    except MySQLdb.OperationalError as error:
+        pytest.skip(f"no MySQL server: {error}")
+
+    cursor = conn.cursor(MySQLdb.cursors.DictCursor)
+    yield cursor
+
+    cursor.close()
+    conn.close()
+
+@pytest.fixture(scope="module")
+def driver_id(live_cursor):
+    live_cursor.execute("SELECT driver_id FROM car_details LIMIT 1")
+    row = live_cursor.fetchone()
+
+    if row is None:
+        pytest.skip("no cars in the database")
+
+    return row["driver_id"]
+
+# EXPLAIN Row for notice_info
+def notice_plan(cursor, *args):
+    query, params = db_raw._driver_notices_query(*args)
+    cursor.execute("EXPLAIN " + query, params)
+
+    return next(row for row in cursor.fetchall() if row["table"] == "notice_info")
+
+@pytest.mark.parametrize("severity, status, date_from, date_to", [
+    (None, None, None, None),
+    (None, None, "2024-01-01", "2025-01-01"),
+    ("High", None, None, None),
+    ("High", "Active", None, None)
+])
+def test_listing_uses_the_notice_indexes(live_cursor, driver_id, severity, status, date_from, date_to):
+    plan = notice_plan(live_cursor, driver_id, severity, status, date_from, date_to, None, 50)
+
+    assert plan["key"] in NOTICE_INDEXES
+    assert "Using filesort" not in (plan["Extra"] or "")
+
+def test_next_page_uses_the_notice_indexes(live_cursor, driver_id):
+    plan = notice_plan(live_cursor, driver_id, "High", "Active", None, None, ("2025-01-01 00:00:00", "N1"), 50)
+
+    assert plan["key"] in NOTICE_INDEXES
+    assert "Using filesort" not in (plan["Extra"] or "")
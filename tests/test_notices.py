@@ -0,0 +1,28 @@
+# tests/test_notices.py
+# Imports
+import asyncio
+import httpx
+from app.database import db_raw
+from app.main import app
+
+"""
+    GET /notices/{driver_id} answers 404 for a driver that does
+    not exist, without running the notice query.
+"""
+
+def test_unknown_driver_is_404(monkeypatch):
+    queried = []
+    monkeypatch.setattr(db_raw, "fetch_driver_versions", lambda driver_id: None)
+    monkeypatch.setattr(db_raw, "fetch_driver_notices", lambda *args, **kwargs: queried.append(args) or [])
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/notices/2")
+
+    response = asyncio.run(scenario())
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Driver ID Not Found"}
+    assert queried == []
@@ -0,0 +1,99 @@
+# tests/test_outbox.py
+# Imports
+import asyncio
+from app.core import config
+from app.core.metrics import notification_batches, notifications_parked
+from app.core.notifications import StubSender
+from datetime import date, datetime
+from app.database import db_raw, outbox
+from app.schemas.notices import NoticeCreate, NoticePatch
+
+"""
+    A batch the sender keeps rejecting is not retried forever:
+    each given-up batch counts an attempt against its notices
+    in the database, and notices that run out of attempts are
+    parked, counted and no longer read by the poller.
+
+    notification_sent belongs to the outbox: a client sending
+    it on create or PATCH is ignored, so every new notice is
+    read by the poller.
+"""
+
+BATCH = [{"notice_id": "N1"}, {"notice_id": "N2"}]
+
+# Deliver One Batch Through _deliver and Stop
+def deliver(sender, batch):
+    async def scenario():
+        queue = asyncio.Queue()
+        await queue.put(batch)
+        task = asyncio.create_task(outbox._deliver(queue, sender))
+        await queue.join()
+        task.cancel()
+
+    asyncio.run(scenario())
+
+def test_failed_batch_records_attempts_and_parks(monkeypatch):
+    monkeypatch.setattr(config, "NOTIFICATION_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(config, "NOTIFICATION_RETRY_SECONDS", 0.0)
+    monkeypatch.setattr(config, "NOTIFICATION_PARK_AFTER", 3)
+
+    recorded = []
+
+    async def record(notice_ids, park_after):
+        recorded.append((notice_ids, park_after))
+        return ["N2"]
+
+    async def mark(notice_ids):
+        raise AssertionError("a failed batch must not be marked sent")
+
+    monkeypatch.setattr(outbox, "record_notification_failures", record)
+    monkeypatch.setattr(outbox, "mark_notifications_sent", mark)
+
+    sender = StubSender()
+    sender.fail_next = 2
+    failed = notification_batches.value(("failed",))
+    parked = notifications_parked.value()
+
+    deliver(sender, BATCH)
+
+    assert recorded == [(["N1", "N2"], 3)]
+    assert notification_batches.value(("failed",)) == failed + 1
+    assert notifications_parked.value() == parked + 1
+    assert outbox._in_flight == set()
+
+def test_record_failures_parks_in_one_update(fake_db):
+    connection = fake_db(lambda query, args: ([("N2",)], 1) if query.lstrip().startswith("SELECT") else ([], 2))
+
+    assert db_raw.record_notification_failures(["N1", "N2"], 5) == ["N2"]
+
+    update, select = connection.statements
+    assert update[0].startswith("UPDATE notice_info SET notification_attempts = notification_attempts + 1")
+    assert update[1] == [5, "N1", "N2"]
+    assert "notification_parked = TRUE" in select[0]
+
+def test_parked_notices_are_not_polled(fake_db):
+    connection = fake_db(lambda query, args: ([], 0))
+
+    db_raw.fetch_unsent_notices(10)
+
+    assert "notice_info.notification_parked = FALSE" in connection.statements[0][0]
+
+def test_clients_cannot_mark_a_notice_sent(fake_db):
+    connection = fake_db(lambda query, args: ([(7,)], 1, 1))
+    db_raw.violation_zip_codes.add("10001")
+
+    notice = NoticeCreate(
+        notice_id="N1", car_id=1, violation_date_time=datetime(2025, 1, 1, 8),
+        detachment="North", violation_severity="Low", notice_status="Active",
+        notification_sent=True, entry_date=date(2025, 1, 2), expiry_date=date(2025, 4, 2),
+        violation_description="Speeding",
+        violation_zip={"zip_code": "10001", "state": "NY", "city": "New York", "district": "Midtown"},
+        violation_address={"street": "Canal St"}
+    )
+    db_raw.create_notice(notice, notice.violation_zip, notice.violation_address)
+
+    query, args = next(statement for statement in connection.statements if statement[0].startswith("INSERT INTO notice_info"))
+    assert "%s, FALSE, %s" in query
+    assert len(args) == query.count("%s") == 10
+
+    assert not hasattr(NoticePatch(notification_sent=True), "notification_sent")
@@ -0,0 +1,31 @@
+# tests/test_search.py
+# Imports
+import pytest
+from app.database import db_raw
+
+"""
+    Notice and driver searches build the same BOOLEAN MODE terms
+    (every word required, matched as a prefix, stopwords
+    dropped), and a query with no searchable word left returns
+    an empty page without a round trip.
+"""
+
+SEARCHES = [db_raw.search_notices, db_raw.search_drivers]
+
+@pytest.mark.parametrize("search", SEARCHES)
+@pytest.mark.parametrize("text", ["", "  ", "?!", "the", "on the"])
+def test_empty_or_stopword_terms_skip_mysql(fake_db, search, text):
+    connection = fake_db(lambda query, args: ([], 0))
+
+    assert search(text, 0, 20) == []
+    assert connection.statements == []
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_both_searches_use_boolean_prefix_terms(fake_db, search):
+    connection = fake_db(lambda query, args: ([], 0))
+
+    search("Parked on the Hydrant", 0, 20)
+
+    (query, args), = connection.statements
+    assert query.count("IN BOOLEAN MODE") == 2
+    assert args[:2] == ("+parked* +hydrant*", "+parked* +hydrant*")
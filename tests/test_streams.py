@@ -0,0 +1,91 @@
+# tests/test_streams.py
+# Imports
+import asyncio
+import threading
+import httpx
+import pytest
+from app.api.routers import drivers
+from app.core import config
+from app.database import db_async, db_raw
+from app.main import app
+
+"""
+    Streams (GET /drivers?format=ndjson, GET /exports/notices)
+    each hold a pooled connection while their client reads, so
+    only DB_MAX_STREAMS may be open at once; the next one is
+    turned away with a 503 before it touches the pool.
+"""
+
+TIMEOUT = 5.0
+
+# Drivers Streamed One Chunk at a Time; Each Chunk Waits for `release`
+def held_stream(release: threading.Event):
+    def stream_drivers(after: int, chunk_size: int):
+        for driver_id in range(after + 1, after + 3):
+            release.wait(TIMEOUT)
+            yield [(driver_id, "NY", "Doe", "Jo")]
+
+    return stream_drivers
+
+@pytest.fixture
+def officer(monkeypatch):
+    monkeypatch.setattr(drivers, "verify_officer_token", lambda token: {"role": "officer"})
+    return {"Authorization": "Bearer officer"}
+
+def test_ndjson_listing_needs_a_token():
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/drivers?format=ndjson")
+
+    assert asyncio.run(scenario()).status_code == 401
+
+def test_streams_beyond_the_limit_get_503(monkeypatch, officer):
+    release = threading.Event()
+    monkeypatch.setattr(db_raw, "stream_drivers", held_stream(release))
+    monkeypatch.setattr(config, "DB_MAX_STREAMS", 2)
+
+    async def scenario():
+        db_async.init_executor()
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            open_streams = [
+                asyncio.create_task(client.get("/drivers?format=ndjson", headers=officer))
+                for _ in range(2)
+            ]
+
+            # Both Slots Taken While Their First Chunks Are Held
+            while db_async.stream_stats()["open"] < 2:
+                await asyncio.sleep(0.01)
+
+            refused = await asyncio.wait_for(client.get("/drivers?format=ndjson", headers=officer), TIMEOUT)
+            assert refused.status_code == 503
+
+            # Finished Streams Give Their Slots Back
+            release.set()
+            responses = await asyncio.wait_for(asyncio.gather(*open_streams), TIMEOUT)
+            assert [response.text.count("\n") for response in responses] == [2, 2]
+            assert db_async.stream_stats()["open"] == 0
+
+            accepted = await asyncio.wait_for(client.get("/drivers?format=ndjson", headers=officer), TIMEOUT)
+            assert accepted.status_code == 200
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        db_async.shutdown_executor()
+
+def test_unstarted_stream_gives_its_slot_back(monkeypatch):
+    monkeypatch.setattr(config, "DB_MAX_STREAMS", 1)
+
+    chunks = db_async.stream_drivers(0, 10)
+    assert db_async.stream_stats()["open"] == 1
+
+    with pytest.raises(db_async.StreamsBusy):
+        db_async.stream_drivers(0, 10)
+
+    del chunks
+    assert db_async.stream_stats()["open"] == 0
@@ -0,0 +1,79 @@
+# tests/test_update_driver.py
+# Imports
+import pytest
+from app.core import config
+from app.database import db_raw
+from app.schemas.drivers import AddressCreate, DriverPatch
+
+"""
+    A PATCH builds its response from the cached row only when
+    that row is the version the UPDATE replaced. If another
+    process wrote the driver in between, the row is re-read
+    inside the transaction instead of merging onto stale data.
+    The version is taken from the UPDATE itself, before the
+    out-of-state recount that follows an address change runs
+    statements of its own.
+"""
+
+CACHED = {
+    "driver_id": 1, "licence_number": "L1", "state_issue": "NY", "last_name": "Doe",
+    "first_name": "John", "dob": None, "height_inches": 70, "weight_pounds": 180, "eyes_colour": "Brown"
+}
+STORED = {**CACHED, "licence_number": "L2", "first_name": "Jane"}
+
+# UPDATE Reports `written` as the New Version; SELECT Answers With the Stored Row
+def driver_at(written: int):
+    def handler(query, args):
+        query = " ".join(query.split())
+
+        if query.startswith("UPDATE driver_details"):
+            return [], 1, written
+
+        if query.startswith("SELECT"):
+            return [tuple(STORED.values())], 1
+
+        # Out-of-State Recount After an Address Change
+        if query.startswith("DELETE FROM out_of_state_summary"):
+            return [], 1, 0
+
+        if query.startswith("INSERT INTO out_of_state_summary"):
+            return [], 1, 0
+
+        raise AssertionError(f"unexpected statement: {query}")
+
+    return handler
+
+@pytest.fixture
+def cached_driver(monkeypatch):
+    monkeypatch.setattr(config, "CACHE_ENABLED", True)
+    db_raw.driver_cache.set(1, (4, dict(CACHED)), 1, db_raw.driver_cache.version())
+    yield
+    db_raw.driver_cache.clear()
+
+def test_current_cached_row_skips_the_re_read(fake_db, cached_driver):
+    connection = fake_db(driver_at(5))
+
+    row = db_raw.patch_driver(1, DriverPatch(first_name="Jim"))
+
+    assert row == {**CACHED, "first_name": "Jim"}
+    assert [query for query, _ in connection.statements if query.startswith("SELECT")] == []
+
+def test_stale_cached_row_is_re_read(fake_db, cached_driver):
+    connection = fake_db(driver_at(7))
+
+    row = db_raw.patch_driver(1, DriverPatch(first_name="Jane"))
+
+    assert row == STORED
+    assert any(query.startswith("SELECT") for query, _ in connection.statements)
+    assert db_raw.driver_cache.get(1) is db_raw.MISSING
+
+def test_address_patch_keeps_the_update_version(fake_db, cached_driver):
+    db_raw.reg_zip_codes.add("10001")
+    connection = fake_db(driver_at(5))
+    address = AddressCreate(zip_code="10001", state="NY", city="New York", street="Fifth Avenue", house="1")
+
+    row = db_raw.patch_driver(1, DriverPatch(address=address, first_name="Jim"))
+
+    assert row == {**CACHED, "first_name": "Jim"}
+    assert any(query.startswith("DELETE FROM out_of_state_summary") for query, _ in connection.statements)
+    assert [query for query, _ in connection.statements if query.startswith("SELECT")] == []
@@ -0,0 +1,116 @@
+# tests/test_update_notice.py
+# Imports
+import pytest
+from datetime import date, datetime
+from app.core import config
+from app.database import db_raw
+from app.database.notice_columns import NoticeColumns
+from app.schemas.notices import NoticeCreate, NoticePatch, ViolationAddress, ViolationZipCode
+
+"""
+    Editing a notice's violation ZIP, hour of week or severity
+    moves it in the /reports/hotspots column cache in place: its
+    old facts become a tombstone and its new ones are added,
+    with no rebuild. Status changes, car moves and a PUT that
+    rewrites the same facts leave the cache alone.
+
+    A write is one locking read, the UPDATE and the ETag bump;
+    the report summaries are only touched when the notice moves
+    between their rows.
+"""
+
+WHEN = datetime(2025, 1, 6, 14, 30)
+STORED = (
+    "N1", WHEN, "NYD-01", "High", "Active", 0,
+    date(2025, 1, 6), date(2025, 4, 6), "Parked on a hydrant"
+)
+
+DISTRICTS = {"10001": "Midtown", "10002": "Chelsea"}
+
+# The Locking Read Answers (notice..., notice_seq, zip_code, its district,
+# district of the new ZIP, owner, owner of the new car)
+def handler(query, args):
+    query = " ".join(query.split())
+
+    if query.startswith("SELECT") and "FOR UPDATE" in query:
+        return [(*STORED, 1, "10001", "Midtown", DISTRICTS.get(args[0]), 1, {1: 1, 2: 2}.get(args[1]))], 1
+
+    if query.startswith("SELECT"):
+        return [(*STORED, 1)], 1
+
+    return [], 1
+
+def put(**changes):
+    values = {
+        "notice_id": "N1", "violation_date_time": WHEN, "detachment": "NYD-01",
+        "violation_severity": "High", "notice_status": "Active",
+        "entry_date": date(2025, 1, 6), "expiry_date": date(2025, 4, 6),
+        "violation_description": "Parked on a hydrant", "car_id": 1,
+        "violation_zip": ViolationZipCode(zip_code="10001", state="NY", city="New York", district="Midtown"),
+        "violation_address": ViolationAddress(street="Fifth Avenue")
+    }
+
+    return NoticeCreate(**{**values, **changes})
+
+# Column Cache Holding Seq 1: Midtown, Monday 14:00 (Hour of Week 38), High
+@pytest.fixture
+def columns(monkeypatch):
+    columns = NoticeColumns()
+    columns.append([(1, "Midtown", 38, 2)])
+    columns.stale = False
+    monkeypatch.setattr(db_raw, "notice_facts", columns)
+    return columns
+
+@pytest.fixture
+def fresh_facts(fake_db, columns, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_ENABLED", False)
+    db_raw.violation_zip_codes.add("10001")
+    db_raw.violation_zip_codes.add("10002")
+    return fake_db(handler)
+
+@pytest.mark.parametrize("update, payload", [
+    (db_raw.patch_notice, NoticePatch(notice_status="Resolved")),
+    (db_raw.patch_notice, NoticePatch(car_id=2)),
+    (db_raw.patch_notice, NoticePatch(violation_date_time=WHEN.replace(minute=5))),
+    (db_raw.update_notice, put(notice_status="Resolved"))
+])
+def test_edits_that_keep_the_facts_keep_the_cache(fresh_facts, columns, update, payload):
+    assert update("N1", payload) is not None
+    assert columns.stale is False
+    assert columns.stats()["tombstones"] == 0
+
+@pytest.mark.parametrize("update, payload, district, bucket, severity", [
+    (db_raw.patch_notice, NoticePatch(violation_severity="Low"), "Midtown", 38, "Low"),
+    (db_raw.patch_notice, NoticePatch(violation_date_time=WHEN.replace(hour=9)), "Midtown", 33, "High"),
+    (db_raw.patch_notice, NoticePatch(
+        violation_zip=ViolationZipCode(zip_code="10002", state="NY", city="New York", district="Chelsea")
+    ), "Chelsea", 38, "High"),
+    (db_raw.update_notice, put(violation_date_time=WHEN.replace(day=7)), "Midtown", 62, "High")
+])
+def test_edits_that_move_the_notice_move_its_counts(fresh_facts, columns, update, payload, district, bucket, severity):
+    assert update("N1", payload) is not None
+    report = columns.hotspots("hour_of_week", severity)
+
+    assert columns.stale is False
+    assert report["notices"] == 1
+    assert report["hotspots"] == [{"district": district, "bucket": bucket, "notices": 1}]
+
+@pytest.mark.parametrize("update, payload, statements", [
+    (db_raw.patch_notice, NoticePatch(violation_description="Blocking a driveway"), 3),
+    (db_raw.update_notice, put(), 3),
+    (db_raw.patch_notice, NoticePatch(notice_status="Resolved"), 7),
+    (db_raw.patch_notice, NoticePatch(car_id=2), 7),
+    (db_raw.update_notice, put(violation_date_time=WHEN.replace(month=2)), 7)
+])
+def test_statement_count(fresh_facts, update, payload, statements):
+    assert update("N1", payload) is not None
+    assert len(fresh_facts.statements) == statements
+
+def test_patch_answers_from_the_locking_read(fresh_facts):
+    row = db_raw.patch_notice("N1", NoticePatch(notice_status="Resolved"))
+
+    assert row["notice_status"] == "Resolved"
+    assert row["violation_description"] == "Parked on a hydrant"
+    assert [query for query, _ in fresh_facts.statements if query.startswith("SELECT")] == [
+        fresh_facts.statements[0][0]
+    ]